@@ -0,0 +1,208 @@
+import html
+import logging
+import re
+import time
+
+import LogColumns
+import LogFields
+import myUtils
+import TextDecoding
+
+logger = logging.getLogger("SRWAnalyzer")
+
+# "stream" uses the extractor in this module, "bs4" builds a BeautifulSoup tree
+# the way the analyzer always has.  Set ``html_log_engine`` in config.json to
+# switch back if a log ever parses differently.
+ENGINES = ("stream", "bs4")
+DEFAULT_ENGINE = "stream"
+
+# The inside of a tag, where a quoted attribute value may contain '>'.  A
+# quote that is never closed falls back to ending the tag at the first '>'.
+_TAG_BODY = r'''(?:[^>"']|"[^"<]*"|'[^'<]*')*>|[^>]*>'''
+
+LOG_ENTRIES_ANCHOR = re.compile(r'<a\b[^>]*\bname\s*=\s*["\']?LogEntries\b', re.IGNORECASE)
+TABLE_START = re.compile(rf'<table\b(?:{_TAG_BODY})', re.IGNORECASE)
+TABLE_END = re.compile(r'</table\s*>', re.IGNORECASE)
+ROW_START = re.compile(r'<tr\b', re.IGNORECASE)
+CELL_START = re.compile(rf'<td\b(?:{_TAG_BODY})', re.IGNORECASE)
+CELL_END = re.compile(r'</td\s*>', re.IGNORECASE)
+TAG = re.compile(rf'<(?:{_TAG_BODY})')
+
+# Bytes of unmatched text kept between chunks while looking for the anchor or
+# table tag, enough to hold a tag that was split across two reads.
+_CARRY_OVER = 256
+
+
+def get_engine(engine=None):
+    """Resolve which HTML extractor to use, defaulting to config.json."""
+    if engine is None:
+        engine = myUtils.get_config_value("html_log_engine", DEFAULT_ENGINE)
+    if engine not in ENGINES:
+        logger.warning(f"Unknown html_log_engine '{engine}'. Using '{DEFAULT_ENGINE}'.")
+        engine = DEFAULT_ENGINE
+    return engine
+
+
+def cell_text(cell_html: str):
+    """Return the visible text of a table cell, like BeautifulSoup's ``.text``."""
+    end = CELL_END.search(cell_html)
+    if end:
+        cell_html = cell_html[:end.start()]
+    if '<' in cell_html:
+        cell_html = TAG.sub('', cell_html)
+    if '&' in cell_html:
+        cell_html = html.unescape(cell_html)
+    return cell_html.strip()
+
+
+def row_cells(row_html: str):
+    """Split the markup of one ``<tr>`` into the text of its ``<td>`` cells."""
+    return [cell_text(cell) for cell in CELL_START.split(row_html)[1:]]
+
+
+def iter_log_rows(chunks, in_table=False):
+    """Yield the cell texts of every row in the ``LogEntries`` table.
+
+    ``chunks`` is any iterable of decoded text.  Only the part of the document
+    still being scanned is buffered: text before the ``LogEntries`` anchor is
+    dropped as soon as it has been searched and each row is emitted once the
+    start of the next row (or the end of the table) has been read.  The header
+    row is skipped, matching ``find_all('tr')[1:]`` in the BeautifulSoup path.
+
+    With ``in_table`` the text is taken to start part way through the table
+    body, as the chunks from ``LogChunks.plan_chunks`` do, so every row is
+    yielded and there is no anchor or header to look for.
+    """
+    buffer = ''
+    state = 'rows' if in_table else 'anchor'
+    header_skipped = in_table
+
+    for chunk in chunks:
+        buffer += chunk
+
+        if state == 'anchor':
+            match = LOG_ENTRIES_ANCHOR.search(buffer)
+            if not match:
+                buffer = buffer[-_CARRY_OVER:]
+                continue
+            buffer = buffer[match.end():]
+            state = 'table'
+
+        if state == 'table':
+            match = TABLE_START.search(buffer)
+            if not match:
+                buffer = buffer[-_CARRY_OVER:]
+                continue
+            buffer = buffer[match.end():]
+            state = 'rows'
+
+        if state == 'rows':
+            table_end = TABLE_END.search(buffer)
+            limit = table_end.start() if table_end else len(buffer)
+            starts = [m.start() for m in ROW_START.finditer(buffer, 0, limit)]
+            if table_end:
+                starts.append(limit)
+
+            for row_start, row_end in zip(starts, starts[1:]):
+                if not header_skipped:
+                    header_skipped = True
+                    continue
+                yield row_cells(buffer[row_start:row_end])
+
+            if table_end:
+                return
+
+            # Keep the row that is still being read
+            buffer = buffer[starts[-1]:] if starts else buffer[-_CARRY_OVER:]
+
+    if state == 'rows' and buffer:
+        # The document ended without closing the table
+        starts = [m.start() for m in ROW_START.finditer(buffer)]
+        if starts and header_skipped:
+            yield row_cells(buffer[starts[0]:])
+
+
+def iter_rows(source, file_name, encoding=None, in_table=False):
+    """Stream the ``LogEntries`` table of an APS HTML log as ``COLUMNS`` tuples.
+
+    Produces the same entries as ``ApsLogs.extract_log_entries`` without
+    building a document tree, so rows are available as soon as they have been
+    read and memory use does not depend on the size of the log.  ``source``
+    is a path or binary file object; ``encoding`` and ``in_table`` are used
+    when parsing one chunk of a split file.
+    """
+    found = False
+    for cells in iter_log_rows(TextDecoding.iter_text_chunks(source, encoding=encoding), in_table):
+        found = True
+        if len(cells) <= 3:
+            continue
+
+        user, server, process, pid, session, description = LogFields.split_description(cells[3])
+        yield (cells[0], cells[1], cells[2], user, server, process, pid, session, description, file_name)
+
+    if not found:
+        logger.error(f"Warning: No log entries found in {file_name}. This file may not contain log entries.")
+
+
+def iter_log_entries(source, file_name, encoding=None, in_table=False):
+    """Like ``iter_rows`` but yields entry dicts."""
+    for row in iter_rows(source, file_name, encoding, in_table):
+        yield dict(zip(LogColumns.COLUMNS, row))
+
+
+def compare_with_bs4(file_path):
+    """Parse ``file_path`` with both engines and report where they disagree.
+
+    Returns a dict with the row counts, the time each engine took and a list
+    of ``(index, stream_entry, bs4_entry)`` tuples for rows that differ.
+    """
+    import os
+    import ApsLogs
+
+    file_name = os.path.basename(file_path)
+
+    start = time.perf_counter()
+    expected = ApsLogs.extract_log_entries(file_name, ApsLogs.load_log_file(file_path))
+    bs4_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    actual = list(iter_log_entries(file_path, file_name))
+    stream_seconds = time.perf_counter() - start
+
+    mismatches = []
+    for i in range(max(len(actual), len(expected))):
+        stream_entry = actual[i] if i < len(actual) else None
+        bs4_entry = expected[i] if i < len(expected) else None
+        if stream_entry != bs4_entry:
+            mismatches.append((i, stream_entry, bs4_entry))
+
+    return {
+        'stream_rows': len(actual),
+        'bs4_rows': len(expected),
+        'stream_seconds': stream_seconds,
+        'bs4_seconds': bs4_seconds,
+        'mismatches': mismatches
+    }
+
+
+# Parity check: compare the streaming extractor against BeautifulSoup
+def main():
+    file_path = myUtils.select_file("APS HTML Log", "*.html")
+    if not file_path:
+        return
+
+    result = compare_with_bs4(file_path)
+    print(f"bs4:    {result['bs4_rows']} rows in {result['bs4_seconds']:.3f}s")
+    print(f"stream: {result['stream_rows']} rows in {result['stream_seconds']:.3f}s")
+    if result['stream_seconds']:
+        print(f"Speedup: {result['bs4_seconds'] / result['stream_seconds']:.1f}x")
+
+    if result['mismatches']:
+        print(f"\n{len(result['mismatches'])} rows differ:")
+        for index, stream_entry, bs4_entry in result['mismatches'][:20]:
+            print(f"  Row {index}:\n    stream: {stream_entry}\n    bs4:    {bs4_entry}")
+    else:
+        print("\nBoth engines produced identical entries.")
+
+if __name__ == "__main__":
+    main()
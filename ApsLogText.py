@@ -0,0 +1,53 @@
+import re
+
+import LogColumns
+import LogFields
+import TextDecoding
+
+BASIC_LOG_PATTERN = re.compile(
+    r'<!--\s*SituationID=(?P<SituationID>\d+)\s*-->\s*'
+    r'(?P<Date>\d{4}-\d{2}-\d{2})\s+'
+    r'(?P<Time>\d{2}:\d{2}:\d{2}\.\d{3})\s*'
+    r'(?P<Description>.+)'
+)
+
+
+def parse_row(line: str, line_number: int, file_name: str):
+    """Turn a single ``aps_*.log`` line into a ``LogColumns.COLUMNS`` tuple.
+
+    Returns ``None`` for lines that are not log entries (headers, blank lines
+    and continuation text).
+    """
+    basic_log = BASIC_LOG_PATTERN.match(line)
+    if not basic_log:
+        return None
+
+    user, server, process, pid, session, description = LogFields.split_description(basic_log.group('Description').strip())
+
+    return (line_number, basic_log.group('Date').strip(), basic_log.group('Time').strip(),
+            user, server, process, pid, session, description, file_name)
+
+
+def parse_line(line: str, line_number: int, file_name: str):
+    """Turn a single ``aps_*.log`` line into a log entry dict, or ``None``."""
+    row = parse_row(line, line_number, file_name)
+    return dict(zip(LogColumns.COLUMNS, row)) if row else None
+
+
+def iter_rows(source, file_name, encoding=None):
+    """Parse a plain-text APS log lazily, yielding ``COLUMNS`` tuples.
+
+    ``Line`` is the zero based index of the line in ``source`` (a path or
+    binary file object), the same numbering ``ApsLog`` has always used for
+    ``.log`` files.
+    """
+    for i, line in enumerate(TextDecoding.iter_lines(source, encoding=encoding)):
+        row = parse_row(line, i, file_name)
+        if row is not None:
+            yield row
+
+
+def iter_log_entries(source, file_name, encoding=None):
+    """Like ``iter_rows`` but yields entry dicts."""
+    for row in iter_rows(source, file_name, encoding):
+        yield dict(zip(LogColumns.COLUMNS, row))
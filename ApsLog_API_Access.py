@@ -1,6 +1,5 @@
 from flask import Flask, request, jsonify
 from flask_cors import CORS
-import zipfile
 import os
 
 # Import existing functions
@@ -23,15 +22,10 @@ def upload_file():
     file_path = os.path.join(UPLOAD_FOLDER, file.filename)
     file.save(file_path)
 
-    # Extract ZIP contents
-    extract_path = os.path.join(UPLOAD_FOLDER, os.path.splitext(file.filename)[0])
-    with zipfile.ZipFile(file_path, 'r') as zip_ref:
-        zip_ref.extractall(extract_path)
-
-    # Process extracted files using existing functions
-    system_info = get_basic_info(extract_path)
-    logs = log_info(extract_path)
-    licenses = check_licenses(extract_path)
+    # Process the ZIP in place; its members are read without extracting them
+    system_info = get_basic_info(file_path)
+    logs = log_info(file_path)
+    licenses = check_licenses(file_path)
 
     return jsonify({
         "system_info": system_info,
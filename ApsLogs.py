@@ -1,4 +1,8 @@
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
 import logging
+import multiprocessing
+import multiprocessing.spawn
+import sys
 from tkinter import messagebox
 import zipfile
 from bs4 import BeautifulSoup
@@ -10,7 +14,14 @@ import requests
 from datetime import datetime as dt
 import json
 import re
-import chardet
+import ApsLogHtml
+import ApsLogText
+import BundleReader
+import ExtractionCache
+import LogChunks
+import LogColumns
+import LogFields
+import TextDecoding
 CONFIG_FILE_PATH = "config.json"
 DEFAULT_LOG_FILE = "app.log"
 
@@ -41,77 +52,49 @@ def setup_logger():
         logger.exception(f"Failed to set up logger: {e}")
         raise
 
-# Initialize the logger
-logger = setup_logger()
+def is_worker_process():
+    """Whether this is a parse worker rather than the app itself.
+
+    Spawned workers, and a frozen build relaunching itself as one, import
+    this module before ``multiprocessing`` knows their parent, but are
+    always started with ``--multiprocessing-fork``.
+    """
+    return multiprocessing.parent_process() is not None or multiprocessing.spawn.is_forking(sys.argv)
+
+# Initialize the logger; workers leave app.log to the main process
+logger = logging.getLogger("SRWAnalyzer") if is_worker_process() else setup_logger()
 
 
 def load_log_file(file_path):
     """Parse an APS HTML log file into a BeautifulSoup object.
 
-    The function prefers UTF-16 because that is how the logs are usually
-    produced.  If decoding fails we detect the encoding and retry so that the
-    caller always receives parsed HTML or a clear exception.
+    The file is read once through ``TextDecoding.read_text``, which sniffs
+    the byte order mark (the logs are usually UTF-16) and only falls back to
+    chardet and then UTF-8 when it has to, so the caller always receives
+    parsed HTML or a clear exception.
     """
     try:
-        with open(file_path, 'r', encoding='utf-16') as file:
-            content = file.read()
-            return BeautifulSoup(content, 'html.parser')
-    except Exception:
-        logger.warning(f"Initial read of {file_path} failed. Trying to detect encoding.")
-        try:
-            # Detect the encoding
-            with open(file_path, 'rb') as file:
-                raw_data = file.read()
-                detected_encoding = chardet.detect(raw_data)['encoding']
-            
-            logger.info(f"Detected encoding for {file_path}: {detected_encoding}")  # Debug statement
-            
-            # Try opening the file with the detected encoding
-            try:
-                with open(file_path, 'r', encoding=detected_encoding ) as file:
-                    content = file.read()
-            except (UnicodeDecodeError, TypeError):
-                # Fallback to utf-8 if the detected encoding fails
-                logger.warning(f"Failed to decode with detected encoding ({detected_encoding}). Falling back to utf-8.")
-                with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-                    content = file.read()
-
-            return BeautifulSoup(content, 'html.parser')
-        except FileNotFoundError:
-            logger.exception(f"File not found: {file_path}")
-            raise RuntimeError(f"File not found: {file_path}")
-        except PermissionError:
-            logger.exception(f"Permission denied: {file_path}")
-            raise RuntimeError(f"Permission denied: {file_path}")
-        except Exception as e:
-            logger.exception(f"Error loading log file: {e}")
-            raise RuntimeError(f"Error loading log file: {e}")
+        return BeautifulSoup(TextDecoding.read_text(file_path), 'html.parser')
+    except FileNotFoundError:
+        logger.exception(f"File not found: {file_path}")
+        raise RuntimeError(f"File not found: {file_path}")
+    except PermissionError:
+        logger.exception(f"Permission denied: {file_path}")
+        raise RuntimeError(f"Permission denied: {file_path}")
+    except Exception as e:
+        logger.exception(f"Error loading log file: {e}")
+        raise RuntimeError(f"Error loading log file: {e}")
 
 def load_log_file_text(file_path, log_entries):
     """Load a plain-text APS log into a provided list buffer.
 
-    We sniff the encoding first to avoid UnicodeDecodeError when operators
-    manually adjust SRW bundles.  Lines are appended to the provided
-    ``log_entries`` list to keep allocation predictable when processing many
-    files in succession.
+    Lines are streamed from disk through ``TextDecoding.iter_lines`` so the raw
+    file is never held in memory alongside the list.  Lines are appended to
+    the provided ``log_entries`` list to keep allocation predictable when
+    processing many files in succession.
     """
     try:
-        # Detect the encoding
-        with open(file_path, 'rb') as file:
-            raw_data = file.read()
-            detected_encoding = chardet.detect(raw_data)['encoding']
-        
-        logger.info(f"Detected encoding for {file_path}: {detected_encoding}")  # Debug statement
-        
-        # Try opening the file with the detected encoding
-        try:
-            with open(file_path, 'r', encoding=detected_encoding) as file:
-                log_entries.extend(file.readlines())
-        except (UnicodeDecodeError, TypeError):
-            # Fallback to utf-8 if the detected encoding fails
-            logger.warning(f"Failed to decode with detected encoding ({detected_encoding}). Falling back to utf-8.")
-            with open(file_path, 'r', encoding='utf-8', errors='replace') as file:
-                log_entries.extend(file.readlines())
+        log_entries.extend(TextDecoding.iter_lines(file_path))
         return log_entries
     except FileNotFoundError:
         logger.exception(f"File not found: {file_path}")
@@ -157,22 +140,34 @@ def get_platform_version_from_logs(soup: BeautifulSoup):
         return ""
 
 def get_platform_version_from_sysInfo(sysInfo_dir):
-    """Read the platform version from the generated SystemInformation.txt file."""
+    """Read the platform version from the generated SystemInformation.txt file.
+
+    ``sysInfo_dir`` is an extracted SRW folder, an SRW zip or a bundle.
+    """
     try:
-        sysInfo_path = os.path.join(sysInfo_dir, "SystemInformation.txt")
+        bundle = BundleReader.open_bundle(sysInfo_dir)
         
-        with open(sysInfo_path) as file:
-            lines = file.readlines()
-            if len(lines) > 2:
-                return lines[2].split(":")[1].strip()
-            else:
-                logger.info(f"SystemInformation.txt is not of sufficient length to find a the Operating System.")
-                return ""
+        lines = TextDecoding.read_text(bundle.source("SystemInformation.txt")).splitlines()
+        if len(lines) > 2:
+            return lines[2].split(":")[1].strip()
+        else:
+            logger.info(f"SystemInformation.txt is not of sufficient length to find a the Operating System.")
+            return ""
     except Exception as e:
         logger.exception(f"Error getting platform version from sysInfo: {e}")
         return ""
 
 # Step 4: Extract Log Entries
+def _cell_text(cell):
+    """Return the text of a ``<td>`` without the text of cells nested in it.
+
+    html.parser does not close a ``<td>`` when the next one starts, so the
+    cells of a row with unclosed tags end up inside each other.
+    """
+    if cell.td is None:
+        return cell.text.strip()
+    return ''.join(text for text in cell.find_all(string=True) if text.find_parent('td') is cell).strip()
+
 def extract_log_entries(fileName: str, soup):
     log_entries = []
     log_section = soup.find('a', {'name': 'LogEntries'})
@@ -185,36 +180,13 @@ def extract_log_entries(fileName: str, soup):
             for row in rows:
                 cells = row.find_all('td')
                 if len(cells) != 0:
-                    description = cells[3].text.strip()
-                    user = server = process = pid = session = ''
-                    
-                    # Try to match full pattern first
-                    pattern = r'^(\S+) on (\S+)(?: \(\d+\))?, (\S+) \((\d+)\)'
-                    match = re.match(pattern, description)
-                    
-                    if match:
-                        user, server, process, pid = match.groups()
-                        description = description[match.end():].strip()
-                    else:
-                        # Fall back to just process and PID
-                        process_pid_pattern = r'^(\S+) \((\d+)\)'
-                        process_match = re.match(process_pid_pattern, description)
-                        if process_match:
-                            process, pid = process_match.groups()
-                            description = description[process_match.end():].strip()
-                    
-                    # Look for Session ID in the remaining description
-                    session_pattern = r'Session ID (\d+):'
-                    session_match = re.search(session_pattern, description)
-                    if session_match:
-                        session = session_match.group(1)
-                        # Remove the session info from description
-                        description = description.replace(session_match.group(0), '').strip()
-                    
+                    description = _cell_text(cells[3])
+                    user, server, process, pid, session, description = LogFields.split_description(description)
+
                     entry = {
-                        'Line': cells[0].text.strip(),
-                        'Date': cells[1].text.strip(),
-                        'Time': cells[2].text.strip(),
+                        'Line': _cell_text(cells[0]),
+                        'Date': _cell_text(cells[1]),
+                        'Time': _cell_text(cells[2]),
                         'User': user,
                         'Server': server,
                         'Process': process,
@@ -234,6 +206,14 @@ def extract_log_entries(fileName: str, soup):
     return log_entries
 
 # Step 6a: Generate Summary
+def format_issues(error_dict):
+    """One line per potential issue, as the summary shows them."""
+    lines = []
+    for type, details in error_dict.items():
+        count = f" ({details['Count']} entries)" if details.get('Count', 1) > 1 else ""
+        lines.append(f"{type}{count}  - Entry {details['Line']} on {details['Date']} at {details['Time']}: {details['Description']}")
+    return lines
+
 def generate_summary(info, error_dict):
     summary = []
     summary.append(f"Host OS: {info['hostOS'] if info['hostOS'] else 'N/A'}")
@@ -242,8 +222,7 @@ def generate_summary(info, error_dict):
     summary.append("\nPotential Issues Detected:\n")
     
     if error_dict:
-        for type, details in error_dict.items():
-            summary.append(f"{type}  - Entry {details['Line']} on {details['Date']} at {details['Time']}: {details['Description']}")
+        summary.extend(format_issues(error_dict))
     else:
         summary.append("No errors or failures detected.")
     
@@ -261,19 +240,254 @@ def generate_output(info, error_dict):
 
 # Main Function to Run the Analysis
 
-def log_info(file_path):
-    log_entries = []
+# Parallel parsing settings (config.json):
+#   log_parse_workers        - worker processes; 0 = one per CPU, 1 = parse in this process
+#   log_parse_large_file_mb  - files at least this big count as "large"
+#   log_parse_max_large_files - cap on large files parsed at once; 0 = derive from free memory
+#   log_parse_split_mb       - files at least this big are split into chunks parsed side by side
+DEFAULT_LOG_PARSE_WORKERS = 0
+DEFAULT_LARGE_FILE_MB = 64
+DEFAULT_SPLIT_FILE_MB = 128
+# Bundles smaller than this are parsed in-process; starting worker processes
+# costs more than it saves on a handful of small logs.
+PARALLEL_MIN_BYTES = 16 * 1024 * 1024
+# Rough peak memory needed to parse a file, as a multiple of its size on disk.
+PARSED_SIZE_FACTOR = 8
+
+_extraction_cache = None
+
+def extraction_cache():
+    """Return the process's ``ExtractionCache``, created on first use."""
+    global _extraction_cache
+    if _extraction_cache is None:
+        _extraction_cache = ExtractionCache.ExtractionCache()
+    return _extraction_cache
 
-    for file in os.listdir(file_path):
-        #log = ApsLog(file_path) # I might want to switch to using an APSLog object but not ready yet...
-        if file.endswith(".html"):
-            soup = load_log_file(os.path.join(file_path, file))
-            log_entries.extend(extract_log_entries(file, soup))
+def is_log_file(file_name: str):
+    """Return True for the files ``log_info`` parses."""
+    return file_name.endswith(".html") or (file_name.endswith(".log") and file_name.startswith("aps"))
 
-        if file.endswith(".log") and file.startswith("aps"):
-            log_entries.extend(load_log_file_text(os.path.join(file_path, file), log_entries))
+def list_log_files(file_path):
+    """Return all parseable logs in an SRW, sorted by name.
 
-    return log_entries
+    ``file_path`` is an extracted SRW folder, an SRW zip or a bundle.  Logs in
+    a folder are returned as paths; logs in a zip as ``BundleReader.Member``
+    objects, which every parser here reads straight out of the archive.
+    """
+    bundle = BundleReader.open_bundle(file_path)
+    return [bundle.source(file) for file in sorted(bundle.listdir()) if is_log_file(file)]
+
+def parse_log_file(file_path, engine=None):
+    """Parse a single APS log (``.html`` or ``aps*.log``) into ``LogColumns``.
+
+    ``file_path`` is a path or a ``BundleReader.Member``.  This is the unit
+    of work handed to worker processes, so it only takes picklable arguments
+    and returns plain data.
+    """
+    file = BundleReader.source_name(file_path)
+    engine = ApsLogHtml.get_engine(engine)
+
+    if file.endswith(".html"):
+        if engine == "bs4":
+            return LogColumns.LogColumns.from_records(extract_log_entries(file, load_log_file(file_path)))
+        return LogColumns.LogColumns(ApsLogHtml.iter_rows(file_path, file))
+
+    if file.endswith(".log") and file.startswith("aps"):
+        return LogColumns.LogColumns(ApsLogText.iter_rows(file_path, file))
+
+    return LogColumns.LogColumns()
+
+def parse_log_chunk(file_path, chunk):
+    """Parse one byte range of a log planned by ``LogChunks.plan_chunks``.
+
+    Returns ``(LogColumns, line_count)``.  ``.log`` entries are numbered
+    from the start of the chunk; ``parse_log_columns`` shifts them once the
+    line counts of the earlier chunks are known.  HTML rows carry their own
+    line number, so their count is always 0.
+    """
+    file = os.path.basename(file_path)
+
+    with LogChunks.open_range(file_path, chunk.start, chunk.end) as source:
+        if chunk.kind == 'html':
+            rows = ApsLogHtml.iter_rows(source, file, chunk.encoding, in_table=not chunk.first)
+            return LogColumns.LogColumns(rows), 0
+
+        rows = []
+        line_count = 0
+        for line_count, line in enumerate(TextDecoding.iter_lines(source, encoding=chunk.encoding), 1):
+            row = ApsLogText.parse_row(line, line_count - 1, file)
+            if row is not None:
+                rows.append(row)
+        return LogColumns.LogColumns(rows), line_count
+
+def get_log_parse_workers(workers=None):
+    """Resolve the worker count from the argument or ``log_parse_workers``."""
+    if workers is None:
+        workers = myUtils.get_config_value("log_parse_workers", DEFAULT_LOG_PARSE_WORKERS)
+    try:
+        workers = int(workers)
+    except (TypeError, ValueError):
+        logger.warning(f"Invalid log_parse_workers value '{workers}'. Using one per CPU.")
+        workers = 0
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return workers
+
+def _large_file_slots(large_sizes):
+    """Decide how many large files may be parsed at the same time.
+
+    An explicit ``log_parse_max_large_files`` wins.  Otherwise the limit is
+    however many copies of the largest file fit in the memory that is free
+    right now, never less than one.
+    """
+    configured = myUtils.get_config_value("log_parse_max_large_files", 0)
+    try:
+        configured = int(configured)
+    except (TypeError, ValueError):
+        configured = 0
+    if configured > 0:
+        return configured
+
+    available = myUtils.get_available_memory()
+    if not available or not large_sizes:
+        return 1
+    return max(1, available // (max(large_sizes) * PARSED_SIZE_FACTOR))
+
+def _split_log_file(path, size, parts, engine):
+    """Plan chunks for one log.
+
+    Returns ``(path, chunks)``, with ``chunks`` empty to parse the log whole.
+    Chunks are byte ranges of a file on disk, so a ``BundleReader.Member``
+    worth splitting is extracted to the ``ExtractionCache`` first and the
+    returned path is the extracted file.
+    """
+    split_bytes = myUtils.get_config_value("log_parse_split_mb", DEFAULT_SPLIT_FILE_MB) * 1024 * 1024
+    file = BundleReader.source_name(path)
+    if parts <= 1 or size < split_bytes or not is_log_file(file):
+        return path, []
+    # The BeautifulSoup path needs the whole document
+    if file.endswith(".html") and engine != "stream":
+        return path, []
+
+    try:
+        if not isinstance(path, str):
+            path = extraction_cache().extract_file(path.bundle_path, path.name)
+        return path, LogChunks.plan_chunks(path, parts)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Could not split {file} for parallel parsing: {e}")
+        return path, []
+
+def parse_log_columns(paths, workers=None, engine=None, min_bytes=None):
+    """Parse several logs, in worker processes when it is worth it.
+
+    Returns one ``LogColumns`` per path, in the same order as ``paths``
+    regardless of which file finishes first.  A log bigger than
+    ``log_parse_split_mb`` is cut into one chunk per worker at row boundaries
+    so a single huge file still uses every core; its chunks are stitched back
+    together in order with ``.log`` line numbers shifted to match the whole
+    file.  Work is handed out largest first so a big piece does not start
+    last, and the number of large pieces in flight is capped so a bundle of
+    several huge logs cannot exhaust memory.  Below ``min_bytes`` of logs in
+    total (``PARALLEL_MIN_BYTES`` unless given) everything is parsed
+    in-process, as starting workers would cost more than it saves.
+    """
+    paths = list(paths)
+    engine = ApsLogHtml.get_engine(engine)
+    workers = get_log_parse_workers(workers)
+    sizes = [BundleReader.source_size(path) for path in paths]
+
+    if min_bytes is None:
+        min_bytes = PARALLEL_MIN_BYTES
+    if workers <= 1 or sum(sizes) < min_bytes:
+        return [parse_log_file(path, engine) for path in paths]
+
+    # (file index, chunk or None for the whole file, bytes)
+    tasks = []
+    for i, (path, size) in enumerate(zip(paths, sizes)):
+        paths[i], chunks = _split_log_file(path, size, workers, engine)
+        if chunks:
+            tasks.extend((i, chunk, chunk.end - chunk.start) for chunk in chunks)
+        else:
+            tasks.append((i, None, size))
+
+    workers = min(workers, len(tasks))
+    if workers <= 1:
+        return [parse_log_file(path, engine) for path in paths]
+
+    large_bytes = myUtils.get_config_value("log_parse_large_file_mb", DEFAULT_LARGE_FILE_MB) * 1024 * 1024
+    is_large = [size >= large_bytes for _, _, size in tasks]
+    large_slots = _large_file_slots([task[2] for task, large in zip(tasks, is_large) if large])
+
+    task_results = [None] * len(tasks)
+    pending = sorted(range(len(tasks)), key=lambda t: tasks[t][2], reverse=True)
+    running = {}
+    large_running = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while pending or running:
+            for t in list(pending):
+                if len(running) >= workers:
+                    break
+                if is_large[t] and large_running >= large_slots:
+                    continue
+                pending.remove(t)
+                i, chunk, _ = tasks[t]
+                if chunk is None:
+                    future = pool.submit(parse_log_file, paths[i], engine)
+                else:
+                    future = pool.submit(parse_log_chunk, paths[i], chunk)
+                running[future] = t
+                if is_large[t]:
+                    large_running += 1
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                t = running.pop(future)
+                if is_large[t]:
+                    large_running -= 1
+                task_results[t] = future.result()
+
+    results = [LogColumns.LogColumns() for _ in paths]
+    line_offsets = [0] * len(paths)
+    for (i, chunk, _), result in zip(tasks, task_results):
+        if chunk is None:
+            results[i] = result
+            continue
+
+        columns, line_count = result
+        columns.shift_lines(line_offsets[i])
+        line_offsets[i] += line_count
+        results[i].extend(columns)
+
+    return results
+
+def parse_log_files(paths, workers=None, engine=None):
+    """Like ``parse_log_columns`` but returns one list of entry dicts per path."""
+    return [columns.to_records() for columns in parse_log_columns(paths, workers, engine)]
+
+def log_columns(file_path, engine=None, workers=None, min_bytes=None):
+    """Parse every APS log in an extracted SRW directory into one ``LogColumns``.
+
+    Entries are kept file by file in file name order.  ``workers``
+    overrides the ``log_parse_workers`` setting; pass 1 to stay in-process.
+    ``min_bytes`` is passed to ``parse_log_columns``.
+    """
+    columns = LogColumns.LogColumns()
+    for file_columns in parse_log_columns(list_log_files(file_path), workers, engine, min_bytes):
+        columns.extend(file_columns)
+
+    return columns
+
+def log_frame(file_path, engine=None, workers=None, min_bytes=None):
+    """Parse every APS log in an extracted SRW directory into a typed DataFrame.
+
+    See ``LogColumns.to_dataframe`` for the column dtypes.
+    """
+    return log_columns(file_path, engine, workers, min_bytes).to_dataframe()
+
+def log_info(file_path, engine=None, workers=None, min_bytes=None):
+    """Parse every APS log in an extracted SRW directory into entry dicts."""
+    return log_columns(file_path, engine, workers, min_bytes).to_records()
 
 def extract_error_codes(zip_file_path):
     with zipfile.ZipFile(zip_file_path, 'r') as zip_ref:
@@ -305,12 +519,15 @@ def get_error_code_range(error_dict):
     return None, None
 
 def error_code_lookup(zip_file_path):
-    content = extract_error_codes(zip_file_path)
-    if not content:
+    # Parsed once per distinct ErrorCodes.txt and kept on disk; imported
+    # here as pandas is not needed in parse workers
+    import ErrorCodeIndex
+    table = ErrorCodeIndex.load_error_codes(zip_file_path)
+    if table is None:
         messagebox.showerror("Error", "ErrorCodes.txt not found in the selected zip file.")
         return
     
-    return parse_error_codes(content)
+    return table.to_dict()
 
 def get_error_code(code: str, codes: dict):
     if code in codes.keys():
@@ -319,8 +536,8 @@ def get_error_code(code: str, codes: dict):
         return f"Error code {code} not found."
 
 def check_licenses(file_path):
-    # Get a list of all files in the zip archive
-    file_list = os.listdir(file_path)
+    # Get a list of all files in the SRW (an extracted folder or the zip itself)
+    file_list = BundleReader.open_bundle(file_path).listdir()
     
     # Check if any files end with .lic
     lic_files = [file for file in file_list if file.endswith('.lic')]
@@ -341,7 +558,7 @@ def validate_on_prem_licenses(directory):
     Checks the validity of all licenses in the given directory.
     
     Args:
-        directory (str): The path to the directory containing license files.
+        directory (str): The SRW folder or zip containing license files.
     
     Returns:
         dict: A dictionary with lists of valid, expired, and request-failed licenses.
@@ -382,7 +599,7 @@ def process_license_files(directory):
     Processes all .lic files in the given directory.
     
     Args:
-        directory (str): The path to the directory containing license files.
+        directory (str): The SRW folder or zip containing license files.
     
     Returns:
         list: A list of dictionaries with license data and their validation responses.
@@ -390,12 +607,13 @@ def process_license_files(directory):
     license_data = []
 
     try:
-        for filename in os.listdir(directory):
+        bundle = BundleReader.open_bundle(directory)
+        for filename in bundle.listdir():
             if filename.endswith(".lic"):
-                file_path = os.path.join(directory, filename)
-                txt_path = copy_lic_to_txt(file_path)
+                # The path on disk when there is one, otherwise the name in the zip
+                file_path = bundle.local_path(filename) or filename
                 
-                product_code, serial_number, num_seats = parse_license_file(txt_path)
+                product_code, serial_number, num_seats = parse_license_file(bundle.source(filename))
                 if product_code and serial_number:
                     response_body = check_license_validity(product_code, serial_number)
                     license_data.append({
@@ -443,7 +661,7 @@ def parse_license_file(file_path):
     Parses a .lic file to extract product code, serial number, and number of seats.
     
     Args:
-        file_path (str): The path to the .lic file.
+        file_path (str): The path to the .lic file, or a ``BundleReader.Member``.
     
     Returns:
         tuple: A tuple containing product code, serial number, and number of seats.
@@ -453,16 +671,15 @@ def parse_license_file(file_path):
     num_seats = None
 
     try:
-        with open(file_path, 'r') as file:
-            for line in file:
-                if '# Product code' in line:
-                    product_code = line.split(':')[1].strip()
-                if '# License ID' in line:
-                    serial_number = line.split(':')[1].strip()
-                    if 'TL-' in serial_number:
-                        serial_number = serial_number.split('-')[1]
-                if '# Seats' in line:
-                    num_seats = line.split(':')[1].strip()
+        for line in TextDecoding.iter_lines(file_path):
+            if '# Product code' in line:
+                product_code = line.split(':')[1].strip()
+            if '# License ID' in line:
+                serial_number = line.split(':')[1].strip()
+                if 'TL-' in serial_number:
+                    serial_number = serial_number.split('-')[1]
+            if '# Seats' in line:
+                num_seats = line.split(':')[1].strip()
     except Exception as e:
         logger.exception(f"Error parsing license file {file_path}: {e}")
 
@@ -503,10 +720,10 @@ def validate_cloud_license(directory):
     }
 
     try:
-        for filename in os.listdir(directory):
+        bundle = BundleReader.open_bundle(directory)
+        for filename in bundle.listdir():
             if filename.endswith(".html"):
-                file_path = os.path.join(directory, filename)
-                soup = load_log_file(file_path)
+                soup = load_log_file(bundle.source(filename))
 
                 # Find the relevant line containing the license information
                 license_info = soup.find(text=lambda text: text and "GO-Global license information" in text)
@@ -566,47 +783,48 @@ def get_basic_info(path: str):
     }
     
     try:
-        if os.path.exists(path) and os.path.isdir(path):
+        # ``path`` may be an extracted folder, the SRW zip itself or a bundle
+        if isinstance(path, (BundleReader.DirBundle, BundleReader.ZipBundle)) or os.path.exists(path):
+            bundle = BundleReader.open_bundle(path)
+
             # Check for server role in registry file - look for any registry file matching the pattern
-            reg_files = [f for f in os.listdir(path) if f.startswith("HKLM.Software.") and f.endswith(".reg64.txt")]
+            reg_files = [f for f in bundle.listdir() if f.startswith("HKLM.Software.") and f.endswith(".reg64.txt")]
             for reg_file in reg_files:
-                reg_file_path = os.path.join(path, reg_file)
+                reg_file_path = bundle.source(reg_file)
                 try:
-                    with open(reg_file_path, 'r', encoding='utf-16') as file:
-                        for line in file:
-                            if "ServerRole" in line:
-                                try:
-                                    info['serverRole'] = GOGlobal.server_roles[int(line.split(':')[1].strip())]
-                                    break
-                                except (ValueError, IndexError):
-                                    logger.exception("Error parsing ServerRole value")
+                    for line in TextDecoding.iter_lines(reg_file_path):
+                        if "ServerRole" in line:
+                            try:
+                                info['serverRole'] = GOGlobal.server_roles[int(line.split(':')[1].strip())]
+                                break
+                            except (ValueError, IndexError):
+                                logger.exception("Error parsing ServerRole value")
                     if info['serverRole']:  # If we found the server role, no need to check other files
                         break
                 except Exception as e:
                     logger.exception(f"Error reading registry file {reg_file}: {e}")
 
-            ipconfig_path = os.path.join(path, 'ipconfig.txt')
-            if os.path.exists(ipconfig_path):
+            if bundle.exists('ipconfig.txt'):
+                ipconfig_path = bundle.source('ipconfig.txt')
                 try:
-                    with open(ipconfig_path, 'r') as file:
-                        for line in file:
-                            match = re.search(r'IPv4.*?:\s*([\d\.]+)', line) #IPv4 will be the same across any language (hopefully)
-                            if match:
-                                info['serverIp'] = match.group(1)
-                                break  # Stop reading after the first match
+                    for line in TextDecoding.iter_lines(ipconfig_path):
+                        match = re.search(r'IPv4.*?:\s*([\d\.]+)', line) #IPv4 will be the same across any language (hopefully)
+                        if match:
+                            info['serverIp'] = match.group(1)
+                            break  # Stop reading after the first match
                 except (FileNotFoundError, PermissionError, OSError) as e:
                     logger.exception(f"Failed to read {ipconfig_path}: {e}. Setting server IP to default value.")
                     info['serverIp'] = "0.0.0.0"  # Default IP value if reading fails
 
 
             # Get other info from HTML files
-            for file in os.listdir(path):
+            for file in bundle.listdir():
                 if file.endswith(".html"):
-                    soup = load_log_file(os.path.join(path, file))
+                    soup = load_log_file(bundle.source(file))
                     
                     info['hostOS'], info['platformBuild'] = get_platform_version_from_logs(soup)
                     if not info['hostOS']:
-                        info['hostOS'] = get_platform_version_from_sysInfo(path)
+                        info['hostOS'] = get_platform_version_from_sysInfo(bundle)
                         info['platformBuild'] = "Not found"
                     info['hostVersion'] = get_host_version(soup)
                     break
@@ -620,11 +838,8 @@ def get_basic_info(path: str):
 def main():
     zip_file_path = myUtils.select_file("SRW", ".zip")
 
-    temp_path = os.path.join(os.path.dirname(zip_file_path), "temp")
-    myUtils.extract_zip(zip_file_path, temp_path)
-    log_entries = log_info(temp_path)
-
-    myUtils.remove_directory(temp_path)
+    # Logs are read straight out of the zip
+    log_entries = log_info(zip_file_path)
 
 # Example Usage
 if __name__ == "__main__":
@@ -1,4 +1,6 @@
+from collections.abc import Mapping
 import GOGlobal
+import LogEvents
 import os
 from ApsLogs import load_log_file
 
@@ -49,18 +51,8 @@ def get_client_versions(log_entries):
     if not log_entries:
         return client_versions
 
-    for entry in log_entries:
-        descr = entry.get('description') if isinstance(entry, dict) else None
-        if not descr:
-            continue
-        if "The version of the" in descr:
-            parts = descr.split('The version of the ')
-            for part in parts[1:]:
-                if ' client is ' in part:
-                    client_info = part.split(' client is ')
-                    client_versions.append((client_info[1].strip(), client_info[0].strip()))
-
-    return client_versions
+    descriptions = [entry.get('description') or '' for entry in log_entries if isinstance(entry, Mapping)]
+    return LogEvents.client_versions(descriptions)
 
 def get_client_versions(soup):
     client_versions = []
@@ -78,18 +70,13 @@ def get_client_versions(soup):
 
     rows = log_table.find_all('tr')[1:]
 
+    descriptions = []
     for row in rows:
         cells = row.find_all('td')
         if len(cells) > 3:
-            descr = cells[3].text.strip()
-            if "The version of the" in descr:
-                parts = descr.split('The version of the ')
-                for part in parts[1:]:
-                    if ' client is ' in part:
-                        client_info = part.split(' client is ')
-                        client_versions.append((client_info[1].strip()[:-1], client_info[0].strip()))
-
-    return client_versions
+            descriptions.append(cells[3].text.strip())
+
+    return LogEvents.client_versions(descriptions)
 
 def get_platform_version(log_entries):
     platform_version = None
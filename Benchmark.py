@@ -0,0 +1,194 @@
+"""Parser throughput benchmark over synthetic SRW bundles.
+
+Generates bundles with ``SyntheticSRW`` (once; they are reused on later
+runs) and times each entry point against them, reporting rows/s, MB/s and
+peak RSS.  Every target runs in a fresh process so one target's memory
+does not count against the next.  ``check_licenses`` answers the license
+server lookups locally, so its timings do not depend on the network.
+
+    python Benchmark.py                       # 10 MB, 100 MB and 1 GB
+    python Benchmark.py --sizes 10 --json bench.jsonl
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+import types
+import zipfile
+
+import SyntheticSRW
+import myUtils
+
+DEFAULT_SIZES_MB = (10, 100, 1000)
+TARGETS = ('log_info', 'ApsLog.get_logs', 'get_basic_info', 'check_licenses')
+
+
+def peak_rss():
+    """Return ``(this process, largest child)`` peak resident set size in bytes.
+
+    Either is None where the platform does not report it.
+    """
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+            info = psutil.Process().memory_info()
+            return getattr(info, 'peak_wset', None), None
+        except ImportError:
+            return None, None
+
+    # ru_maxrss is in kilobytes on Linux and bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale,
+            resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss * scale)
+
+
+def _input_bytes(zip_path, target):
+    """Uncompressed bytes the target reads from the bundle."""
+    with zipfile.ZipFile(zip_path) as archive:
+        infos = archive.infolist()
+    if target in ('log_info', 'ApsLog.get_logs'):
+        return sum(i.file_size for i in infos if i.filename.startswith('aps_'))
+    if target == 'get_basic_info':
+        # The first HTML log plus the small system files
+        html = [i.file_size for i in sorted(infos, key=lambda i: i.filename) if i.filename.endswith('.html')]
+        return sum(html[:1]) + sum(i.file_size for i in infos if i.filename.endswith('.txt'))
+    licenses = [i.file_size for i in infos if i.filename.endswith('.lic')]
+    return sum(licenses) if licenses else sum(i.file_size for i in infos if i.filename.endswith('.html'))
+
+
+def _offline_license_check(url, *args, **kwargs):
+    """Stand-in for ``requests.get`` against the license server.
+
+    The synthetic licenses have random serials, and the benchmark times
+    reading them, not the network, so every serial is answered as valid
+    without leaving the machine.
+    """
+    serial = url.split('serial=', 1)[1].split('_PRODUCTCODE=', 1)[0]
+    return types.SimpleNamespace(status_code=200, text=json.dumps({'name': serial, 'expired': 'false'}))
+
+
+def _run_target(target, zip_path, extracted_dir):
+    """Run one target and return the number of rows it produced, if any."""
+    import ApsLogs
+
+    if target == 'log_info':
+        return len(ApsLogs.log_info(zip_path))
+    if target == 'ApsLog.get_logs':
+        from ApsLog import ApsLog
+        return sum(len(ApsLog(os.path.join(extracted_dir, name)).get_logs())
+                   for name in sorted(os.listdir(extracted_dir)) if ApsLogs.is_log_file(name))
+    if target == 'get_basic_info':
+        ApsLogs.get_basic_info(zip_path)
+        return None
+    if target == 'check_licenses':
+        # Each target runs in its own process, so this does not leak
+        ApsLogs.requests.get = _offline_license_check
+        ApsLogs.check_licenses(zip_path)
+        return None
+    raise ValueError(f"Unknown benchmark target: {target}")
+
+
+def _measure(target, zip_path, extracted_dir, queue):
+    # Imports are paid before the clock starts
+    import ApsLogs  # noqa: F401
+    import ApsLog  # noqa: F401
+
+    baseline, _ = peak_rss()
+    start = time.perf_counter()
+    try:
+        rows = _run_target(target, zip_path, extracted_dir)
+        error = None
+    except Exception as e:
+        rows, error = None, repr(e)
+    seconds = time.perf_counter() - start
+    peak, workers = peak_rss()
+    queue.put({'seconds': seconds, 'rows': rows, 'error': error,
+               'baseline_rss': baseline, 'peak_rss': peak, 'worker_peak_rss': workers})
+
+
+def measure(target, zip_path, extracted_dir):
+    """Run ``target`` in a fresh process and return its measurements."""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_measure, args=(target, zip_path, extracted_dir, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def prepare_bundle(data_dir, size_mb, seed=0):
+    """Return ``(zip path, extracted log dir)`` for a bundle, generating it if needed."""
+    zip_path = os.path.join(data_dir, f"synthetic_{size_mb:g}mb_seed{seed}.zip")
+    if not os.path.exists(zip_path):
+        print(f"Generating {zip_path} ...", flush=True)
+        partial = zip_path + ".part"
+        SyntheticSRW.generate_srw(partial, log_mb=size_mb, seed=seed)
+        os.replace(partial, zip_path)
+
+    # ApsLog only reads files on disk
+    extracted_dir = os.path.splitext(zip_path)[0]
+    if not os.path.isdir(extracted_dir):
+        os.makedirs(extracted_dir + ".part", exist_ok=True)
+        myUtils.extract_zip(zip_path, extracted_dir + ".part", manifest=('aps_*',))
+        os.replace(extracted_dir + ".part", extracted_dir)
+    return zip_path, extracted_dir
+
+
+def _mb(size):
+    return None if size is None else size / (1024 * 1024)
+
+
+def run(sizes, targets, data_dir, seed=0, json_path=None):
+    results = []
+    print(f"{'size':>7} {'target':<16} {'seconds':>8} {'rows/s':>11} {'MB/s':>7} {'peak RSS':>9} {'workers':>9}")
+    for size_mb in sizes:
+        zip_path, extracted_dir = prepare_bundle(data_dir, size_mb, seed)
+        for target in targets:
+            result = measure(target, zip_path, extracted_dir)
+            input_bytes = _input_bytes(zip_path, target)
+            result.update({
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                'size_mb': size_mb,
+                'target': target,
+                'input_bytes': input_bytes,
+                'rows_per_second': result['rows'] / result['seconds'] if result['rows'] and result['seconds'] else None,
+                'mb_per_second': _mb(input_bytes) / result['seconds'] if result['seconds'] else None,
+            })
+            results.append(result)
+            if json_path:
+                with open(json_path, 'a', encoding='utf-8') as json_file:
+                    json_file.write(json.dumps(result) + "\n")
+
+            if result['error']:
+                print(f"{size_mb:>5g}MB {target:<16} failed: {result['error']}")
+                continue
+            rows_per_second = f"{result['rows_per_second']:,.0f}" if result['rows_per_second'] else "-"
+            worker_rss = f"{_mb(result['worker_peak_rss']):.0f} MB" if result['worker_peak_rss'] else "-"
+            peak = f"{_mb(result['peak_rss']):.0f} MB" if result['peak_rss'] else "-"
+            print(f"{size_mb:>5g}MB {target:<16} {result['seconds']:>8.2f} {rows_per_second:>11} "
+                  f"{result['mb_per_second']:>7.1f} {peak:>9} {worker_rss:>9}", flush=True)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SRW parsing on synthetic bundles.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=DEFAULT_SIZES_MB, help="log sizes in MB")
+    parser.add_argument("--targets", nargs="+", choices=TARGETS, default=TARGETS)
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "srw_benchmark"),
+                        help="where generated bundles are kept between runs")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--json", help="append one JSON line per measurement to this file")
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    run(args.sizes, args.targets, args.data_dir, args.seed, args.json)
+
+
+if __name__ == "__main__":
+    main()
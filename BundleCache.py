@@ -0,0 +1,217 @@
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+import zipfile
+
+import pandas as pd
+
+import myUtils
+
+try:
+    import pyarrow  # noqa: F401  (feather support for pandas)
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+logger = logging.getLogger("SRWAnalyzer")
+
+# Cache settings (config.json):
+#   bundle_cache_dir - where parsed bundles are kept; "" = per-user default
+#   bundle_cache_mb  - total size the cache may grow to; 0 = caching disabled
+#   license_cache_hours - how long cached license results are trusted before
+#                         the license server is asked again
+DEFAULT_CACHE_MB = 2048
+DEFAULT_LICENSE_HOURS = 1
+# Bumped whenever the cached frame's columns change
+CACHE_VERSION = 2
+
+INFO_FILE = "info.json"
+FEATHER_FILE = "logs.feather"
+PICKLE_FILE = "logs.pkl"
+
+
+def fingerprint(zip_path):
+    """Identify an SRW by its contents without reading them.
+
+    Hashes the zip's size together with the name, CRC and sizes of every
+    member from the central directory, so the same bundle saved under a
+    different name or path still hits the cache while any changed file
+    misses it.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{CACHE_VERSION}:{os.path.getsize(zip_path)}".encode())
+    with zipfile.ZipFile(zip_path) as archive:
+        for info in archive.infolist():
+            digest.update(f"\0{info.filename}:{info.CRC}:{info.file_size}:{info.compress_size}".encode("utf-8", "replace"))
+    return digest.hexdigest()
+
+
+class BundleCache:
+    """On-disk cache of parsed SRW results keyed by ``fingerprint``.
+
+    Each entry is a directory holding the log DataFrame (feather when pyarrow
+    is installed, pickle otherwise) and a JSON file with the basic info and
+    license results.  Entries are evicted least recently used first once the
+    cache grows past ``bundle_cache_mb``.
+    """
+
+    def __init__(self, cache_dir=None, max_mb=None):
+        if cache_dir is None:
+            cache_dir = myUtils.get_config_value("bundle_cache_dir", "") or myUtils.app_data_dir("bundle_cache")
+        if max_mb is None:
+            max_mb = myUtils.get_config_value("bundle_cache_mb", DEFAULT_CACHE_MB)
+        self.cache_dir = cache_dir
+        try:
+            self.max_bytes = int(float(max_mb) * 1024 * 1024)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid bundle_cache_mb value '{max_mb}'. Using {DEFAULT_CACHE_MB}.")
+            self.max_bytes = DEFAULT_CACHE_MB * 1024 * 1024
+
+    @property
+    def enabled(self):
+        return self.max_bytes > 0
+
+    def _entry_dir(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def get(self, zip_path):
+        """Return ``{'basic_info', 'licenses', 'log_df'}`` for a cached bundle, or None.
+
+        ``licenses`` is None once the cached results are older than
+        ``license_cache_hours``: a license can expire or be revoked while
+        the bundle stays the same, so the caller checks again and stores the
+        answer with ``put_licenses``.
+        """
+        if not self.enabled:
+            return None
+
+        try:
+            key = fingerprint(zip_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            logger.warning(f"Could not fingerprint {zip_path}: {e}")
+            return None
+
+        entry = self._entry_dir(key)
+        info_path = os.path.join(entry, INFO_FILE)
+        if not os.path.exists(info_path):
+            return None
+
+        try:
+            with open(info_path, 'r', encoding='utf-8') as info_file:
+                info = json.load(info_file)
+            frame_path = os.path.join(entry, info['frame'])
+            if info['frame'] == FEATHER_FILE:
+                log_df = pd.read_feather(frame_path)
+            else:
+                log_df = pd.read_pickle(frame_path)
+        except Exception as e:
+            logger.warning(f"Discarding unreadable cache entry {entry}: {e}")
+            shutil.rmtree(entry, ignore_errors=True)
+            return None
+
+        # The entry's mtime is its last use, for LRU eviction
+        os.utime(info_path)
+        logger.info(f"Loaded {os.path.basename(zip_path)} from the bundle cache.")
+        licenses = (info['licenses'] or {}) if self._licenses_fresh(info) else None
+        return {'basic_info': info['basic_info'], 'licenses': licenses, 'log_df': log_df}
+
+    def _licenses_fresh(self, info):
+        hours = myUtils.get_config_value("license_cache_hours", DEFAULT_LICENSE_HOURS)
+        try:
+            max_age = float(hours) * 3600
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid license_cache_hours value '{hours}'. Using {DEFAULT_LICENSE_HOURS}.")
+            max_age = DEFAULT_LICENSE_HOURS * 3600
+        # Entries written before licenses were timestamped count as stale
+        return time.time() - info.get('licenses_checked', 0) < max_age
+
+    def put_licenses(self, zip_path, licenses):
+        """Replace the license results of a cached bundle with a fresh check."""
+        if not self.enabled:
+            return
+
+        try:
+            info_path = os.path.join(self._entry_dir(fingerprint(zip_path)), INFO_FILE)
+            with open(info_path, 'r', encoding='utf-8') as info_file:
+                info = json.load(info_file)
+            info['licenses'] = licenses
+            info['licenses_checked'] = time.time()
+            staging = f"{info_path}.{os.getpid()}.tmp"
+            with open(staging, 'w', encoding='utf-8') as info_file:
+                json.dump(info, info_file, default=str)
+            os.replace(staging, info_path)
+        except Exception as e:
+            logger.warning(f"Could not update the cached licenses of {zip_path}: {e}")
+
+    def put(self, zip_path, basic_info, licenses, log_df):
+        """Store the results for a bundle, then evict old entries if needed."""
+        if not self.enabled:
+            return
+
+        staging = None
+        try:
+            key = fingerprint(zip_path)
+            entry = self._entry_dir(key)
+            staging = f"{entry}.{os.getpid()}.tmp"
+            shutil.rmtree(staging, ignore_errors=True)
+            os.makedirs(staging)
+
+            # Selections are per session, not part of the parsed bundle
+            log_df = log_df.drop(columns=['Key'], errors='ignore').reset_index(drop=True)
+            if HAVE_PYARROW:
+                frame_file = FEATHER_FILE
+                log_df.to_feather(os.path.join(staging, frame_file))
+            else:
+                frame_file = PICKLE_FILE
+                log_df.to_pickle(os.path.join(staging, frame_file))
+
+            info = {
+                'version': CACHE_VERSION,
+                'source': os.path.abspath(zip_path),
+                'created': time.time(),
+                'licenses_checked': time.time(),
+                'frame': frame_file,
+                'basic_info': basic_info,
+                'licenses': licenses,
+            }
+            with open(os.path.join(staging, INFO_FILE), 'w', encoding='utf-8') as info_file:
+                json.dump(info, info_file, default=str)
+
+            # Swap the finished entry into place so a reader never sees half of one
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(staging, entry)
+        except Exception as e:
+            logger.warning(f"Could not cache {zip_path}: {e}")
+            if staging:
+                shutil.rmtree(staging, ignore_errors=True)
+            return
+
+        self.evict()
+
+    def evict(self):
+        """Delete least recently used entries until the cache fits its budget."""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            info_path = os.path.join(entry, INFO_FILE)
+            if not os.path.isdir(entry) or not os.path.exists(info_path):
+                continue
+            entries.append((os.path.getmtime(info_path), myUtils.dir_size(entry), entry))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            logger.info(f"Evicting {entry} from the bundle cache.")
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+    def clear(self):
+        """Remove every cached bundle."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -0,0 +1,156 @@
+from collections import namedtuple
+import io
+import logging
+import os
+import threading
+import zipfile
+
+logger = logging.getLogger("SRWAnalyzer")
+
+# How deep to look for zips inside zips
+MAX_NESTING = 3
+# Compressed nested zips are decompressed into memory once so their members
+# can be read at random; larger ones are skipped rather than exhausting RAM.
+MAX_NESTED_ZIP_BYTES = 1024 * 1024 * 1024
+
+
+class Member(namedtuple('Member', ['bundle_path', 'name', 'size'])):
+    """A file inside a zipped SRW that can be handed to a worker process.
+
+    It pickles as three plain values and reopens its bundle on ``open()``,
+    so the parsers accept it anywhere they accept a path.
+    """
+    __slots__ = ()
+
+    def open(self):
+        return open_bundle(self.bundle_path).open(self.name)
+
+
+class DirBundle:
+    """An SRW that has already been extracted to a directory."""
+
+    def __init__(self, path):
+        self.path = path
+
+    def listdir(self):
+        return os.listdir(self.path)
+
+    def exists(self, name):
+        return os.path.exists(os.path.join(self.path, name))
+
+    def size(self, name):
+        return os.path.getsize(os.path.join(self.path, name))
+
+    def source(self, name):
+        """Return something the parsers can read ``name`` from: here, its path."""
+        return os.path.join(self.path, name)
+
+    def local_path(self, name):
+        return os.path.join(self.path, name)
+
+    def open(self, name):
+        return open(os.path.join(self.path, name), 'rb')
+
+
+class ZipBundle:
+    """An SRW read straight out of its zip, without extracting it.
+
+    Files at the root of nested zips are listed alongside the root of the
+    outer zip, the way they would appear once extracted into one folder; a
+    name in the outer zip wins over the same name in a nested one.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._members = {}
+        self._lock = threading.Lock()
+        self._add_archive(zipfile.ZipFile(path), 0)
+
+    def _add_archive(self, archive, depth):
+        nested = []
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            self._members.setdefault(info.filename, (archive, info))
+            if info.filename.lower().endswith('.zip') and depth < MAX_NESTING:
+                nested.append(info)
+
+        for info in nested:
+            try:
+                self._add_archive(zipfile.ZipFile(self._open_nested(archive, info)), depth + 1)
+            except (zipfile.BadZipFile, OSError, ValueError) as e:
+                logger.warning(f"Skipping nested zip {info.filename} in {self.path}: {e}")
+
+    def _open_nested(self, archive, info):
+        # A stored zip can be read in place; seeking a compressed member means
+        # decompressing it again from the start, so those are read once.
+        if info.compress_type == zipfile.ZIP_STORED:
+            return archive.open(info)
+        if info.file_size > MAX_NESTED_ZIP_BYTES:
+            raise ValueError(f"nested zip is larger than {MAX_NESTED_ZIP_BYTES} bytes")
+        with archive.open(info) as file:
+            return io.BytesIO(file.read())
+
+    def listdir(self):
+        return [name for name in self._members if '/' not in name]
+
+    def exists(self, name):
+        return name in self._members
+
+    def size(self, name):
+        return self._members[name][1].file_size
+
+    def source(self, name):
+        """Return something the parsers can read ``name`` from: a ``Member``."""
+        return Member(self.path, name, self.size(name))
+
+    def local_path(self, name):
+        return None
+
+    def open(self, name):
+        try:
+            archive, info = self._members[name]
+        except KeyError:
+            raise FileNotFoundError(f"{name} is not in {self.path}") from None
+        with self._lock:
+            return archive.open(info)
+
+
+_zip_bundles = {}
+_zip_bundles_lock = threading.Lock()
+# Zips kept open at once; the oldest is dropped first
+_MAX_OPEN_BUNDLES = 4
+
+
+def open_bundle(source):
+    """Return a bundle for an SRW zip, an extracted SRW folder, or a bundle.
+
+    Zip bundles are kept open and reused for the life of the process (one per
+    worker process too), keyed on the file's path, size and modification time.
+    """
+    if isinstance(source, (DirBundle, ZipBundle)):
+        return source
+    if os.path.isdir(source):
+        return DirBundle(source)
+
+    stat = os.stat(source)
+    key = (os.path.abspath(source), stat.st_size, stat.st_mtime_ns)
+    with _zip_bundles_lock:
+        bundle = _zip_bundles.get(key)
+        if bundle is None:
+            bundle = ZipBundle(source)
+            _zip_bundles[key] = bundle
+            while len(_zip_bundles) > _MAX_OPEN_BUNDLES:
+                del _zip_bundles[next(iter(_zip_bundles))]
+    return bundle
+
+
+def source_name(source):
+    """Return the file name of a path or ``Member``."""
+    return os.path.basename(getattr(source, 'name', source))
+
+
+def source_size(source):
+    """Return the uncompressed size of a path or ``Member``."""
+    size = getattr(source, 'size', None)
+    return size if size is not None else os.path.getsize(source)
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import logging
+import os
+
+import numpy as np
+import pandas as pd
+
+import myUtils
+from BundleReader import open_bundle
+
+logger = logging.getLogger("SRWAnalyzer")
+
+# config.json: where parsed ErrorCodes.txt tables are kept; "" = per-user default
+DEFAULT_CACHE_DIR = ""
+ERROR_CODES_FILE = "ErrorCodes.txt"
+# Bumped whenever the index file layout changes
+INDEX_VERSION = 1
+
+# "Error 1326:", "error code 5", "error=0x2746" and the like.  Other numbers
+# in a description (PIDs, sessions, exit codes) are not error codes.
+ERROR_CODE_PATTERN = r"(?i)\berror(?:\s+code)?\s*[:=#]?\s*(?:0x(?P<hex>[0-9a-f]+)|(?P<dec>\d+))\b"
+
+INT64_MIN, INT64_MAX = np.iinfo(np.int64).min, np.iinfo(np.int64).max
+
+# Indexes already loaded in this process, by content hash
+_loaded = {}
+
+
+def parse_error_codes(content):
+    """Parse ``code = description`` lines into a Series indexed by code, sorted.
+
+    Same rules as ``ErrorCodes.parse_error_codes``: lines whose code is not
+    an integer are skipped and a repeated code keeps its last description.
+    """
+    codes, messages = [], []
+    for line in content.splitlines():
+        if '=' in line:
+            code, description = map(str.strip, line.split('=', 1))
+            try:
+                codes.append(int(code))
+            except ValueError:
+                continue
+            messages.append(description)
+    table = pd.Series(messages, index=pd.Index(codes, dtype='int64', name='Code'), dtype=object, name='Meaning')
+    return table[~table.index.duplicated(keep='last')].sort_index()
+
+
+def load_error_codes(path, cache_dir=None):
+    """Return the ErrorCodes.txt table of an SRW (zip or folder) as a Series, or None.
+
+    Each distinct ErrorCodes.txt is parsed once and kept on disk as a small
+    JSON index named by its hash, so later bundles from the same GO-Global
+    version only read and hash the file.
+    """
+    try:
+        bundle = open_bundle(path)
+        name = next((name for name in bundle.listdir() if name.endswith(ERROR_CODES_FILE)), None)
+        if name is None:
+            return None
+        with bundle.open(name) as file:
+            raw = file.read()
+    except Exception as e:
+        logger.warning(f"Could not read {ERROR_CODES_FILE} from {path}: {e}")
+        return None
+
+    key = hashlib.sha256(raw).hexdigest()
+    if key in _loaded:
+        return _loaded[key]
+
+    if cache_dir is None:
+        cache_dir = myUtils.get_config_value("error_code_cache_dir", DEFAULT_CACHE_DIR) or myUtils.app_data_dir("error_codes")
+    index_path = os.path.join(cache_dir, f"{key}.json")
+
+    table = None
+    if os.path.exists(index_path):
+        try:
+            with open(index_path, 'r', encoding='utf-8') as index_file:
+                index = json.load(index_file)
+            if index.get('version') == INDEX_VERSION:
+                table = pd.Series(index['messages'], index=pd.Index(index['codes'], dtype='int64', name='Code'),
+                                  dtype=object, name='Meaning')
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Discarding unreadable error code index {index_path}: {e}")
+
+    if table is None:
+        table = parse_error_codes(raw.decode('utf-8', errors='replace'))
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            staging = f"{index_path}.{os.getpid()}.tmp"
+            with open(staging, 'w', encoding='utf-8') as index_file:
+                json.dump({'version': INDEX_VERSION, 'codes': table.index.tolist(), 'messages': table.tolist()},
+                          index_file, separators=(',', ':'))
+            os.replace(staging, index_path)
+        except OSError as e:
+            logger.warning(f"Could not save error code index {index_path}: {e}")
+
+    _loaded[key] = table
+    return table
+
+
+def error_meanings(descriptions, table):
+    """Return the meaning of every error code mentioned in each description.
+
+    Codes are pulled out with one ``str.extractall`` over the distinct
+    descriptions and joined against ``table`` by index lookup, so there is
+    no Python work per row.  A description naming several codes gets
+    ``"5: Access is denied.; 1326: ..."``; one naming none, or only codes
+    missing from the table, gets ''.  The result is categorical, with the
+    index of ``descriptions``.
+    """
+    descriptions = pd.Series(descriptions, dtype=object) if not isinstance(descriptions, pd.Series) else descriptions
+    codes, uniques = pd.factorize(descriptions.astype(object).fillna(''))
+    meanings = pd.Series('', index=range(len(uniques)), dtype=object)
+
+    if table is not None and len(table) and len(uniques):
+        found = pd.Series(uniques, dtype=object).str.extractall(ERROR_CODE_PATTERN)
+        if len(found):
+            # Parsed as Python ints: a float would round long decimal codes,
+            # and codes too wide for int64 cannot be in the table anyway
+            values = [int(hexa, 16) if isinstance(hexa, str) else int(dec)
+                      for dec, hexa in zip(found['dec'], found['hex'])]
+            fits = np.array([INT64_MIN <= value <= INT64_MAX for value in values], dtype=bool)
+            numbers = pd.Series([value if ok else 0 for value, ok in zip(values, fits)],
+                                index=found.index, dtype='int64')
+            positions = table.index.get_indexer(numbers)
+            known = (positions >= 0) & fits
+            if known.any():
+                text = (numbers[known].astype('int64').astype(str) + ": "
+                        + pd.Series(table.to_numpy()[positions[known]], index=numbers.index[known]))
+                joined = text.groupby(level=0).agg("; ".join)
+                meanings[joined.index] = joined.to_numpy()
+
+    return pd.Series(pd.Categorical(meanings).take(codes), index=descriptions.index, name='ErrorMeaning')
+
+
+def add_error_meanings(frame, table):
+    """Add the ``ErrorMeaning`` column for ``frame['Description']`` to ``frame``."""
+    frame['ErrorMeaning'] = error_meanings(frame['Description'], table)
+    return frame
@@ -1,4 +1,5 @@
 import myUtils
+import ErrorCodeIndex
 import zipfile
 from tkinter import simpledialog, messagebox
 
@@ -40,12 +41,13 @@ def error_code_lookup_2(zip_file_path):
     return parse_error_codes(content)
 
 def error_code_lookup(zip_file_path):
-    content = extract_error_codes(zip_file_path)
-    if not content:
+    # Parsed once per distinct ErrorCodes.txt and kept on disk
+    table = ErrorCodeIndex.load_error_codes(zip_file_path)
+    if table is None:
         messagebox.showerror("Error", "ErrorCodes.txt not found in the selected zip file.")
         return
     
-    error_dict = parse_error_codes(content)
+    error_dict = table.to_dict()
     
     if not error_dict:
         messagebox.showerror("Error", "No error codes found in ErrorCodes.txt.")
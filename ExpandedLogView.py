@@ -3,7 +3,7 @@ from datetime import datetime as dt
 from tkinter import messagebox, ttk
 from venv import logger
 
-import pandas as pd
+from LogColumns import display_value
 
 
 class ExpandedLogDialog:
@@ -179,7 +179,7 @@ class ExpandedLogDialog:
         for _, row in source_df.iterrows():
             values = []
             for col in self.log_info_tree['columns']:
-                values.append(str(row.get(col, '')))
+                values.append(display_value(row.get(col, '')))
             
             item = self.log_info_tree.insert('', 'end', values=values)
 
@@ -272,18 +272,8 @@ class ExpandedLogDialog:
             if not search_values:
                 filtered_df = self.log_df
             else:
-                # Start with full DataFrame
-                mask = pd.Series(True, index=self.log_df.index)
-                
-                for col, search_value in search_values.items():
-                    # Handle all columns uniformly
-                    col_mask = self.log_df[col].astype(str).str.lower().str.contains(
-                        search_value,
-                        na=False
-                    )
-                    mask &= col_mask
-                
-                filtered_df = self.log_df[mask]
+                # The frame is the parent's, so its search index is shared
+                filtered_df = self.log_df[self.parent.get_search_index(self.log_df).mask(search_values)]
             
             self._last_search = search_values
             self.update_log_treeview(filtered_df)
@@ -394,7 +384,7 @@ class ExpandedLogDialog:
         for _, row in df.iterrows():
             values = []
             for col in self.log_columns:
-                values.append(str(row.get(col, '')))
+                values.append(display_value(row.get(col, '')))
             
             self.log_info_tree.insert('', 'end', values=values)
     '''
@@ -412,7 +402,7 @@ class ExpandedLogDialog:
         for index, row in df.iterrows():  # Keep index for tracking
             values = []
             for col in self.parent.log_columns:
-                values.append(str(row.get(col, '')))
+                values.append(display_value(row.get(col, '')))
 
             # Insert row into Treeview, using the original DataFrame index as the iid
             self.log_info_tree.insert('', 'end', iid=str(index), text=str(index), values=values)
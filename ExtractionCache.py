@@ -0,0 +1,164 @@
+import logging
+import os
+import shutil
+import threading
+import time
+
+import myUtils
+from BundleCache import fingerprint
+from BundleReader import open_bundle
+
+logger = logging.getLogger("SRWAnalyzer")
+
+# Extraction cache settings (config.json):
+#   extract_cache_dir - where extracted files are kept; "" = per-user default
+#   extract_cache_mb  - total size the extracted files may grow to
+DEFAULT_CACHE_MB = 4096
+
+# Touched whenever an entry is used, for LRU eviction
+USED_FILE = ".last_used"
+# Suffix of entries renamed out of the way and waiting to be deleted
+DELETING_SUFFIX = ".deleting"
+
+
+class ExtractionCache:
+    """Files extracted from SRWs, kept on disk for tools that need a real path.
+
+    Every bundle gets its own directory named after its ``fingerprint``, so
+    switching between SRWs reuses what was already extracted and an unchanged
+    zip is never extracted twice.  Only the requested members are extracted.
+    Old entries are evicted least recently used first once the cache grows
+    past ``extract_cache_mb``; deletion happens on a background thread so the
+    UI never waits on it.
+    """
+
+    def __init__(self, cache_dir=None, max_mb=None):
+        if cache_dir is None:
+            cache_dir = myUtils.get_config_value("extract_cache_dir", "") or myUtils.app_data_dir("extracted")
+        if max_mb is None:
+            max_mb = myUtils.get_config_value("extract_cache_mb", DEFAULT_CACHE_MB)
+        self.cache_dir = cache_dir
+        try:
+            self.max_bytes = int(float(max_mb) * 1024 * 1024)
+        except (TypeError, ValueError):
+            logger.warning(f"Invalid extract_cache_mb value '{max_mb}'. Using {DEFAULT_CACHE_MB}.")
+            self.max_bytes = DEFAULT_CACHE_MB * 1024 * 1024
+        self._lock = threading.Lock()
+        self._keys = {}
+
+        # Finish deleting anything a previous session left behind
+        self._remove_async([
+            os.path.join(cache_dir, name)
+            for name in (os.listdir(cache_dir) if os.path.isdir(cache_dir) else [])
+            if DELETING_SUFFIX in name
+        ])
+
+    def directory(self, zip_path):
+        """Return the directory files from ``zip_path`` are extracted to."""
+        stat = os.stat(zip_path)
+        cache_key = (os.path.abspath(zip_path), stat.st_size, stat.st_mtime_ns)
+        key = self._keys.get(cache_key)
+        if key is None:
+            key = self._keys[cache_key] = fingerprint(zip_path)[:32]
+        return os.path.join(self.cache_dir, key)
+
+    def extract(self, zip_path, names):
+        """Extract ``names`` from an SRW, reusing files already extracted.
+
+        Names are as listed by ``BundleReader`` (so files in nested zips work
+        too).  Returns the paths of the extracted files, in order.
+        """
+        bundle = open_bundle(zip_path)
+        entry = self.directory(zip_path)
+        paths = []
+        with self._lock:
+            os.makedirs(entry, exist_ok=True)
+            for name in names:
+                path = os.path.join(entry, *name.split('/'))
+                if not os.path.exists(path) or os.path.getsize(path) != bundle.size(name):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    partial = f"{path}.{os.getpid()}.part"
+                    with bundle.open(name) as source, open(partial, 'wb') as target:
+                        shutil.copyfileobj(source, target, 1024 * 1024)
+                    os.replace(partial, path)
+                paths.append(path)
+
+            # The marker's mtime is the entry's last use
+            with open(os.path.join(entry, USED_FILE), 'w'):
+                pass
+
+        self.evict(keep=entry)
+        return paths
+
+    def extract_file(self, zip_path, name):
+        """Extract one file and return its path."""
+        return self.extract(zip_path, [name])[0]
+
+    def extract_manifest(self, zip_path, manifest=myUtils.ANALYZER_MANIFEST):
+        """Extract the top-level files matching ``manifest`` and return their directory.
+
+        By default that is every file the analyzer reads, laid out as in the
+        SRW, for code that still wants an extracted bundle.
+        """
+        bundle = open_bundle(zip_path)
+        self.extract(zip_path, [name for name in sorted(bundle.listdir()) if myUtils.in_manifest(name, manifest)])
+        return self.directory(zip_path)
+
+    def evict(self, keep=None):
+        """Remove least recently used entries until the cache fits its budget."""
+        if not os.path.isdir(self.cache_dir):
+            return
+
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            entry = os.path.join(self.cache_dir, name)
+            if DELETING_SUFFIX in name or not os.path.isdir(entry):
+                continue
+            used = os.path.join(entry, USED_FILE)
+            last_used = os.path.getmtime(used) if os.path.exists(used) else 0
+            entries.append((last_used, myUtils.dir_size(entry), entry))
+
+        total = sum(size for _, size, _ in entries)
+        doomed = []
+        for _, size, entry in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if entry == keep:
+                continue
+            logger.info(f"Evicting {entry} from the extraction cache.")
+            doomed.append(entry)
+            total -= size
+        self._remove_async(doomed)
+
+    def clear(self):
+        """Remove every extracted bundle in the background."""
+        if os.path.isdir(self.cache_dir):
+            self._remove_async([os.path.join(self.cache_dir, name) for name in os.listdir(self.cache_dir)])
+
+    def _remove_async(self, paths):
+        """Delete directories on a background thread.
+
+        Each one is first renamed aside, which is instant, so its name is free
+        to be extracted into again while the files are still being deleted.
+        """
+        doomed = []
+        for path in paths:
+            if DELETING_SUFFIX not in os.path.basename(path):
+                aside = f"{path}{DELETING_SUFFIX}.{os.getpid()}.{time.monotonic_ns()}"
+                try:
+                    os.replace(path, aside)
+                except OSError as e:
+                    logger.warning(f"Could not move {path} aside for deletion: {e}")
+                    continue
+                path = aside
+            doomed.append(path)
+
+        if doomed:
+            threading.Thread(target=_remove_all, args=(doomed,), name="extraction-cleanup", daemon=True).start()
+
+
+def _remove_all(paths):
+    for path in paths:
+        shutil.rmtree(path, ignore_errors=True)
+        if os.path.exists(path):
+            logger.warning(f"Could not fully remove {path} from the extraction cache.")
@@ -79,3 +79,31 @@ support_issue_types = [
     "Web Client",
     "Other"
 ]
+
+# Known failure signatures for IssueScanner. 'pattern' is a plain substring
+# unless 'regex' is true; matching ignores case unless 'match_case' is true.
+known_issues = [
+    {'name': "License server unreachable", 'issue_type': "Licensing", 'pattern': "unable to connect to the license server"},
+    {'name': "License server unreachable", 'issue_type': "Licensing", 'pattern': "license server is not responding"},
+    {'name': "No licenses available", 'issue_type': "Licensing", 'pattern': "no licenses are available"},
+    {'name': "No licenses available", 'issue_type': "Licensing", 'pattern': "all licenses are in use"},
+    {'name': "License expired", 'issue_type': "Licensing", 'pattern': r"licen[cs]e (?:has )?expired", 'regex': True},
+    {'name': "Wrong user name or password", 'issue_type': "Other", 'pattern': "the user name or password is incorrect"},
+    {'name': "Access denied", 'issue_type': "Other", 'pattern': "access is denied"},
+    {'name': "Connection reset by client", 'issue_type': "Session Disconnect", 'pattern': "connection was forcibly closed by the remote host"},
+    {'name': "Connection timed out", 'issue_type': "Session Disconnect", 'pattern': "connected party did not properly respond"},
+    {'name': "Session disconnected", 'issue_type': "Session Disconnect", 'pattern': r"session .* (?:was )?disconnected", 'regex': True},
+    {'name': "Duplicate share connection", 'issue_type': "Session Disconnect", 'pattern': "multiple connections to a server or shared resource"},
+    {'name': "Application crashed", 'issue_type': "Crash / Hang - Application", 'pattern': r"exited with code (?:-\d+|3221\d{6}|0x[cC]\w{7})\b", 'regex': True},
+    {'name': "Application not responding", 'issue_type': "Crash / Hang - Application", 'pattern': "is not responding"},
+    {'name': "GO-Global process crashed", 'issue_type': "Crash / Hang - GO-Global", 'pattern': r"\b(?:aps|ggrunner|ggrpc)\.exe\b.*\b(?:crash|unhandled exception|access violation)", 'regex': True},
+    {'name': "Dump file written", 'issue_type': "Crash / Hang - GO-Global", 'pattern': r"\.dmp\b", 'regex': True},
+    {'name': "Out of memory", 'issue_type': "Performance", 'pattern': "not enough memory"},
+    {'name': "Out of memory", 'issue_type': "Performance", 'pattern': "out of memory"},
+    {'name': "Printer creation failed", 'issue_type': "Printing", 'pattern': r"(?:unable to|failed to|could not) (?:create|add|install) (?:the )?printer", 'regex': True},
+    {'name': "Print job failed", 'issue_type': "Printing", 'pattern': r"print job .*(?:failed|error)", 'regex': True},
+    {'name': "OpenID Connect sign-in failed", 'issue_type': "OpenID Connect", 'pattern': r"(?:openid|oidc)\b.*(?:fail|error|invalid)", 'regex': True},
+    {'name': "Certificate problem", 'issue_type': "Web Client", 'pattern': r"certificate (?:has expired|is not valid|chain|verify failed)", 'regex': True},
+    {'name': "Published application failed to start", 'issue_type': "Published Application", 'pattern': r"(?:failed to start|could not start|unable to start) (?:the )?(?:application|process)", 'regex': True},
+    {'name': "Admin Console error", 'issue_type': "Admin Console", 'pattern': "admin console"},
+]
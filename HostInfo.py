@@ -3,6 +3,7 @@ import re
 from venv import logger
 
 import GOGlobal
+import TextDecoding
 
 
 class HostInfo:
@@ -20,14 +21,13 @@ class HostInfo:
                 for reg_file in reg_files:
                     reg_file_path = os.path.join(path, reg_file)
                     try:
-                        with open(reg_file_path, 'r', encoding='utf-16') as file:
-                            for line in file:
-                                if "ServerRole" in line:
-                                    try:
-                                        self.role = GOGlobal.server_roles[int(line.split(':')[1].strip())]
-                                        break
-                                    except (ValueError, IndexError):
-                                        logger.exception("Error parsing ServerRole value")
+                        for line in TextDecoding.iter_lines(reg_file_path):
+                            if "ServerRole" in line:
+                                try:
+                                    self.role = GOGlobal.server_roles[int(line.split(':')[1].strip())]
+                                    break
+                                except (ValueError, IndexError):
+                                    logger.exception("Error parsing ServerRole value")
                         if self.role:  # If we found the server role, no need to check other files
                             break
                     except Exception as e:
@@ -36,12 +36,11 @@ class HostInfo:
                 ipconfig_path = os.path.join(path, 'ipconfig.txt')
                 if os.path.exists(ipconfig_path):
                     try:
-                        with open(ipconfig_path, 'r') as file:
-                            for line in file:
-                                match = re.search(r'IPv4.*?:\s*([\d\.]+)', line) #IPv4 will be the same across any language (hopefully)
-                                if match:
-                                    self.ip = match.group(1)
-                                    break  # Stop reading after the first match
+                        for line in TextDecoding.iter_lines(ipconfig_path):
+                            match = re.search(r'IPv4.*?:\s*([\d\.]+)', line) #IPv4 will be the same across any language (hopefully)
+                            if match:
+                                self.ip = match.group(1)
+                                break  # Stop reading after the first match
                     except (FileNotFoundError, PermissionError, OSError) as e:
                         logger.exception(f"Failed to read {ipconfig_path}: {e}. Setting server IP to default value.")
                         self.ip = "0.0.0.0"  # Default IP value if reading fails
@@ -49,15 +48,14 @@ class HostInfo:
                 try:
                     sysInfo_path = os.path.join(path, "SystemInformation.txt")
                     
-                    with open(sysInfo_path) as file:
-                        lines = file.readlines()
-                        if len(lines) > 3:
-                            self.name = lines[1].split(":")[1].strip()
-                            self.os = lines[2].split(":")[1].strip()
-                            self.platform_build = lines[3].split(":")[1].strip()
-                        else:
-                            logger.info(f"SystemInformation.txt is not of sufficient length to find the needed info.")
-                            return ""
+                    lines = TextDecoding.read_text(sysInfo_path).splitlines()
+                    if len(lines) > 3:
+                        self.name = lines[1].split(":")[1].strip()
+                        self.os = lines[2].split(":")[1].strip()
+                        self.platform_build = lines[3].split(":")[1].strip()
+                    else:
+                        logger.info(f"SystemInformation.txt is not of sufficient length to find the needed info.")
+                        return ""
                 except Exception as e:
                     logger.exception(f"Error getting platform version from sysInfo: {e}")
                     return ""
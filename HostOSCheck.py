@@ -311,7 +311,8 @@ def check_zip_for_lic(zip_base_path, zip_file_name, license_data):
     z = os.path.join(zip_base_path, zip_file_name)
     with zipfile.ZipFile(z, 'r') as zip_ref:
         temp_dir = tempfile.mkdtemp(dir=zip_base_path)
-        myUtils.extract_zip(z, temp_dir)
+        # Only licenses and the zips that may hold them are searched below
+        myUtils.extract_zip(z, temp_dir, manifest=('*.lic', '*.zip'))
         search_directory(temp_dir, temp_dir)
 
     # Process the extracted license files if any were found
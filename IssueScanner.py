@@ -0,0 +1,268 @@
+import json
+import logging
+import re
+
+import GOGlobal
+import myUtils
+
+logger = logging.getLogger("SRWAnalyzer")
+
+# config.json: a JSON file with more rules in the shape of
+# GOGlobal.known_issues; they are added to the built-in ones
+DEFAULT_KNOWN_ISSUES_FILE = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from re import _constants as _sre_constants, _parser as _sre_parse
+except ImportError:  # before Python 3.11
+    import sre_constants as _sre_constants
+    import sre_parse as _sre_parse
+
+
+def load_rules():
+    """Return the built-in rules plus any from the ``known_issues_file`` setting."""
+    rules = list(GOGlobal.known_issues)
+    path = myUtils.get_config_value("known_issues_file", DEFAULT_KNOWN_ISSUES_FILE)
+    if path:
+        with open(path, 'r', encoding='utf-8') as rules_file:
+            rules.extend(json.load(rules_file))
+    return rules
+
+
+def required_literal(pattern, min_length=3):
+    """Return the longest literal text every match of ``pattern`` must contain, or None.
+
+    Only plain runs of characters outside any alternation or repeat count, so
+    ``r"licen[cs]e (?:has )?expired"`` gives ``"expired"`` and ``r"a|bcd"``
+    gives None.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern)
+    except Exception:
+        return None
+
+    runs = []
+
+    def walk(items):
+        run = []
+        for op, value in items:
+            if op is _sre_constants.LITERAL:
+                run.append(chr(value))
+                continue
+            runs.append(''.join(run))
+            run = []
+            # A group is required text too, as long as it is a plain sequence
+            if op is _sre_constants.SUBPATTERN:
+                walk(value[-1])
+        runs.append(''.join(run))
+
+    walk(parsed)
+    longest = max(runs, key=len, default='')
+    return longest if len(longest) >= min_length else None
+
+
+def _trie_pattern(words):
+    """Build one regex matching any of ``words``, with shared prefixes factored out.
+
+    Without pyahocorasick this stands in for the automaton: ``re`` tries
+    every branch of a flat alternation at every position, but branches of a
+    trie only where the text so far matches.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node):
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        if '' in node:
+            # A whole word ends here, so nothing more is needed
+            return '(?:' + pattern + ')?'
+        return pattern
+
+    return re.compile(build(trie))
+
+
+def _regex_passes(regexes):
+    """Return the fewest regexes that together find every one of ``regexes``.
+
+    Each pattern is scoped to its own case flag and joined into one
+    alternation.  A pattern that would change meaning or fail to compile
+    in there is kept as its own pass instead: global inline flags are only
+    allowed at the very start of a pattern, and group numbers shift once
+    patterns are joined.
+    """
+    pieces, passes = [], []
+    for regex in regexes:
+        piece = f"(?{'i' if regex.flags & re.IGNORECASE else ''}:{regex.pattern})"
+        if regex.groups and re.search(r"\\[1-9]|\(\?P=", regex.pattern):
+            passes.append(regex)
+            continue
+        try:
+            re.compile(piece)
+        except re.error:
+            passes.append(regex)
+            continue
+        pieces.append(piece)
+
+    if len(pieces) == 1:
+        passes.append(re.compile(pieces[0]))
+    elif pieces:
+        try:
+            passes.append(re.compile("|".join(pieces)))
+        except re.error as e:
+            # Named groups repeated across rules, for one
+            logger.warning(f"Could not combine the issue patterns ({e}); searching for each on its own.")
+            passes.extend(re.compile(piece) for piece in pieces)
+    return passes
+
+
+class IssueScanner:
+    """Matches every known-issue rule against log descriptions in one pass.
+
+    Plain-substring rules go into one Aho-Corasick automaton (when
+    ``pyahocorasick`` is installed; otherwise one regex built from a trie of
+    them).  Regex rules with a required literal (see ``required_literal``)
+    put that literal in the automaton too and are only run on descriptions
+    containing it; the rest are combined into one alternation.  So each
+    description is scanned once or twice no matter how many rules there
+    are, and descriptions repeat a lot, so each distinct one is scanned once.
+
+    Rules that cannot be combined (global inline flags such as ``(?m)``,
+    numbered backreferences) are searched for on their own.
+    """
+
+    def __init__(self, rules=None):
+        self.rules = load_rules() if rules is None else list(rules)
+
+        # needle -> [(rule index, compiled regex to confirm, or None)].
+        # Needles are lower case and searched for in lowered descriptions;
+        # case-sensitive rules confirm the match against the original text.
+        self._needles = {}
+        unanchored = []
+        for i, rule in enumerate(self.rules):
+            flags = 0 if rule.get('match_case') else re.IGNORECASE
+            if rule.get('regex'):
+                regex = re.compile(rule['pattern'], flags)
+                needle = required_literal(rule['pattern'])
+                if needle is None:
+                    unanchored.append((i, regex))
+                else:
+                    self._needles.setdefault(needle.lower(), []).append((i, regex))
+            else:
+                confirm = re.compile(re.escape(rule['pattern'])) if flags == 0 else None
+                self._needles.setdefault(rule['pattern'].lower(), []).append((i, confirm))
+
+        self._unanchored = unanchored
+        self._regex_passes = _regex_passes([regex for _, regex in unanchored])
+
+        self._automaton = None
+        self._needle_any = None
+        if self._needles and ahocorasick is not None:
+            self._automaton = ahocorasick.Automaton()
+            for needle in self._needles:
+                self._automaton.add_word(needle, needle)
+            self._automaton.make_automaton()
+        elif self._needles:
+            self._needle_any = _trie_pattern(self._needles)
+
+    def _found_needles(self, lowered):
+        if self._automaton is not None:
+            return {needle for _, needle in self._automaton.iter(lowered)}
+        if self._needle_any is None or not self._needle_any.search(lowered):
+            return ()
+        return [needle for needle in self._needles if needle in lowered]
+
+    def match(self, description):
+        """Return the indexes into ``rules`` of every rule matching one description."""
+        hits = set()
+        for needle in self._found_needles(description.lower()):
+            for i, confirm in self._needles[needle]:
+                if confirm is None or confirm.search(description):
+                    hits.add(i)
+        if any(regex.search(description) for regex in self._regex_passes):
+            hits.update(i for i, regex in self._unanchored if regex.search(description))
+        return sorted(hits)
+
+    def match_codes(self, descriptions):
+        """Return ``(codes, {rule index: [codes of the distinct descriptions it matched]})``.
+
+        ``codes`` gives, for each description, its position among the
+        distinct ones, so ``np.isin(codes, matched)`` is a rule's row mask.
+        """
+        import pandas as pd
+
+        codes, uniques = pd.factorize(pd.Series(descriptions, dtype=object).fillna('').astype(str))
+        uniques = pd.Series(uniques, dtype=object)
+
+        # One pass per combined pattern picks out the candidates
+        candidates = pd.Series(False, index=uniques.index)
+        if self._automaton is not None:
+            candidates |= pd.Series([next(self._automaton.iter(text), None) is not None for text in uniques.str.lower()],
+                                    index=uniques.index)
+        elif self._needle_any is not None:
+            candidates |= uniques.str.lower().str.contains(self._needle_any, regex=True)
+        for regex in self._regex_passes:
+            candidates |= pd.Series([regex.search(text) is not None for text in uniques], index=uniques.index)
+
+        matched = {}
+        for code in candidates.index[candidates.to_numpy()]:
+            for i in self.match(uniques[code]):
+                matched.setdefault(i, []).append(code)
+        return codes, matched
+
+    def scan(self, logs):
+        """Return the potential issues in ``logs`` as ``generate_summary`` takes them.
+
+        ``logs`` is a log DataFrame or a list of log entries.  The result maps
+        each matching rule's name to its first matching entry (``Line``,
+        ``Date``, ``Time``, ``Description``, ``File``) plus ``Count`` and
+        ``Issue Type``.  Rules sharing a name are reported
+        together.
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not isinstance(logs, pd.DataFrame):
+            logs = pd.DataFrame([dict(log) for log in logs])
+        if logs.empty or 'Description' not in logs.columns:
+            return {}
+
+        codes, matched = self.match_codes(logs['Description'])
+        rows_by_name = {}
+        for i, unique_codes in matched.items():
+            name = self.rules[i]['name']
+            rows = np.flatnonzero(np.isin(codes, unique_codes))
+            rows_by_name[name] = np.union1d(rows_by_name[name], rows) if name in rows_by_name else rows
+
+        issues = {}
+        for rule in self.rules:
+            name = rule['name']
+            if name not in rows_by_name or name in issues:
+                continue
+            rows = rows_by_name[name]
+            first = logs.iloc[rows[0]]
+            issues[name] = {
+                'Line': first.get('Line'),
+                'Date': first.get('Date'),
+                'Time': first.get('Time'),
+                'Description': first.get('Description'),
+                'File': first.get('File'),
+                'Count': len(rows),
+                'Issue Type': rule.get('issue_type', "Other"),
+            }
+        return issues
+
+
+def scan_logs(logs, rules=None):
+    """Shortcut for ``IssueScanner(rules).scan(logs)``."""
+    return IssueScanner(rules).scan(logs)
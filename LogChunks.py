@@ -0,0 +1,148 @@
+from collections import namedtuple
+from contextlib import contextmanager
+import codecs
+import mmap
+import os
+import re
+
+import TextDecoding
+
+# A byte range of a log file that starts on a row (HTML) or line (.log)
+# boundary.  ``encoding`` is the codec to decode the range with: only the
+# first chunk still carries a byte order mark.  ``kind`` is "html" or "text".
+Chunk = namedtuple('Chunk', ['start', 'end', 'encoding', 'kind', 'first'])
+
+# Encodings whose ASCII characters are single bytes that never appear inside
+# a multi-byte character, so a row boundary can be found by searching bytes.
+_ASCII_SAFE = ('utf-8', 'ascii', 'latin-1', 'iso-8859', 'windows-125', 'cp125')
+
+
+def _body_encoding(encoding, data):
+    """Return ``(codec, unit)`` for decoding text after the start of the file.
+
+    ``unit`` is the size of one code unit; boundaries must be aligned to it.
+    Returns ``(None, None)`` for encodings that cannot be split safely.
+    """
+    encoding = codecs.lookup(encoding).name
+    if encoding == 'utf-16':
+        return ('utf-16-be', 2) if data[:2] == codecs.BOM_UTF16_BE else ('utf-16-le', 2)
+    if encoding in ('utf-16-le', 'utf-16-be'):
+        return encoding, 2
+    if encoding == 'utf-8-sig':
+        return 'utf-8', 1
+    if encoding.startswith(_ASCII_SAFE):
+        return encoding, 1
+    return None, None
+
+
+def _pattern(text, codec, ignore_case=False):
+    """Compile a bytes regex that finds ``text`` as encoded by ``codec``."""
+    parts = []
+    for char in text:
+        if ignore_case and char.lower() != char.upper():
+            variants = (char.lower().encode(codec), char.upper().encode(codec))
+            parts.append(b'(?:' + b'|'.join(re.escape(v) for v in variants) + b')')
+        else:
+            parts.append(re.escape(char.encode(codec)))
+    return re.compile(b''.join(parts))
+
+
+def _find_aligned(pattern, data, pos, unit, end=None):
+    """Find the next match of ``pattern`` that starts on a code unit boundary."""
+    end = len(data) if end is None else end
+    while True:
+        match = pattern.search(data, pos, end)
+        if not match:
+            return None
+        if match.start() % unit == 0:
+            return match
+        pos = match.start() + 1
+
+
+def plan_chunks(file_path, parts):
+    """Split a log into roughly ``parts`` byte ranges on safe boundaries.
+
+    ``.log`` files are cut just after a newline.  HTML logs are cut at the
+    start of a ``<tr>`` inside the ``LogEntries`` table, after its header row,
+    so every range except the first holds nothing but complete rows.  Returns
+    an empty list when the file is too small, uses an encoding whose bytes
+    cannot be searched safely, or has no ``LogEntries`` table.
+    """
+    size = os.path.getsize(file_path)
+    if parts < 2 or size == 0:
+        return []
+
+    kind = 'html' if file_path.lower().endswith('.html') else 'text'
+
+    with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        encoding = TextDecoding.sniff_encoding(bytes(data[:TextDecoding.ENCODING_SAMPLE_SIZE]))
+        codec, unit = _body_encoding(encoding, data)
+        if codec is None:
+            return []
+
+        if kind == 'html':
+            boundary = _pattern('<tr', codec, ignore_case=True)
+            anchor = _find_aligned(_pattern('LogEntries', codec), data, 0, unit)
+            if not anchor:
+                return []
+            header = _find_aligned(boundary, data, anchor.end(), unit)
+            first_row = header and _find_aligned(boundary, data, header.end(), unit)
+            if not first_row:
+                return []
+            table_end = _find_aligned(_pattern('</table', codec, ignore_case=True), data, first_row.start(), unit)
+            # Keep at least one data row in the first chunk
+            floor = first_row.end()
+            limit = table_end.start() if table_end else size
+            skip = 0
+        else:
+            boundary = _pattern('\n', codec)
+            floor = 0
+            limit = size
+            skip = unit
+
+        offsets = [0]
+        for k in range(1, parts):
+            target = max(size * k // parts, floor, offsets[-1] + 1)
+            # Start on a code unit so a UTF-16 search never begins mid-character
+            target += (-target) % unit
+            if target >= limit:
+                break
+            match = _find_aligned(boundary, data, target, unit, limit)
+            if not match:
+                break
+            cut = match.start() + (len(match.group(0)) if skip else 0)
+            if offsets[-1] < cut < size:
+                offsets.append(cut)
+
+    offsets.append(size)
+    if len(offsets) < 3:
+        return []
+
+    return [
+        Chunk(start, end, encoding if start == 0 else codec, kind, start == 0)
+        for start, end in zip(offsets, offsets[1:])
+    ]
+
+
+class _RangeReader:
+    """Binary file object limited to ``[start, end)`` of an open file."""
+
+    def __init__(self, file, start, end):
+        self.name = file.name
+        self._file = file
+        self._remaining = end - start
+        file.seek(start)
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._file.read(size)
+        self._remaining -= len(data)
+        return data
+
+
+@contextmanager
+def open_range(file_path, start, end):
+    """Open ``file_path`` for reading only the bytes in ``[start, end)``."""
+    with open(file_path, 'rb') as file:
+        yield _RangeReader(file, start, end)
@@ -0,0 +1,199 @@
+from itertools import islice
+
+import LogEvents
+
+# Every parser produces rows with these fields, in this order.  ``Line`` is an
+# int for ``.log`` files and the text of the first cell for HTML logs.
+COLUMNS = ('Line', 'Date', 'Time', 'User', 'Server', 'Process', 'PID', 'Session', 'Description', 'File')
+
+# Few distinct values repeated across every row
+CATEGORY_COLUMNS = ('File', 'User', 'Server', 'Process')
+# Numbers, with blanks becoming <NA>
+INTEGER_COLUMNS = ('Line', 'PID', 'Session')
+
+# Rows are transposed into the columns this many at a time, so only one batch
+# of row tuples is ever alive at once.
+_BATCH_SIZE = 65536
+
+
+class LogColumns:
+    """Parsed log entries held as one list per column.
+
+    Parsers hand over rows as plain tuples in ``COLUMNS`` order and the
+    columns are filled a batch at a time, so a bundle with millions of entries
+    never holds a dict per entry.  ``to_dataframe`` turns the lists into a
+    typed DataFrame in one step.
+    """
+
+    def __init__(self, rows=()):
+        self.columns = {name: [] for name in COLUMNS}
+        self.extend_rows(rows)
+
+    def __len__(self):
+        return len(self.columns['Line'])
+
+    def extend_rows(self, rows):
+        """Append an iterable of ``COLUMNS``-ordered tuples."""
+        rows = iter(rows)
+        while True:
+            batch = list(islice(rows, _BATCH_SIZE))
+            if not batch:
+                return
+            for column, values in zip(self.columns.values(), zip(*batch)):
+                column.extend(values)
+
+    def extend(self, other):
+        """Append every entry of another ``LogColumns``."""
+        for name, column in self.columns.items():
+            column.extend(other.columns[name])
+
+    def shift_lines(self, offset):
+        """Add ``offset`` to every ``Line``, for a chunk parsed on its own."""
+        if offset:
+            self.columns['Line'] = [line + offset for line in self.columns['Line']]
+
+    @classmethod
+    def from_records(cls, records):
+        """Build from entry dicts, e.g. the output of the BeautifulSoup path."""
+        return cls(tuple(record.get(name, '') for name in COLUMNS) for record in records)
+
+    def to_records(self):
+        """Return the entries as dicts, the shape ``log_info`` returns.
+
+        ``Line``/``PID``/``Session`` are ints (None when blank), as in
+        ``LogEntry``, whichever parser read them.
+        """
+        columns = [_integers(values) if name in INTEGER_COLUMNS else values for name, values in self.columns.items()]
+        return [dict(zip(COLUMNS, row)) for row in zip(*columns)]
+
+    def to_entries(self):
+        """Return the entries as compact ``LogEntry`` records."""
+        from LogEntry import entries_from_rows
+        return entries_from_rows(zip(*self.columns.values()))
+
+    def to_dataframe(self):
+        """Build the log DataFrame with its final dtypes.
+
+        ``File``/``User``/``Server``/``Process`` are categorical,
+        ``Line``/``PID``/``Session`` are nullable integers and ``DateTime`` is
+        parsed from the ``Date`` and ``Time`` columns directly rather than from
+        concatenated strings.  The ``LogEvents.EVENT_COLUMNS`` classifying each
+        description are added here too, so nothing rescans the descriptions.
+        """
+        # pandas is only needed in the UI process, not in parse workers
+        import pandas as pd
+
+        data = {}
+        for name in COLUMNS:
+            values = self.columns[name]
+            if name in CATEGORY_COLUMNS:
+                codes, categories = _factorize(values)
+                data[name] = pd.Categorical.from_codes(codes, categories=categories)
+            elif name == 'Line':
+                data[name] = pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').astype('Int64')
+            elif name in INTEGER_COLUMNS:
+                # PIDs and sessions repeat, so convert each distinct value once
+                codes, categories = _factorize(values)
+                numbers = pd.to_numeric(pd.Series(categories, dtype=object), errors='coerce').astype('Int64')
+                data[name] = numbers.array.take(codes)
+            else:
+                data[name] = pd.Series(values, dtype=object)
+
+        frame = pd.DataFrame(data)
+        codes, dates = _factorize(self.columns['Date'])
+        dates = pd.to_datetime(pd.Series(dates, dtype=object), format='%Y-%m-%d', errors='coerce')
+        frame['DateTime'] = dates.to_numpy().take(codes) + _time_of_day(self.columns['Time'])
+        return LogEvents.add_event_columns(frame)
+
+
+def concat_frames(frames):
+    """Concatenate log DataFrames, keeping the categorical columns categorical.
+
+    ``pd.concat`` falls back to object dtype when the categories differ, so
+    every column that is categorical in all frames is rebuilt from the union
+    of the categories.
+    """
+    import pandas as pd
+    from pandas.api.types import union_categoricals
+
+    frames = [frame for frame in frames if len(frame.columns)]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+
+    result = pd.concat(frames)
+    for name in frames[0].columns:
+        parts = [frame[name] for frame in frames if name in frame.columns]
+        if len(parts) == len(frames) and all(isinstance(part.dtype, pd.CategoricalDtype) for part in parts):
+            result[name] = union_categoricals(parts, sort_categories=True)
+    return result
+
+
+def _integers(values):
+    """Convert a column to ints (None when blank), once per distinct value."""
+    from LogEntry import _to_int
+    converted = {value: _to_int(value) for value in set(values)}
+    return [converted[value] for value in values]
+
+
+def _factorize(values):
+    """Return ``(codes, categories)`` with the categories sorted.
+
+    A dict lookup per value is quicker than ``pd.Categorical`` on a list of
+    Python strings, which first copies them into an object array.
+    """
+    import numpy as np
+
+    index = {}
+    codes = np.fromiter((index.setdefault(value, len(index)) for value in values), dtype=np.int32, count=len(values))
+    categories = list(index)
+    order = sorted(range(len(categories)), key=lambda i: str(categories[i]))
+    remap = np.empty(len(categories), dtype=np.int32)
+    remap[order] = np.arange(len(categories), dtype=np.int32)
+    return remap[codes], [categories[i] for i in order]
+
+
+def _time_of_day(values):
+    """Convert ``HH:MM:SS.fff`` strings to a timedelta64[ms] array.
+
+    APS times are fixed width, so the digits are read straight out of a numpy
+    character array; ``pd.to_timedelta`` on strings was the slowest part of
+    building the frame.  Any value not in that form goes through
+    ``pd.to_timedelta`` and becomes NaT if it cannot be read.
+    """
+    import numpy as np
+    import pandas as pd
+
+    text = np.array(values, dtype='U13')
+    if not len(text):
+        return np.array([], dtype='timedelta64[ms]')
+
+    digits = text.view(np.uint32).reshape(len(text), 13)[:, :12].astype(np.int64) - ord('0')
+    valid = (
+        (np.char.str_len(text) == 12)
+        & (digits[:, 2] == ord(':') - ord('0'))
+        & (digits[:, 5] == ord(':') - ord('0'))
+        & (digits[:, 8] == ord('.') - ord('0'))
+        & ((digits[:, [0, 1, 3, 4, 6, 7, 9, 10, 11]] >= 0) & (digits[:, [0, 1, 3, 4, 6, 7, 9, 10, 11]] <= 9)).all(axis=1)
+    )
+
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    minutes = digits[:, 3] * 10 + digits[:, 4]
+    seconds = digits[:, 6] * 10 + digits[:, 7]
+    millis = digits[:, 9] * 100 + digits[:, 10] * 10 + digits[:, 11]
+    result = (((hours * 60 + minutes) * 60 + seconds) * 1000 + millis).astype('timedelta64[ms]')
+
+    if not valid.all():
+        invalid = ~valid
+        fallback = pd.to_timedelta(pd.Series(text[invalid], dtype=object), errors='coerce')
+        result[invalid] = fallback.to_numpy(dtype='timedelta64[ms]')
+    return result
+
+
+def display_value(value):
+    """Render a DataFrame cell for the tree views, showing missing values as ''."""
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    text = str(value)
+    return '' if text in ('<NA>', 'NaT') else text
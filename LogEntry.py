@@ -0,0 +1,81 @@
+from collections.abc import Mapping
+import sys
+
+from LogColumns import COLUMNS
+
+
+def _to_int(value):
+    """Return ``value`` as an int, None when blank, or unchanged if it is not a number."""
+    if value is None or isinstance(value, int):
+        return value
+    value = value.strip()
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+class LogEntry(Mapping):
+    """One parsed log entry, stored in slots instead of a dict.
+
+    ``File``/``User``/``Server``/``Process``/``Date`` are interned and
+    ``Line``/``PID``/``Session`` are ints (None when blank), so an entry
+    costs a fraction of the ten-key dict the parsers used to return.  It is
+    a read-only ``Mapping`` with the same keys, so ``entry['User']``,
+    ``entry.get('Description', '')`` and ``dict(entry)`` still work.
+    """
+    __slots__ = COLUMNS
+
+    def __init__(self, Line=None, Date='', Time='', User='', Server='', Process='', PID=None, Session=None,
+                 Description='', File=''):
+        set_slot = object.__setattr__
+        set_slot(self, 'Line', _to_int(Line))
+        set_slot(self, 'Date', sys.intern(Date or ''))
+        set_slot(self, 'Time', Time or '')
+        set_slot(self, 'User', sys.intern(User or ''))
+        set_slot(self, 'Server', sys.intern(Server or ''))
+        set_slot(self, 'Process', sys.intern(Process or ''))
+        set_slot(self, 'PID', _to_int(PID))
+        set_slot(self, 'Session', _to_int(Session))
+        set_slot(self, 'Description', Description or '')
+        set_slot(self, 'File', sys.intern(File or ''))
+
+    @classmethod
+    def from_row(cls, row):
+        """Build from a ``COLUMNS``-ordered tuple, as the parsers yield them."""
+        return cls(*row)
+
+    @classmethod
+    def from_record(cls, record):
+        """Build from an entry dict."""
+        return cls(**{name: record.get(name) for name in COLUMNS})
+
+    def __setattr__(self, name, value):
+        raise AttributeError("LogEntry is read-only")
+
+    def __getitem__(self, key):
+        if key not in COLUMNS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self):
+        return iter(COLUMNS)
+
+    def __len__(self):
+        return len(COLUMNS)
+
+    def __contains__(self, key):
+        return key in COLUMNS
+
+    def __reduce__(self):
+        return (LogEntry, tuple(getattr(self, name) for name in COLUMNS))
+
+    def __repr__(self):
+        return f"LogEntry({', '.join(f'{name}={getattr(self, name)!r}' for name in COLUMNS)})"
+
+
+def entries_from_rows(rows):
+    """Return a list of ``LogEntry`` for an iterable of row tuples."""
+    return [LogEntry(*row) for row in rows]
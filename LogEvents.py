@@ -0,0 +1,69 @@
+import re
+
+# Values of the EventType column
+CLIENT_CONNECT = 'client_connect'
+CLIENT_VERSION = 'client_version'
+SESSION_LOGON = 'session_logon'
+SESSION_STOP = 'session_stop'
+OTHER = 'other'
+EVENT_TYPES = (CLIENT_CONNECT, CLIENT_VERSION, SESSION_LOGON, SESSION_STOP, OTHER)
+
+# Columns added next to Description
+EVENT_COLUMNS = ('EventType', 'ClientIP', 'ClientOS', 'ClientVersion', 'EventSession')
+
+# Every event the analyzer looks for, in one pattern so each description is
+# scanned once.  Each alternative has a marker group naming its event type.
+EVENT_PATTERN = re.compile(
+    r"(?P<client_connect>A client at IP address (?P<ClientIP>\d+\.\d+\.\d+\.\d+))"
+    r"|(?P<client_version>The version of the (?P<ClientOS>.*?) client is (?P<ClientVersion>\d+\.\d+\.\d+\.\d+))"
+    r"|(?P<session_logon>(?i:logged on to session)\s*(?P<EventSession>\d+)?)"
+    r"|(?P<session_stop>(?i:Session\s+[\"']?.+?[\"']?\s+stopped\.))"
+)
+_MARKERS = (CLIENT_CONNECT, CLIENT_VERSION, SESSION_LOGON, SESSION_STOP)
+
+
+def classify(descriptions):
+    """Classify log descriptions into a DataFrame of ``EVENT_COLUMNS``.
+
+    Runs ``EVENT_PATTERN`` over all of them at once with ``str.extract``.
+    ``EventType`` and the client columns are categorical and
+    ``EventSession`` (the session a user logged on to) is a nullable
+    integer.  The result has the same index as ``descriptions`` when it is a
+    Series.
+    """
+    import pandas as pd
+
+    if not isinstance(descriptions, pd.Series):
+        descriptions = pd.Series(list(descriptions), dtype=object)
+
+    # Descriptions repeat a lot, so each distinct one is matched once and the
+    # results are spread back out by code
+    codes, uniques = pd.factorize(descriptions.astype(object).fillna(''))
+    extracted = pd.Series(uniques, dtype=object).str.extract(EVENT_PATTERN)
+
+    event_type = pd.Series(OTHER, index=extracted.index, dtype=object)
+    # Only one alternative matches, so at most one marker is set per row
+    for marker in _MARKERS:
+        event_type[extracted[marker].notna()] = marker
+
+    events = pd.DataFrame(index=descriptions.index)
+    events['EventType'] = pd.Categorical(event_type, categories=EVENT_TYPES).take(codes)
+    for name in ('ClientIP', 'ClientOS', 'ClientVersion'):
+        events[name] = extracted[name].str.strip().astype('category').array.take(codes)
+    events['EventSession'] = pd.to_numeric(extracted['EventSession'], errors='coerce').astype('Int64').array.take(codes)
+    return events
+
+
+def add_event_columns(frame):
+    """Add the ``EVENT_COLUMNS`` for ``frame['Description']`` to ``frame``."""
+    events = classify(frame['Description'])
+    for name in EVENT_COLUMNS:
+        frame[name] = events[name]
+    return frame
+
+
+def client_versions(descriptions):
+    """Return ``(version, client OS)`` for every client version line, in order."""
+    events = classify(descriptions)
+    versions = events[events['EventType'] == CLIENT_VERSION]
+    return list(zip(versions['ClientVersion'].astype(str), versions['ClientOS'].astype(str)))
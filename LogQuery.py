@@ -0,0 +1,226 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+from SearchIndex import REGEX_CHARS, _tokens_required
+
+# Query field -> log column.  Unlisted words before a ':' are an error
+# rather than a silent miss.
+FIELDS = {
+    'user': 'User',
+    'server': 'Server',
+    'process': 'Process',
+    'proc': 'Process',
+    'pid': 'PID',
+    'session': 'Session',
+    'sess': 'Session',
+    'line': 'Line',
+    'file': 'File',
+    'desc': 'Description',
+    'description': 'Description',
+    'msg': 'Description',
+    'event': 'EventType',
+    'type': 'EventType',
+    'ip': 'ClientIP',
+    'os': 'ClientOS',
+    'version': 'ClientVersion',
+    'error': 'ErrorMeaning',
+    'date': 'DateTime',
+    'time': 'DateTime',
+}
+# Matched by exact value (or a [lo..hi] range), not by substring
+INTEGER_COLUMNS = ('Line', 'PID', 'Session')
+# Words without a field search here
+DEFAULT_COLUMN = 'Description'
+
+# [-][field:][=]value, where value is /regex/, [lo..hi], "quoted text" or a word
+TERM_PATTERN = re.compile(r'''
+    (?P<negate>-)?
+    (?:(?P<field>[A-Za-z]+):)?
+    (?P<exact>=)?
+    (?P<value>/(?:\\.|[^/\\])*/ | \[[^\]]*\] | "[^"]*" | [^\s"]+)
+''', re.VERBOSE)
+
+TIME_OF_DAY_PATTERN = re.compile(r"(\d{1,2}):(\d{2})(?::(\d{2})(?:[.,](\d{1,6}))?)?")
+DATE_PATTERN = re.compile(r"(\d{4}-\d{2}-\d{2})(?:[ T](.+))?")
+
+MINUTE_NS = 60 * 10 ** 9
+DAY_NS = 24 * 60 * MINUTE_NS
+
+
+class QueryError(ValueError):
+    """A log query that cannot be read; the message says which part."""
+
+
+def parse(text):
+    """Split a query into ``(column, kind, value, exact, negate)`` terms.
+
+    ``kind`` is 'regex', 'range' (value is ``(lo, hi)``, one of them may
+    be None) or 'text'.  Raises QueryError on unknown fields, ranges with
+    no bounds and unterminated quotes, regexes or ranges.
+    """
+    terms = []
+    position = 0
+    while True:
+        while position < len(text) and text[position].isspace():
+            position += 1
+        if position == len(text):
+            return terms
+        found = TERM_PATTERN.match(text, position)
+        if found is None:
+            raise QueryError(f"Cannot read the query from: {text[position:]}")
+        position = found.end()
+        term = found.group(0)
+        if position < len(text) and not text[position].isspace():
+            raise QueryError(f"Unterminated or malformed term: {term}{text[position:].split()[0]}")
+
+        field, value = found.group('field'), found.group('value')
+        if field is None:
+            column = DEFAULT_COLUMN
+        elif field.lower() in FIELDS:
+            column = FIELDS[field.lower()]
+        else:
+            raise QueryError(f"Unknown field '{field}'. Known fields: {', '.join(sorted(FIELDS))}")
+
+        if len(value) > 1 and value[0] == value[-1] == '/':
+            kind, value = 'regex', value[1:-1]
+        elif value.startswith('[') and value.endswith(']'):
+            bounds = value[1:-1].split('..')
+            if len(bounds) != 2:
+                raise QueryError(f"A range needs the form [from..to]: {term}")
+            kind, value = 'range', tuple(bound.strip() or None for bound in bounds)
+            if value == (None, None):
+                raise QueryError(f"Give at least one bound: {term}")
+        elif len(value) > 1 and value[0] == value[-1] == '"':
+            kind, value = 'text', value[1:-1]
+        elif value[0] in '/["':
+            raise QueryError(f"Unterminated {value[0]} in: {term}")
+        else:
+            kind = 'text'
+        terms.append((column, kind, value, found.group('exact') is not None, found.group('negate') is not None))
+
+
+def query_mask(text, index):
+    """Return the boolean row mask of ``index.frame`` matching every term of ``text``.
+
+    ``index`` is the bundle's SearchIndex.  Words without a field are
+    case-insensitive substrings of Description; ``field:value`` is a
+    substring of that column, ``field:=value`` the exact value (ignoring
+    case) and ``field:/regex/`` a case-insensitive regex.  Integer fields
+    (pid, session, line) take exact values, looked up in a hash of their
+    distinct values.  ``time:`` and ``date:`` take ``[from..to]`` ranges
+    or single values, as dates, times of day (every day of the log;
+    ``[23:00..01:00]`` runs past midnight) or both, and are answered by
+    binary search in the sorted DateTime column.  A leading ``-`` excludes
+    a term's matches.  Terms are ANDed.
+    """
+    mask = np.ones(index.size, dtype=bool)
+    for column, kind, value, exact, negate in parse(text):
+        if column not in index.frame.columns:
+            raise QueryError(f"This bundle's logs have no {column} column")
+        matched = _term_rows(index, column, kind, value, exact)
+        mask &= ~matched if negate else matched
+        if not mask.any():
+            break
+    return mask
+
+
+def _term_rows(index, column, kind, value, exact):
+    if column == 'DateTime':
+        return _time_rows(index, kind, value)
+
+    if kind == 'regex':
+        try:
+            re.compile(value)
+        except re.error as e:
+            raise QueryError(f"Invalid regex /{value}/: {e}") from None
+        if _tokens_required(value):
+            # Lowered, it still uses the column's token index
+            return index.column(column).rows(value.lower(), regex=bool(REGEX_CHARS.intersection(value)))
+        return index.column(column).rows(f"(?i){value}", regex=True)
+
+    if column in INTEGER_COLUMNS:
+        if kind == 'range':
+            lo, hi = (_integer(column, bound) for bound in value)
+            values = index.frame[column]
+            matched = values.notna()
+            if lo is not None:
+                matched &= values >= lo
+            if hi is not None:
+                matched &= values <= hi
+            return matched.to_numpy(dtype=bool, na_value=False)
+        return index.column(column).equal_rows(str(_integer(column, value)))
+
+    if kind == 'range':
+        raise QueryError(f"Ranges only work on time, date, pid, session and line, not {column}")
+    if exact:
+        return index.column(column).equal_rows(value)
+    return index.column(column).rows(value.lower(), regex=False)
+
+
+def _integer(column, text):
+    if text is None:
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        raise QueryError(f"{column} takes whole numbers, not '{text}'") from None
+
+
+def _time_rows(index, kind, value):
+    if kind == 'regex':
+        raise QueryError("time and date take values or [from..to] ranges, not regexes")
+    if kind == 'range':
+        lo, hi = (None if bound is None else _parse_time(bound) for bound in value)
+    else:
+        lo = hi = _parse_time(value)
+
+    daily = {bound[2] for bound in (lo, hi) if bound is not None}
+    if len(daily) > 1:
+        raise QueryError("Use dates on both ends of a range, or times of day on both")
+
+    # Bounds are (start, length, daily); the upper bound covers its whole
+    # minute, second or day, so [10:00..10:05] includes 10:05:30
+    start = np.iinfo(np.int64).min if lo is None else lo[0]
+    end = np.iinfo(np.int64).max if hi is None else hi[0] + hi[1]
+    if not daily.pop():
+        return index.time_rows(np.array([start]), np.array([end]))
+
+    times, _ = index.sorted_times()
+    if not len(times):
+        return np.zeros(index.size, dtype=bool)
+    start = 0 if lo is None else start
+    end = DAY_NS if hi is None else end
+    if end <= start:
+        # Runs past midnight into the next day
+        end += DAY_NS
+    days = np.arange(times[0] // DAY_NS - 1, times[-1] // DAY_NS + 1, dtype=np.int64) * DAY_NS
+    return index.time_rows(days + start, days + end)
+
+
+def _parse_time(text):
+    """Return ``(nanoseconds, length of the unit given, daily)`` for a date, date and time, or time of day."""
+    date = DATE_PATTERN.fullmatch(text)
+    time_of_day = text if date is None else date.group(2)
+    offset, length = 0, DAY_NS
+    if time_of_day is not None:
+        found = TIME_OF_DAY_PATTERN.fullmatch(time_of_day.strip())
+        if found is None:
+            raise QueryError(f"Not a time (HH:MM[:SS[.fff]]) or date (YYYY-MM-DD): '{text}'")
+        hours, minutes, seconds, fraction = found.groups()
+        if int(hours) > 23 or int(minutes) > 59 or int(seconds or 0) > 59:
+            raise QueryError(f"Not a time of day: '{text}'")
+        offset = (int(hours) * 60 + int(minutes)) * MINUTE_NS + int(seconds or 0) * 10 ** 9
+        if fraction:
+            offset += int(fraction.ljust(9, '0'))
+            length = 10 ** (9 - len(fraction))
+        else:
+            length = 10 ** 9 if seconds else MINUTE_NS
+    if date is None:
+        return offset, length, True
+    try:
+        day = pd.Timestamp(date.group(1)).value
+    except ValueError:
+        raise QueryError(f"Not a date: '{date.group(1)}'") from None
+    return day + offset, length, False
@@ -0,0 +1,257 @@
+"""Check that every log parser produces the same records, within budget.
+
+Each parser path in ``PARSERS`` is run over the same ``SyntheticSRW``
+corpus in its own process.  The records are normalized and hashed; any
+path whose hash differs from the first one fails, and the first differing
+record is printed.  Each run is also held to the time and peak memory
+budget for its corpus size (``parser_budgets`` in config.json overrides
+``DEFAULT_BUDGETS``).  Exits non-zero on any failure.
+
+    python ParserEquivalence.py --sizes 1 10
+
+A new parser is covered by adding a function to ``PARSERS``.
+"""
+import argparse
+import hashlib
+import multiprocessing
+import os
+import sys
+import tempfile
+import time
+
+import Benchmark
+import myUtils
+from LogColumns import COLUMNS
+
+DEFAULT_SIZES_MB = (1, 10)
+# Log files in the corpus are kept small so every path sees several of them
+CORPUS_FILE_MB = 4
+
+# Per corpus size (MB of logs): wall seconds and peak RSS allowed for one
+# parser path.  ``paths`` can hold tighter or looser limits for single paths.
+DEFAULT_BUDGETS = {
+    1: {'seconds': 30, 'rss_mb': 400, 'paths': {}},
+    10: {'seconds': 120, 'rss_mb': 1200, 'paths': {}},
+    100: {'seconds': 1200, 'rss_mb': 6000, 'paths': {}},
+}
+
+
+def _log_paths(corpus):
+    import ApsLogs
+
+    extracted_dir = corpus['extracted_dir']
+    return [os.path.join(extracted_dir, name) for name in sorted(os.listdir(extracted_dir)) if ApsLogs.is_log_file(name)]
+
+
+def _aps_log(corpus):
+    from ApsLog import ApsLog
+
+    for path in _log_paths(corpus):
+        yield from ApsLog(path).get_logs()
+
+
+def _aps_log_bs4(corpus):
+    from bs4 import BeautifulSoup
+    from ApsLog import ApsLog
+    import TextDecoding
+
+    for path in _log_paths(corpus):
+        log = ApsLog(path)
+        if path.endswith('.html'):
+            yield from log.extract_log_entries(BeautifulSoup(TextDecoding.read_text(path), 'html.parser'))
+        else:
+            yield from log.get_logs()
+
+
+def _parse_log_file(engine):
+    def parse(corpus):
+        import ApsLogs
+
+        for path in _log_paths(corpus):
+            yield from ApsLogs.parse_log_file(path, engine).to_records()
+    return parse
+
+
+def _log_info_dir(corpus):
+    import ApsLogs
+    return ApsLogs.log_info(corpus['extracted_dir'], workers=1)
+
+
+def _log_info_zip(corpus):
+    import ApsLogs
+    return ApsLogs.log_info(corpus['zip_path'], workers=1)
+
+
+def _log_info_pool(corpus):
+    import ApsLogs
+    # The corpora are below PARALLEL_MIN_BYTES, which would keep this in-process
+    return ApsLogs.log_info(corpus['extracted_dir'], workers=2, min_bytes=0)
+
+
+def _chunked(corpus):
+    import ApsLogs
+    import LogChunks
+
+    for path in _log_paths(corpus):
+        chunks = LogChunks.plan_chunks(path, 5)
+        if not chunks:
+            yield from ApsLogs.parse_log_file(path).to_records()
+            continue
+
+        offset = 0
+        for chunk in chunks:
+            columns, line_count = ApsLogs.parse_log_chunk(path, chunk)
+            columns.shift_lines(offset)
+            offset += line_count
+            yield from columns.to_records()
+
+
+# name -> function(corpus) returning the corpus's records in file order.
+# The first one is the reference the others are compared against.
+PARSERS = {
+    'ApsLog.get_logs': _aps_log,
+    'ApsLog.bs4': _aps_log_bs4,
+    'ApsLogs.parse_log_file[stream]': _parse_log_file('stream'),
+    'ApsLogs.parse_log_file[bs4]': _parse_log_file('bs4'),
+    'ApsLogs.log_info[folder]': _log_info_dir,
+    'ApsLogs.log_info[zip]': _log_info_zip,
+    'ApsLogs.log_info[pool]': _log_info_pool,
+    'ApsLogs.parse_log_chunk': _chunked,
+}
+
+
+def normalize(record):
+    """Reduce a record to the tuple of its field values, types included.
+
+    ``12`` and ``'12'`` differ here, so a path that hands out ``Line``,
+    ``PID`` or ``Session`` as text instead of ints fails the check.
+    """
+    return tuple(record.get(name) for name in COLUMNS)
+
+
+def _run(name, corpus, queue):
+    import ApsLog  # noqa: F401  (imports are not part of the timing)
+    import ApsLogs  # noqa: F401
+
+    start = time.perf_counter()
+    digest = hashlib.sha256()
+    count = 0
+    try:
+        for record in PARSERS[name](corpus):
+            digest.update(repr(normalize(record)).encode('utf-8'))
+            count += 1
+        error = None
+    except Exception as e:
+        error = repr(e)
+    seconds = time.perf_counter() - start
+    peak, workers = Benchmark.peak_rss()
+    queue.put({'count': count, 'digest': digest.hexdigest(), 'error': error, 'seconds': seconds,
+               'rss': max(peak or 0, workers or 0) or None})
+
+
+def run_parser(name, corpus):
+    """Run one parser path in a fresh process and return its result."""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_run, args=(name, corpus, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def first_difference(reference, name, corpus):
+    """Return a description of the first record where ``name`` differs from ``reference``."""
+    expected = [normalize(record) for record in PARSERS[reference](corpus)]
+    actual = [normalize(record) for record in PARSERS[name](corpus)]
+    for i, (left, right) in enumerate(zip(expected, actual)):
+        if left != right:
+            fields = [f"{column}: {a!r} != {b!r}" for column, a, b in zip(COLUMNS, left, right) if a != b]
+            return f"record {i}: " + "; ".join(fields)
+    return f"{len(expected)} records from {reference}, {len(actual)} from {name}"
+
+
+def load_budgets():
+    budgets = {size: dict(budget) for size, budget in DEFAULT_BUDGETS.items()}
+    for size, budget in (myUtils.get_config_value("parser_budgets", {}) or {}).items():
+        budgets.setdefault(float(size), {'paths': {}}).update(budget)
+    return budgets
+
+
+def budget_for(budgets, size_mb, name):
+    """Return the budget of the smallest configured size at least ``size_mb``."""
+    fitting = [size for size in budgets if size >= size_mb]
+    if not fitting:
+        return None
+    budget = budgets[min(fitting)]
+    return {**budget, **budget.get('paths', {}).get(name, {})}
+
+
+def prepare_corpus(data_dir, size_mb, seed=0):
+    """Generate (once) and extract the corpus for one size."""
+    import SyntheticSRW
+
+    zip_path = os.path.join(data_dir, f"equivalence_{size_mb:g}mb_seed{seed}.zip")
+    if not os.path.exists(zip_path):
+        print(f"Generating {zip_path} ...", flush=True)
+        SyntheticSRW.generate_srw(zip_path + ".part", log_mb=size_mb, file_mb=CORPUS_FILE_MB, seed=seed)
+        os.replace(zip_path + ".part", zip_path)
+
+    # ApsLog only reads files on disk
+    extracted_dir = os.path.splitext(zip_path)[0]
+    if not os.path.isdir(extracted_dir):
+        myUtils.extract_zip(zip_path, extracted_dir + ".part", manifest=('aps_*',))
+        os.replace(extracted_dir + ".part", extracted_dir)
+    return {'zip_path': zip_path, 'extracted_dir': extracted_dir}
+
+
+def check(sizes, parsers, data_dir, seed=0):
+    budgets = load_budgets()
+    failures = []
+    for size_mb in sizes:
+        corpus = prepare_corpus(data_dir, size_mb, seed)
+
+        reference = None
+        for name in parsers:
+            result = run_parser(name, corpus)
+            problems = []
+            if result['error']:
+                problems.append(f"raised {result['error']}")
+            elif reference is None:
+                reference = (name, result)
+            elif (result['count'], result['digest']) != (reference[1]['count'], reference[1]['digest']):
+                problems.append("records differ: " + first_difference(reference[0], name, corpus))
+
+            budget = budget_for(budgets, size_mb, name)
+            if budget:
+                if result['seconds'] > budget['seconds']:
+                    problems.append(f"took {result['seconds']:.1f}s, budget {budget['seconds']}s")
+                if result['rss'] and result['rss'] > budget['rss_mb'] * 1024 * 1024:
+                    problems.append(f"peak RSS {result['rss'] / 2**20:.0f} MB, budget {budget['rss_mb']} MB")
+
+            rss = f"{result['rss'] / 2**20:.0f} MB" if result['rss'] else "-"
+            status = "FAIL" if problems else "ok"
+            print(f"{size_mb:>5g}MB {name:<32} {result['count']:>9,} rows {result['seconds']:>7.2f}s {rss:>8}  {status}", flush=True)
+            for problem in problems:
+                print(f"        {problem}")
+                failures.append((size_mb, name, problem))
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check that every log parser returns identical records.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=DEFAULT_SIZES_MB, help="corpus log sizes in MB")
+    parser.add_argument("--parsers", nargs="+", choices=list(PARSERS), default=list(PARSERS))
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "srw_benchmark"),
+                        help="where generated corpora are kept between runs")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    failures = check(args.sizes, args.parsers, args.data_dir, args.seed)
+    print(f"{len(failures)} failure(s)." if failures else "All parsers agree and are within budget.")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
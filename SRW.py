@@ -1,27 +1,25 @@
 import os
 from venv import logger
-from bs4 import BeautifulSoup
-import chardet
 
-import ApsLog
+import ApsLogs
+import BundleReader
 import HostInfo
 import myUtils
 
 
 class SRW:
     def __init__(self, file_path):
-        """Lightweight wrapper that unpacks a SRW support bundle.
+        """Lightweight wrapper around a SRW support bundle.
 
         Instantiation does the minimum work needed to make the rest of the
-        helper methods usable: store the provided bundle path, extract the
-        archive to a working directory, and preload commonly requested
-        metadata.  The intent is that other modules can simply create ``SRW``
-        and immediately call ``get_*`` helpers without worrying about the
-        extraction lifecycle.
+        helper methods usable: store the provided bundle path and preload
+        commonly requested metadata.  Files are read straight out of the zip
+        through ``BundleReader``, so nothing is extracted to disk and other
+        modules can simply create ``SRW`` and immediately call ``get_*``
+        helpers.
         """
         self.file_path = file_path
-        self.extracted_path = os.path.join(os.path.expanduser("~"), "Documents", "temp_zip_reader")
-        # Host information will be populated after the bundle is unpacked.
+        # Host information will be populated after the bundle is read.
         self.host_info = None
         self.license_info = None
         self.log_info = None
@@ -29,24 +27,10 @@ class SRW:
         # downstream analysis and avoids duplicate parsing of the same bundle.
         self.aps_logs = []
 
-        self.extract_zip(self.file_path, self.extracted_path)
         self.get_aps_logs()
         self.get_host_info()
         self.get_license_info()
     
-    def extract_zip(self, zip_path, extract_to):
-        """
-        Extracts the contents of a zip file to a specified directory.
-        
-        Args:
-            zip_path (str): The path to the zip file.
-            extract_to (str): The directory where the contents should be extracted.
-        """
-        if not os.path.exists(extract_to):
-            os.makedirs(extract_to)
-        
-        myUtils.extract_zip(zip_path, extract_to)
-
     def get_file_path(self):
         return self.file_path
     def set_file_path(self, path = None):
@@ -56,28 +40,31 @@ class SRW:
 
         self.file_path = path  # Replace with actual logic
 
-    def get_aps_logs(self):
+    def get_aps_logs(self, workers=None):
         # Lazily populate APS logs so the class can be created even when the
-        # caller only needs host or license information.
+        # caller only needs host or license information.  ``workers`` is
+        # passed through to ``ApsLogs.parse_log_columns``.
         if not self.aps_logs:
             self.get_file_path()
 
             if self.file_path is None:
                 self.set_file_path()
 
-            tempPath = "C:\\temp_zip_reader"
-            myUtils.extract_zip(self.file_path, tempPath)
+            bundle = BundleReader.open_bundle(self.file_path)
+
+            # Collect any APS HTML/log files and parse them together so large
+            # bundles can use the worker pool configured for ``ApsLogs``.  The
+            # parsed results are kept on ``self.aps_logs`` for future access.
+            files = [file for file in sorted(bundle.listdir())
+                     if file.startswith("aps_") and (file.endswith(".html") or file.endswith(".log"))]
+            parsed = ApsLogs.parse_log_columns([bundle.source(file) for file in files], workers)
 
-            # Iterate over extracted files and collect any APS HTML/log files.
-            # The individual ``ApsLog`` instances stay short lived; we keep the
-            # parsed results on ``self.aps_logs`` for future access.
-            for file in os.listdir(tempPath):
-                if file.startswith("aps_") and (file.endswith(".html") or file.endswith(".log")):
-                    aps_log = ApsLog(file)
-                    if aps_log.get_logs():
-                        self.aps_logs.extend(aps_log.logs)
-                    else:
-                        logger.warning(f"No APS logs found in {file}.")
+            for file, columns in zip(files, parsed):
+                if len(columns):
+                    # Compact records rather than a dict per entry
+                    self.aps_logs.extend(columns.to_entries())
+                else:
+                    logger.warning(f"No APS logs found in {file}.")
 
         return self.aps_logs
 
@@ -85,9 +72,12 @@ class SRW:
         # Host information is created lazily because it depends on the
         # extracted bundle being available on disk.  ``HostInfo`` encapsulates
         # the parsing of OS, platform, and network details from the extracted
-        # directory.
+        # directory; a zip's files come from the shared ``ExtractionCache``.
         if not self.host_info:
-            self.host_info = HostInfo(os.path.dirname(self.file_path))
+            path = self.file_path
+            if not os.path.isdir(path):
+                path = ApsLogs.extraction_cache().extract_manifest(path)
+            self.host_info = HostInfo.HostInfo(path)
         return self.host_info
 
     def get_license_info(self):
@@ -1,6 +1,5 @@
 import json
-import re
-import shutil
+import multiprocessing
 import subprocess
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, scrolledtext
@@ -17,7 +16,18 @@ from ttkbootstrap import Style
 
 # Import functions from other files
 import myUtils
-from ApsLogs import log_info, check_licenses, get_basic_info, logger
+import TextDecoding
+from BundleCache import BundleCache
+from BundleReader import open_bundle
+from ApsLogs import list_log_files, log_columns, parse_log_columns, check_licenses, get_basic_info, format_issues, logger, extraction_cache
+from LogColumns import LogColumns, concat_frames, display_value
+import StageTimer
+import LogEvents
+import Sessions
+from IssueScanner import IssueScanner
+import ErrorCodeIndex
+from SearchIndex import SearchIndex
+import LogQuery
 #from ErrorCodes import error_code_lookup
 
 # Define constants
@@ -130,9 +140,6 @@ class SRWAnalyzerApp(tk.Frame):
 
         self.set_widgets_to_defaults()
 
-        # Bind the '<Destroy>' event to the cleanup method
-        self.root.bind("<Destroy>", self.cleanup)
-
         # Add this to your existing initialization
         self._search_after_id = None
         self._last_search = None
@@ -140,6 +147,11 @@ class SRWAnalyzerApp(tk.Frame):
         # Replace log_data with DataFrame
         self.log_df = pd.DataFrame()
 
+        # Parsed results of bundles opened before, keyed by zip contents
+        self.bundle_cache = BundleCache()
+        # Files that must exist on disk (e.g. to open in Notepad) are extracted here
+        self.extraction_cache = extraction_cache()
+
 
     def on_resize(self, event):
         # Debounce: only run after resizing has stopped for 100ms
@@ -185,18 +197,13 @@ class SRWAnalyzerApp(tk.Frame):
         # If not in a treeview, scroll the main canvas
         self.main_canvas.yview_scroll(int(-1*(event.delta/120)), "units")
 
-    def cleanup(self, event):
-        # Delete the temporary directory if it exists.  This ensures the
-        # application leaves no residue after a session and makes repeated
-        # runs deterministic.
-        myUtils.remove_directory(self.unzipped_file_path)
-
     def drop(self, event):
         # Drag-and-drop handler for APS HTML logs.  The event payload can
         # contain multiple paths separated by spaces, so we iterate over each
         # entry after stripping Tkinter's brace-wrapped file notation.
         files = event.data.strip().split()  # Handle multiple files if dropped
 
+        paths = []
         for file in files:
             file = file.strip("{}")  # Remove curly braces around paths (if any)
 
@@ -204,13 +211,62 @@ class SRWAnalyzerApp(tk.Frame):
                 messagebox.showwarning("Invalid File", f"Skipped: {file} (Not an HTML file)")
                 continue
 
-            destination = os.path.join(self.unzipped_file_path, os.path.basename(file))
+            paths.append(file)
 
-            try:
-                shutil.copy(file, destination)
-                self.call_log_info() #update the log_df
-            except Exception as e:
-                messagebox.showerror("Error", f"Could not copy {file}: {e}")
+        if not paths:
+            return
+
+        # Only the dropped files are parsed, side by side when there are several.
+        # A handful of normal-sized logs is below PARALLEL_MIN_BYTES, which is
+        # meant for whole bundles, so the size threshold only applies to one file.
+        try:
+            parsed = parse_log_columns(paths, min_bytes=0 if len(paths) > 1 else None)
+        except Exception as e:
+            logger.exception(f"Error parsing dropped logs: {e}")
+            messagebox.showerror("Error", f"Could not parse the dropped logs: {e}")
+            return
+
+        columns = LogColumns()
+        for file_columns in parsed:
+            columns.extend(file_columns)
+        # Not in the SRW, so opened from where they were dropped
+        self.dropped_files.update((os.path.basename(path), path) for path in paths)
+        self.append_logs(columns.to_dataframe())
+
+    def append_logs(self, new_df):
+        """Add parsed rows to ``log_df`` and the log view without reparsing the bundle.
+
+        Rows already loaded from a file with the same name are replaced, the
+        same as when the whole folder was reparsed.  The view is refreshed
+        once: new rows are appended to it, or the current search is rerun if
+        one is active.
+        """
+        if new_df.empty:
+            return
+        new_df['Key'] = ''
+        ErrorCodeIndex.add_error_meanings(new_df, self.error_codes)
+
+        start = 0
+        if len(self.log_df):
+            replaced = self.log_df['File'].isin(set(new_df['File'].astype(str)))
+            if replaced.any():
+                for index in self.log_df.index[replaced]:
+                    if self.log_info_tree.exists(str(index)):
+                        self.log_info_tree.delete(str(index))
+                self.log_df = self.log_df[~replaced]
+            # Tree item ids are frame indices, so keep them unique
+            start = self.log_df.index.max() + 1 if len(self.log_df) else 0
+
+        new_df.index = pd.RangeIndex(start, start + len(new_df))
+        self.log_df = concat_frames([self.log_df, new_df])
+        self.build_search_index()
+
+        if self.query_var.get().strip() or any(var.get() for var in self.search_vars.values()):
+            self._perform_search()
+        else:
+            self._insert_log_rows(new_df)
+
+        self.update_client_tree(new_df)
 
 
     def create_widgets(self):
@@ -343,6 +399,10 @@ class SRWAnalyzerApp(tk.Frame):
         self.licenses_tree.column("# Seats", width=100)
         self.licenses_tree.column("File", width=300)
         self.licenses_tree.bind("<Double-1>", self.open_license_file)
+
+        # Peak concurrent sessions, to compare with the seats above
+        self.concurrency_label = ttk.Label(self.licenses_frame, text="Peak concurrent sessions: -")
+        self.concurrency_label.grid(row=2, column=0, columnspan=2, padx=5, pady=2, sticky="w")
         #endregion License Table
 
         #region Log messages section
@@ -400,6 +460,18 @@ class SRWAnalyzerApp(tk.Frame):
         # Remove the search button since we don't need it anymore
         self.save_logs_button = ttk.Button(button_frame, text="Save Selected Logs", command=self.save_selected_logs)
         self.save_logs_button.pack(side=tk.LEFT, padx=5)
+
+        # One-box filter over all columns, ANDed with the boxes above
+        ttk.Label(button_frame, text="Query:").pack(side=tk.LEFT, padx=(15, 2))
+        self.query_var = tk.StringVar()
+        self.query_var.trace_add('write', self.on_search_change)
+        self.query_entry = ttk.Entry(button_frame, textvariable=self.query_var, width=60)
+        self.query_entry.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
+        ToolTip(self.query_entry, "e.g. user:bob process:aps pid:1234 time:[10:00..10:05] desc:/timeout|refused/\n"
+                                  "Plain words search Description. field:=value matches exactly, -term excludes.\n"
+                                  "Fields: " + ", ".join(sorted(LogQuery.FIELDS)))
+        self.query_error_label = ttk.Label(button_frame, text="", foreground="red")
+        self.query_error_label.pack(side=tk.LEFT, padx=5)
         #endregion Search frame
 
         # Create a frame to hold the treeview and scrollbars
@@ -466,6 +538,23 @@ class SRWAnalyzerApp(tk.Frame):
             self.log_scrollbar_x
         )
 
+        #region Stage timings section
+        # Where the time went in the last analysis; hidden when stage_timing is off
+        self.timings_frame = ttk.LabelFrame(self.scrollable_frame, text="Analysis Timings")
+        if myUtils.get_config_value("stage_timing", StageTimer.DEFAULT_ENABLED):
+            self.timings_frame.grid(row=5, column=0, padx=10, pady=10, sticky="nsew")
+
+        self.timings_tree = ttk.Treeview(self.timings_frame, columns=("Stage", "Seconds", "Detail"), show='headings', height=8)
+        self.timings_tree.grid(row=0, column=0, padx=5, pady=2, sticky="nsew")
+        self.timings_tree.heading("Stage", text="Stage")
+        self.timings_tree.heading("Seconds", text="Seconds")
+        self.timings_tree.heading("Detail", text="Detail")
+        self.timings_tree.column("Stage", width=150)
+        self.timings_tree.column("Seconds", width=80, anchor="e")
+        self.timings_tree.column("Detail", width=400)
+        self.timings_frame.columnconfigure(0, weight=1)
+        #endregion Stage timings section
+
         self.scrollable_frame.columnconfigure(0, weight=1)
         self.scrollable_frame.rowconfigure(4, weight=1)
 
@@ -473,11 +562,18 @@ class SRWAnalyzerApp(tk.Frame):
         """Initialize default values for class variables"""
         self.default_srw_path = self.get_srw_base_path()
         self.zip_file_path = None
-        self.unzipped_file_path = None
+        self.bundle = None  # BundleReader view of the open SRW
+        self.dropped_files = {}  # file name -> path of logs added by drag and drop
+        self.stage_timer = StageTimer.StageTimer(None, enabled=False)  # replaced for each analysis
         self.gg_version = None
         self.issue_type = None 
         self.case_number = None
         self.log_df = pd.DataFrame()  # Empty DataFrame instead of log_data list
+        self.session_table = None  # Sessions.stitch_sessions over the whole bundle
+        self.concurrency = None  # open sessions over time
+        self.potential_issues = {}  # IssueScanner.scan over the whole bundle
+        self.error_codes = None  # the bundle's ErrorCodes.txt, indexed by code
+        self.search_index = None  # SearchIndex over log_df, rebuilt when log_df is replaced
 
         # Define column widths in pixels
         self.column_widths = {
@@ -491,7 +587,8 @@ class SRWAnalyzerApp(tk.Frame):
             "Process": 100,
             "PID": 60,
             "Session": 80,
-            "Description": 700
+            "Description": 700,
+            "ErrorMeaning": 300
         }
         
         # Update log columns to include new fields
@@ -501,10 +598,6 @@ class SRWAnalyzerApp(tk.Frame):
         for col in self.log_columns:
             self.search_vars[col] = tk.StringVar()
 
-        # Remove the temporary directory
-        myUtils.remove_directory(self.unzipped_file_path)
-        self.unzipped_file_path = ""
-
     def set_widgets_to_defaults(self):
         self.select_all_var.set(False)
 
@@ -539,11 +632,22 @@ class SRWAnalyzerApp(tk.Frame):
         values = self.log_info_tree.item(selected_item, "values")
         
         # Extract the file name and log number
-        file_name = values[0]
-        log_number = values[1]
+        file_name = values[self.log_columns.index("File")]
+        log_number = values[self.log_columns.index("Line")]
         
         # Construct the file path
-        file_path = os.path.join(self.unzipped_file_path, file_name)
+        file_path = self.dropped_files.get(file_name)
+        if file_path is None:
+            if not self.bundle:
+                return
+            file_path = self.bundle.local_path(file_name)
+        if file_path is None:
+            try:
+                file_path = self.extraction_cache.extract_file(self.zip_file_path, file_name)
+            except Exception as e:
+                logger.exception(f"Could not extract {file_name} from {self.zip_file_path}: {e}")
+                messagebox.showerror("Error", f"Could not open {file_name}: {e}")
+                return
         
         # Open the file in the default web browser
         file_url = f"file://{file_path}#line_{log_number}" # for some reason, this doesn't work, but you can manually add the line. Figure this out at some point.
@@ -559,12 +663,19 @@ class SRWAnalyzerApp(tk.Frame):
         selected_item = self.client_tree.selection()[0]
         values = self.client_tree.item(selected_item, "values")
 
-        # Jump to the location of the client's connection in the log_info_tree  
-        col_index = self.log_info_tree["columns"].index('Description')
-        for rowID in self.log_info_tree.get_children():
-            desc = self.log_info_tree.item(rowID, 'values')[col_index]
-            if desc == f"The version of the {values[1]} client is {values[0]}.":
-                self.jump_to_context(rowID)
+        # Jump to the location of the client's connection in the log_info_tree
+        df = self.log_df
+        if df.empty or 'EventType' not in df.columns:
+            return
+        matches = df.index[
+            (df['EventType'] == LogEvents.CLIENT_VERSION)
+            & (df['ClientOS'] == values[1])
+            & (df['ClientVersion'] == values[0])
+        ]
+        for index in matches:
+            # A search may have hidden some rows
+            if self.log_info_tree.exists(str(index)):
+                self.jump_to_context(str(index))
                 break
 
     # Jump to and highlight the specified rowID in the log_info_tree
@@ -593,12 +704,42 @@ class SRWAnalyzerApp(tk.Frame):
                     subprocess.Popen(['C:\\Windows\\notepad.exe', license_file])
                 else:
                     messagebox.showerror("Error", "Notepad not found on this system.")
+            elif self.bundle and self.bundle.exists(license_file):
+                # Licenses read from inside the zip have no file on disk until one is needed
+                if os.path.exists('C:\\Windows\\notepad.exe'):
+                    try:
+                        path = self.extraction_cache.extract_file(self.zip_file_path, license_file)
+                    except Exception as e:
+                        logger.exception(f"Could not extract {license_file}: {e}")
+                        messagebox.showerror("Error", f"Could not extract {license_file}: {e}")
+                        return
+                    subprocess.Popen(['C:\\Windows\\notepad.exe', path])
+                else:
+                    self.show_bundle_file(license_file)
             else:
                 messagebox.showerror("Error", f"License file {license_file} not found.")
 
+    def show_bundle_file(self, name):
+        """Show a text file from the open SRW in a read-only window."""
+        try:
+            text = TextDecoding.read_text(self.bundle.source(name))
+        except Exception as e:
+            messagebox.showerror("Error", f"Could not read {name}: {e}")
+            return
+
+        window = tk.Toplevel(self.root)
+        window.title(name)
+        window.geometry("700x500")
+
+        text_box = scrolledtext.ScrolledText(window, wrap=tk.WORD)
+        text_box.pack(fill="both", expand=True)
+        text_box.insert(tk.END, text)
+        text_box.config(state='disabled')
+
     def clear_file(self):
         # Reset the current file label
         self.current_file_label.config(text="Current SRW:")
+        self.concurrency_label.config(text="Peak concurrent sessions: -")
 
         self.set_variables_to_defaults()
         self.set_widgets_to_defaults()
@@ -659,14 +800,43 @@ class SRWAnalyzerApp(tk.Frame):
             parent_dir = os.path.basename(os.path.dirname(file_path))
             self.case_number = parent_dir
 
-            # Create temporary directory of extracted files
-            myUtils.remove_directory(self.unzipped_file_path) # remove the unzipped folder before replacing it
-            self.unzipped_file_path = myUtils.extract_zip(self.zip_file_path)
+            timer = self.stage_timer = StageTimer.StageTimer(self.zip_file_path)
 
-            # Get all the info you need
-            self.call_basic_info()
-            self.call_log_info()
-            self.call_check_licenses()
+            # Files are read straight out of the zip; nothing is extracted
+            try:
+                with timer.stage("open_bundle") as stage:
+                    self.bundle = open_bundle(self.zip_file_path)
+                    stage['bytes'] = StageTimer.zip_size(self.zip_file_path)
+            except Exception as e:
+                logger.exception(f"Could not open {self.zip_file_path}: {e}")
+                messagebox.showerror("Error", f"Could not open {self.zip_file_path}: {e}")
+                return
+            # The new bundle's logs replace any that were dropped in
+            self.dropped_files = {}
+
+            # A bundle opened before is shown from the cache without reparsing it
+            with timer.stage("cache_lookup"):
+                cached = self.bundle_cache.get(self.zip_file_path)
+            if cached:
+                self.call_basic_info(cached['basic_info'])
+                self.call_log_info(cached['log_df'])
+                # Cached license results expire; None means check them again
+                licenses = self.call_check_licenses(cached['licenses'])
+                if cached['licenses'] is None:
+                    with timer.stage("cache_store"):
+                        self.bundle_cache.put_licenses(self.zip_file_path, licenses)
+            else:
+                # Get all the info you need
+                basics = self.call_basic_info()
+                log_df = self.call_log_info()
+                licenses = self.call_check_licenses()
+                with timer.stage("cache_store"):
+                    self.bundle_cache.put(self.zip_file_path, basics, licenses, log_df)
+            self.call_session_concurrency(licenses)
+            self.call_scan_issues()
+
+            timer.finish(cached=bool(cached))
+            self.show_stage_timings()
         else:
             messagebox.showerror("Error", "Please select a valid .zip file.")
 
@@ -675,7 +845,7 @@ class SRWAnalyzerApp(tk.Frame):
         self.browse_button.config(state=state)
         self.clear_button.config(state=state if self.zip_file_path else tk.DISABLED)
 
-    def call_basic_info(self):
+    def call_basic_info(self, basics=None):
         # Enable writing to the entries
         self.host_version_entry.config(state='normal')
         self.host_os_entry.config(state='normal')
@@ -683,7 +853,9 @@ class SRWAnalyzerApp(tk.Frame):
         self.server_ip_entry.config(state='normal')
 
         # Update the values
-        basics = get_basic_info(self.unzipped_file_path)
+        if basics is None:
+            with self.stage_timer.stage("basic_info"):
+                basics = get_basic_info(self.bundle)
         self.gg_version = basics['hostVersion']
         
         # Update the entries
@@ -711,68 +883,92 @@ class SRWAnalyzerApp(tk.Frame):
         self.server_role_entry.config(state='readonly')
         self.server_ip_entry.config(state='readonly')
 
-    def call_log_info(self):
-        log_info_result = log_info(self.unzipped_file_path)
+        return basics
+
+    def call_log_info(self, log_df=None):
+        # The frame arrives typed, with DateTime already parsed
+        if log_df is None:
+            with self.stage_timer.stage("log_parse") as stage:
+                columns = log_columns(self.bundle)
+                stage['rows'] = len(columns)
+                stage['bytes'] = StageTimer.source_bytes(list_log_files(self.bundle))
+            with self.stage_timer.stage("dataframe") as stage:
+                log_df = columns.to_dataframe()
+                stage['rows'] = len(log_df)
+                stage['bytes'] = int(log_df.memory_usage().sum())
         
-        if log_info_result:
-            # Convert to DataFrame
-            self.log_df = pd.DataFrame(log_info_result)
-            
-            # Convert date and time columns to datetime
-            self.log_df['DateTime'] = pd.to_datetime(
-                self.log_df['Date'] + ' ' + self.log_df['Time'],
-                format='%Y-%m-%d %H:%M:%S.%f',
-                errors='coerce'  # Handle cases without microseconds
-            )
+        if not log_df.empty:
+            self.log_df = log_df
             
             # Ensure 'Key' column exists
             if 'Key' not in self.log_df.columns:
                 self.log_df['Key'] = ''
 
-            self.update_log_treeview(self.log_df)
+            with self.stage_timer.stage("error_codes") as stage:
+                self.error_codes = ErrorCodeIndex.load_error_codes(self.bundle)
+                ErrorCodeIndex.add_error_meanings(self.log_df, self.error_codes)
+                stage['rows'] = len(self.log_df)
 
-            # Create a dictionary to track IP addresses and their pending entries
-            ip_pending = {}
-            
-            for log in log_info_result:
-                # Check for IP address entries
-                ip_match = re.search(r'A client at IP address (\d+\.\d+\.\d+\.\d+)', log['Description'])
-                if ip_match:
-                    client_ip = ip_match.group(1)
-                    ip_pending[client_ip] = {'ip': client_ip}
-                    continue
-                    
-                # Check for version entries
-                version_match = re.search(r'The version of the (.*?) client is (\d+\.\d+\.\d+\.\d+)', log['Description'])
-                if version_match:
-                    client_os = version_match.group(1).strip()
-                    client_version = version_match.group(2).strip()
-                    
-                    # If we have a pending IP for this entry (assuming logs are in chronological order)
-                    pending_ip = next((ip for ip, data in ip_pending.items() 
-                                    if 'version' not in data), None)
-                    
-                    if pending_ip:
-                        # Create complete entry with IP
-                        entry = (client_version, client_os, pending_ip)
-                        ip_pending[pending_ip]['version'] = client_version
-                    else:
-                        # Create entry without IP for backward compatibility
-                        entry = (client_version, client_os, '')
-                    
-                    # Check if entry already exists
-                    existing_items = [(self.client_tree.item(item)['values'][0],
-                                    self.client_tree.item(item)['values'][1],
-                                    self.client_tree.item(item)['values'][2] if len(self.client_tree.item(item)['values']) > 2 else '')
-                                    for item in self.client_tree.get_children()]
-                    
-                    if entry not in existing_items:
-                        self.client_tree.insert('', 'end', values=entry)
+            with self.stage_timer.stage("search_index") as stage:
+                self.build_search_index()
+                stage['rows'] = len(self.log_df)
+
+            with self.stage_timer.stage("treeview") as stage:
+                self.update_log_treeview(self.log_df)
+                self.update_client_tree(self.log_df)
+                stage['rows'] = len(self.log_df)
         else:
-            logger.error(f"log_info({self.unzipped_file_path}) returned None.")
+            logger.error(f"log_columns({self.zip_file_path}) found no log entries.")
             for item in self.log_info_tree.get_children():
                 self.log_info_tree.delete(item)
-            
+
+        return log_df
+
+    def update_client_tree(self, df):
+        """Add the client versions/IPs in a log frame to the client tree.
+
+        Reads the ``LogEvents`` columns computed when the frame was built
+        instead of matching every description again.
+        """
+        if df.empty or 'EventType' not in df.columns:
+            return
+
+        events = df.loc[
+            df['EventType'].isin([LogEvents.CLIENT_CONNECT, LogEvents.CLIENT_VERSION]),
+            ['EventType', 'ClientIP', 'ClientOS', 'ClientVersion']
+        ]
+
+        # Create a dictionary to track IP addresses and their pending entries
+        ip_pending = {}
+
+        existing_items = set()
+        for item in self.client_tree.get_children():
+            values = self.client_tree.item(item)['values']
+            existing_items.add((values[0], values[1], values[2] if len(values) > 2 else ''))
+
+        for event_type, client_ip, client_os, client_version in events.itertuples(index=False):
+            # Check for IP address entries
+            if event_type == LogEvents.CLIENT_CONNECT:
+                ip_pending[client_ip] = {'ip': client_ip}
+                continue
+
+            # If we have a pending IP for this entry (assuming logs are in chronological order)
+            pending_ip = next((ip for ip, data in ip_pending.items()
+                            if 'version' not in data), None)
+
+            if pending_ip:
+                # Create complete entry with IP
+                entry = (client_version, client_os, pending_ip)
+                ip_pending[pending_ip]['version'] = client_version
+            else:
+                # Create entry without IP for backward compatibility
+                entry = (client_version, client_os, '')
+
+            # Check if entry already exists
+            if entry not in existing_items:
+                existing_items.add(entry)
+                self.client_tree.insert('', 'end', values=entry)
+
     def insert_tree(self, tree, parent, item):
         if isinstance(item, dict):
             for key, value in item.items():
@@ -785,14 +981,18 @@ class SRWAnalyzerApp(tk.Frame):
             # Insert non-dictionary value as child item
             tree.insert(parent, "end", text=item)
 
-    def call_check_licenses(self):
-        result = check_licenses(self.unzipped_file_path)
+    def call_check_licenses(self, result=None):
+        if result is None:
+            # Includes the license server lookups
+            with self.stage_timer.stage("licenses") as stage:
+                result = check_licenses(self.bundle)
+                stage['rows'] = len(result) if result else 0
         
         if not result:
-            logger.info(f"check_licenses({self.unzipped_file_path}) returned None.")
+            logger.info(f"check_licenses({self.zip_file_path}) returned None.")
             for item in self.licenses_tree.get_children():
                 self.licenses_tree.delete(item)
-            return
+            return result
 
         # Clear existing data in licenses_tree
         for item in self.licenses_tree.get_children():
@@ -802,6 +1002,53 @@ class SRWAnalyzerApp(tk.Frame):
         for license_id in result.keys():
             self.licenses_tree.insert('', 'end', values=(license_id, result[license_id]['status'], result[license_id]['seats'], result[license_id]['file']))
 
+        return result
+
+    def call_session_concurrency(self, licenses=None):
+        """Show the peak number of open sessions next to the licensed seats."""
+        with self.stage_timer.stage("concurrency") as stage:
+            self.session_table = Sessions.stitch_sessions(self.log_df)
+            self.concurrency = Sessions.concurrency(self.session_table)
+            stage['rows'] = len(self.session_table)
+
+        peak, when = Sessions.peak_concurrency(self.concurrency)
+        text = f"Peak concurrent sessions: {peak}"
+        if when is not None:
+            text += f" at {when:%Y-%m-%d %H:%M:%S}"
+        seats = (licenses or {}).get('Total', {}).get('seats')
+        if seats:
+            text += f" ({seats} seats licensed)"
+            try:
+                if peak >= int(seats):
+                    text += " - all seats in use"
+            except (TypeError, ValueError):
+                pass
+        self.concurrency_label.config(text=text)
+        return peak
+
+    def call_scan_issues(self):
+        """Match the known-issue catalog against every log entry."""
+        with self.stage_timer.stage("issue_scan") as stage:
+            try:
+                self.potential_issues = IssueScanner().scan(self.log_df)
+            except Exception as e:
+                logger.exception(f"Error scanning for known issues: {e}")
+                self.potential_issues = {}
+            stage['rows'] = len(self.log_df)
+        logger.info(f"{len(self.potential_issues)} potential issue(s) found in {self.zip_file_path}")
+        return self.potential_issues
+
+    def show_stage_timings(self):
+        """Fill the timings panel from the last analysis."""
+        for item in self.timings_tree.get_children():
+            self.timings_tree.delete(item)
+        if not self.stage_timer.enabled:
+            return
+
+        for row in self.stage_timer.summary():
+            self.timings_tree.insert('', 'end', values=row)
+        self.timings_tree.insert('', 'end', values=("Total", f"{self.stage_timer.total_seconds():.3f}", ""))
+
     def sort_column(self, col, reverse):
         # Gather all data upfront with required fields
         data_list = []
@@ -936,14 +1183,7 @@ class SRWAnalyzerApp(tk.Frame):
         for item in self.log_info_tree.get_children():
             self.log_info_tree.delete(item)
 
-        # Add data from DataFrame to the treeview
-        for index, row in df.iterrows():  # Keep index for tracking
-            values = []
-            for col in self.log_columns:
-                values.append(str(row.get(col, '')))
-
-            # Insert row into Treeview, using the original DataFrame index as the iid
-            self.log_info_tree.insert('', 'end', iid=str(index), text=str(index), values=values)
+        self._insert_log_rows(df)
 
         # Restore selection using stored indices
         new_selected_rows = [iid for iid in self.log_info_tree.get_children() if self.log_info_tree.item(iid, "text") in selected_indices]
@@ -953,6 +1193,16 @@ class SRWAnalyzerApp(tk.Frame):
             
             self.jump_to_context(new_selected_rows[0])
 
+    def _insert_log_rows(self, df):
+        # Add data from DataFrame to the treeview
+        for index, row in df.iterrows():  # Keep index for tracking
+            values = []
+            for col in self.log_columns:
+                values.append(display_value(row.get(col, '')))
+
+            # Insert row into Treeview, using the original DataFrame index as the iid
+            self.log_info_tree.insert('', 'end', iid=str(index), text=str(index), values=values)
+
     def save_selected_logs(self):
         """Modified to work with DataFrame"""
         if self.log_df.empty:
@@ -1011,6 +1261,10 @@ class SRWAnalyzerApp(tk.Frame):
                 f.write("RESOLUTION:\n")
                 f.write(f"\t{result['resolution']}\n\n")
                 f.write("-" * 40 + "\n\n")  # Separator
+                f.write("POTENTIAL ISSUES:\n")
+                for line in format_issues(self.potential_issues) or ["No known issues detected."]:
+                    f.write(f"\t{line}\n")
+                f.write("\n" + "-" * 40 + "\n\n")  # Separator
                 f.write("SERVER INFORMATION:\n")
                 f.write(f"\tHost Version: {self.gg_version}\n")
                 f.write(f"\tHost OS: {self.host_os_entry.get()}\n")
@@ -1026,7 +1280,7 @@ class SRWAnalyzerApp(tk.Frame):
                 for _, row in selected_logs.iterrows():
                     values = []
                     for col in self.log_columns:
-                        values.append(str(row[col]))
+                        values.append(display_value(row[col]))
                     f.write('\t'.join(values[1:]) + '\n')
                 
             messagebox.showinfo("Success", f"Selected logs saved successfully to {file_path}")
@@ -1193,22 +1447,23 @@ class SRWAnalyzerApp(tk.Frame):
         try:
             self._search_after_id = None
             search_values = {col: var.get().lower() for col, var in self.search_vars.items() if var.get()}
+            query = self.query_var.get().strip()
             
-            if not search_values:
+            if not search_values and not query:
                 filtered_df = self.log_df
             else:
-                # Start with full DataFrame
-                mask = pd.Series(True, index=self.log_df.index)
-                
-                for col, search_value in search_values.items():
-                    # Handle all columns uniformly
-                    col_mask = self.log_df[col].astype(str).str.lower().str.contains(
-                        search_value,
-                        na=False
-                    )
-                    mask &= col_mask
-                
+                # Looked up in the index built when the bundle loaded
+                index = self.get_search_index(self.log_df)
+                mask = index.mask(search_values)
+                if query:
+                    try:
+                        mask &= LogQuery.query_mask(query, index)
+                    except LogQuery.QueryError as e:
+                        # Usually a query still being typed: say why, keep the current rows
+                        self.query_error_label.config(text=str(e))
+                        return
                 filtered_df = self.log_df[mask]
+            self.query_error_label.config(text="")
             
             self._last_search = search_values
             self.update_log_treeview(filtered_df)
@@ -1218,6 +1473,18 @@ class SRWAnalyzerApp(tk.Frame):
             messagebox.showerror("Search Error", 
                                "An error occurred while searching. Please try again.")
 
+    def build_search_index(self, df=None):
+        """Index the searchable columns of ``log_df``; ``Key`` changes, so it is scanned instead."""
+        columns = [col for col in self.log_columns if col != 'Key']
+        self.search_index = SearchIndex(self.log_df if df is None else df, columns)
+        return self.search_index
+
+    def get_search_index(self, df):
+        """Return the search index for ``df``, rebuilding it if the frame was replaced since."""
+        if self.search_index is None or not self.search_index.covers(df):
+            self.build_search_index(df)
+        return self.search_index
+
     def toggle_key(self, event):
         """Modified to work with DataFrame"""
         item = self.log_info_tree.identify('item', event.x, event.y)
@@ -1299,6 +1566,9 @@ class SRWAnalyzerApp(tk.Frame):
 
 # Main program
 if __name__ == "__main__":
+    # Parse workers of a frozen build relaunch this executable; let them run
+    # their task instead of opening another window
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = SRWAnalyzerApp(root)
     root.mainloop()
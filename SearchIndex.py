@@ -0,0 +1,253 @@
+from collections import OrderedDict
+import re
+
+import numpy as np
+import pandas as pd
+
+# Words as the token index splits text into them
+TOKEN_PATTERN = re.compile(r"\w+")
+# Free-text columns that get a token index.  The others are short values
+# (categories, numbers, times) and are matched by scanning their distinct
+# values, which is quick for categories and far cheaper to set up than
+# tokenizing a value per row for numbers and times.
+TOKEN_INDEX_COLUMNS = ('Description',)
+# Columns with fewer distinct values than this are scanned even so
+TOKEN_INDEX_MIN_VALUES = 2000
+# Results kept per column, so typing on (or backspacing) reuses them
+RECENT_QUERIES = 32
+# A query using any of these is a regex, as the search boxes have always
+# taken them, and is matched by scanning the distinct values
+REGEX_CHARS = frozenset(".^$*+?{}[]\\|()")
+
+
+def is_literal(query):
+    return not REGEX_CHARS.intersection(query)
+
+
+def _tokens_required(query):
+    """Whether every word of ``query`` must appear inside a word of a match.
+
+    True for plain text, and for regexes whose only special character is
+    ``.`` (as in "stopped."), since ``.`` still stands for exactly one
+    character.
+    """
+    return REGEX_CHARS.intersection(query) <= {'.'}
+
+
+def _contains(texts, query, regex):
+    """Boolean array: which of an object array of strings contain ``query``."""
+    if regex:
+        search = re.compile(query).search
+        return np.fromiter((search(text) is not None for text in texts), dtype=bool, count=len(texts))
+    return np.fromiter((query in text for text in texts), dtype=bool, count=len(texts))
+
+
+def _gather(starts, ends):
+    """Concatenate the ranges ``starts[i]:ends[i]`` into one index array."""
+    lengths = ends - starts
+    total = int(lengths.sum())
+    if not total:
+        return np.empty(0, dtype=np.int64)
+    offsets = np.repeat(starts - np.concatenate(([0], np.cumsum(lengths)[:-1])), lengths)
+    return offsets + np.arange(total)
+
+
+class ColumnIndex:
+    """Search index for one log column.
+
+    Matching is done on the column's distinct values (lowered), and a row
+    matches when its value does.  Columns with many distinct values also
+    get a token index (token -> the values containing it) and an index of
+    the 1- to 3-character pieces of every token (trigrams, plus shorter
+    pieces for short words), so a substring query only checks the values
+    holding every word of the query.
+    """
+
+    def __init__(self, values, tokens=False):
+        codes, uniques = pd.factorize(values)
+        self.codes = codes
+        self.texts = pd.Series(np.asarray(uniques, dtype=object), dtype=object).astype(str).str.lower().to_numpy()
+        self.vocab = None
+        self._recent = OrderedDict()  # (query, regex) -> value_hits, most recent last
+        self._lookup = None  # hash of the lowered values, built on first equal_rows
+        if tokens and len(self.texts) >= TOKEN_INDEX_MIN_VALUES:
+            self._build_tokens()
+
+    def _build_tokens(self):
+        found = pd.Series(self.texts, dtype=object).str.findall(TOKEN_PATTERN).explode().dropna()
+        token_ids, vocab = pd.factorize(found)
+        self.vocab = np.asarray(vocab, dtype=object)
+
+        # Postings: the values holding each token, as one sorted array cut
+        # at ``token_starts``
+        keys = np.sort((token_ids.astype(np.int64) << 32) | found.index.to_numpy(dtype=np.int64))
+        keys = keys[np.append(True, keys[1:] != keys[:-1])]
+        self.postings = keys & 0xFFFFFFFF
+        self.token_starts = np.searchsorted(keys >> 32, np.arange(len(vocab) + 1))
+
+        # Every 1-, 2- and 3-character piece of every token, so short query
+        # words are one lookup and longer ones an intersection of trigrams
+        ngrams = {}
+        for token_id, token in enumerate(vocab):
+            pieces = {token[i:i + n] for n in (1, 2, 3) for i in range(len(token) - n + 1)}
+            for piece in pieces:
+                ngrams.setdefault(piece, []).append(token_id)
+        # Token ids were appended in order, so each list is already sorted
+        self.ngrams = {piece: np.array(ids, dtype=np.int64) for piece, ids in ngrams.items()}
+
+    def _tokens_containing(self, piece):
+        if len(piece) <= 3:
+            return self.ngrams.get(piece, np.empty(0, dtype=np.int64))
+
+        candidates = None
+        for i in range(len(piece) - 2):
+            ids = self.ngrams.get(piece[i:i + 3])
+            if ids is None:
+                return np.empty(0, dtype=np.int64)
+            candidates = ids if candidates is None else np.intersect1d(candidates, ids, assume_unique=True)
+        return candidates[_contains(self.vocab[candidates], piece, False)]
+
+    def value_hits(self, query, regex=None):
+        """Return a boolean array over the distinct values: which contain ``query`` (lowered).
+
+        ``regex`` None reads ``query`` the way the search boxes do: a regex
+        if it uses regex characters, plain text otherwise.  Recent results
+        are kept.  When a plain-text query extends one of them ("sess" ->
+        "sessi" -> "session"), only the values that matched the shorter
+        query are checked.  The array is shared; do not modify it.
+        """
+        if regex is None:
+            regex = not is_literal(query)
+        key = (query, regex)
+        hits = self._recent.get(key)
+        if hits is None:
+            hits = None if regex else self._narrow(query)
+            if hits is None:
+                hits = self._match(query, regex)
+            self._recent[key] = hits
+            if len(self._recent) > RECENT_QUERIES:
+                self._recent.popitem(last=False)
+        self._recent.move_to_end(key)
+        return hits
+
+    def _narrow(self, query):
+        """Match plain-text ``query`` within the results of the closest earlier query it contains, if any."""
+        previous = [earlier for earlier, regex in self._recent if not regex and earlier in query]
+        if not previous:
+            return None
+        # The longest earlier query matched the fewest values
+        positions = np.flatnonzero(self._recent[(max(previous, key=len), False)])
+        hits = np.zeros(len(self.texts), dtype=bool)
+        hits[positions[_contains(self.texts[positions], query, False)]] = True
+        return hits
+
+    def _match(self, query, regex):
+        required = not regex or _tokens_required(query)
+        pieces = TOKEN_PATTERN.findall(query) if self.vocab is not None and required else None
+        if not pieces:
+            return _contains(self.texts, query, regex)
+
+        # Every word piece of the query lies inside one token of a matching
+        # value; the longest pieces narrow the candidates most
+        candidates = None
+        for piece in sorted(set(pieces), key=len, reverse=True)[:3]:
+            token_ids = self._tokens_containing(piece)
+            found = np.zeros(len(self.texts), dtype=bool)
+            found[self.postings[_gather(self.token_starts[token_ids], self.token_starts[token_ids + 1])]] = True
+            candidates = found if candidates is None else candidates & found
+
+        positions = np.flatnonzero(candidates)
+        hits = np.zeros(len(self.texts), dtype=bool)
+        if len(positions):
+            hits[positions[_contains(self.texts[positions], query, regex)]] = True
+        return hits
+
+    def rows(self, query, regex=None):
+        """Return a boolean row mask; missing values never match."""
+        return self._rows_of(self.value_hits(query, regex))
+
+    def equal_rows(self, value):
+        """Return a boolean row mask of the rows whose value is ``value``, ignoring case.
+
+        A hash lookup of the distinct values, so it costs one pass over the
+        row codes whatever the column holds.
+        """
+        if self._lookup is None:
+            self._lookup = pd.Index(self.texts)
+        positions = self._lookup.get_indexer_for([value.lower()])
+        hits = np.zeros(len(self.texts), dtype=bool)
+        hits[positions[positions >= 0]] = True
+        return self._rows_of(hits)
+
+    def _rows_of(self, hits):
+        # Code -1 (a missing value) picks the False appended at the end
+        return np.append(hits, False)[self.codes]
+
+
+class SearchIndex:
+    """Per-bundle search index over the text columns of a log frame.
+
+    Built once when the bundle loads, with each column's distinct values
+    lowered once, and shared by the main window and ``ExpandedLogDialog``;
+    a search box query then costs a lookup in the column's index and one
+    pass over the row codes instead of lowering and scanning the whole
+    column.  Queries keep the search boxes' meaning: case-insensitive
+    substring, or a regex when they use regex characters.  Columns that
+    change after loading (``Key``) are not indexed and are scanned as
+    before.
+    """
+
+    def __init__(self, frame, columns):
+        self.frame = frame
+        self.size = len(frame)
+        self.columns = {column: ColumnIndex(frame[column], tokens=column in TOKEN_INDEX_COLUMNS)
+                        for column in columns if column in frame.columns}
+        self._times = None
+
+    def column(self, name):
+        """Return the index of one column, indexing it now if it was not at load time."""
+        if name not in self.columns:
+            self.columns[name] = ColumnIndex(self.frame[name], tokens=name in TOKEN_INDEX_COLUMNS)
+        return self.columns[name]
+
+    def sorted_times(self):
+        """Return ``(times, order)``: the valid ``DateTime`` values as sorted int64 nanoseconds and their rows.
+
+        Sorted once, on first use, so time ranges are two binary searches.
+        """
+        if self._times is None:
+            times = self.frame['DateTime'].to_numpy(dtype='datetime64[ns]')
+            order = np.flatnonzero(~np.isnat(times))
+            order = order[np.argsort(times[order].view(np.int64), kind='stable')]
+            self._times = (times[order].view(np.int64), order)
+        return self._times
+
+    def time_rows(self, starts, ends):
+        """Return a boolean row mask of the rows whose ``DateTime`` lies in any ``[starts[i], ends[i])``.
+
+        Bounds are int64 nanoseconds; each range is two binary searches in
+        ``sorted_times``.
+        """
+        times, order = self.sorted_times()
+        first = np.searchsorted(times, starts)
+        last = np.maximum(np.searchsorted(times, ends), first)
+        mask = np.zeros(self.size, dtype=bool)
+        mask[order[_gather(first, last)]] = True
+        return mask
+
+    def covers(self, frame):
+        """Whether this index was built for ``frame``."""
+        return frame is self.frame and len(frame) == self.size
+
+    def mask(self, search_values):
+        """Return a boolean row mask matching every ``{column: lowered query}``."""
+        mask = np.ones(len(self.frame), dtype=bool)
+        for column, query in search_values.items():
+            if column in self.columns:
+                mask &= self.columns[column].rows(query)
+            else:
+                # 'string' keeps blanks as <NA>, which never match
+                mask &= self.frame[column].astype('string').str.lower().str.contains(query, na=False).to_numpy()
+            if not mask.any():
+                break
+        return mask
@@ -0,0 +1,226 @@
+import numpy as np
+import pandas as pd
+
+# Stands in for the end of a session that has not stopped
+_OPEN_END = np.iinfo(np.int64).max
+
+
+def to_epoch_ns(values):
+    """Convert timestamps to int64 nanoseconds since the epoch.
+
+    Takes strings (``YYYY-MM-DD HH:MM:SS`` with or without fractional
+    seconds), datetimes or datetime64 values.  Returns ``(epochs, valid)``
+    arrays; ``valid`` is False where a value was missing or unreadable.
+    """
+    parsed = pd.to_datetime(pd.Series(list(values), dtype=object), format='ISO8601', errors='coerce')
+    valid = parsed.notna().to_numpy()
+    epochs = parsed.to_numpy(dtype='datetime64[ns]').view(np.int64).copy()
+    epochs[~valid] = 0
+    return epochs, valid
+
+
+def _epoch(when):
+    epochs, valid = to_epoch_ns([when])
+    if not valid[0]:
+        raise ValueError(f"Unreadable time: {when!r}")
+    return epochs[0]
+
+
+class SessionIndex:
+    """Answers "was this user active at this time" without rescanning sessions.
+
+    Built once from ``ApsLog.get_sessions()`` output (a dict, or a list of its
+    items) or a ``stitch_sessions`` table.  Each user's sessions are kept as int64 epoch arrays sorted by
+    start, with the running maximum of their ends, so a lookup is one binary
+    search: the user was active at ``t`` if any session starting at or before
+    ``t`` ends at or after it.  Users are matched case-insensitively (and
+    reported in lower case), and sessions without a start time are left out, as before.
+    """
+
+    def __init__(self, sessions):
+        if isinstance(sessions, pd.DataFrame):
+            sessions = session_items(sessions)
+        elif isinstance(sessions, dict):
+            sessions = sessions.items()
+        sessions = [session for _, session in sessions]
+
+        starts, has_start = to_epoch_ns([session.get('start') for session in sessions])
+        ends, has_end = to_epoch_ns([session.get('end') for session in sessions])
+        ends[~has_end] = _OPEN_END
+
+        by_user = {}
+        for session, start, end, keep in zip(sessions, starts.tolist(), ends.tolist(), has_start):
+            # A session that started in an earlier APS log has no start here
+            if keep:
+                by_user.setdefault((session.get('user') or '').lower(), []).append((start, end))
+
+        self.users = sorted(by_user)
+        self._starts = {}
+        self._max_ends = {}
+        for user, spans in by_user.items():
+            spans.sort()
+            self._starts[user] = np.array([start for start, _ in spans], dtype=np.int64)
+            self._max_ends[user] = np.maximum.accumulate(np.array([end for _, end in spans], dtype=np.int64))
+
+    def _active(self, user, times):
+        starts = self._starts.get(user.lower())
+        if starts is None:
+            return np.zeros(len(times), dtype=bool)
+        last = np.searchsorted(starts, times, side='right') - 1
+        active = last >= 0
+        active[active] = self._max_ends[user.lower()][last[active]] >= times[active]
+        return active
+
+    def is_active(self, user, when):
+        """Return whether ``user`` had a session open at ``when``."""
+        return bool(self._active(user, np.array([_epoch(when)], dtype=np.int64))[0])
+
+    def active_users(self, when):
+        """Return the users with a session open at ``when``."""
+        times = np.array([_epoch(when)], dtype=np.int64)
+        return [user for user in self.users if self._active(user, times)[0]]
+
+    def active_matrix(self, timestamps, users=None):
+        """Return a boolean DataFrame: one row per timestamp, one column per user.
+
+        Unreadable timestamps are never active.
+        """
+        timestamps = list(timestamps)
+        times, valid = to_epoch_ns(timestamps)
+        users = self.users if users is None else users
+        return pd.DataFrame({user: self._active(user, times) & valid for user in users},
+                            index=pd.Index(timestamps, name='time'))
+
+    def active_users_at(self, timestamps):
+        """Return, for each timestamp, the list of users active at that time."""
+        matrix = self.active_matrix(timestamps)
+        users = np.array(matrix.columns, dtype=object)
+        return [list(users[row]) for row in matrix.to_numpy(dtype=bool)]
+
+
+SESSION_COLUMNS = ('Session', 'User', 'Start', 'End', 'Duration', 'StartFile', 'EndFile')
+
+
+def session_events(aps_log):
+    """Yield ``(date, time, kind, session, user, file)`` for each logon and stop in an ApsLog, in file order."""
+    import LogEvents
+
+    for log, event_type in zip(aps_log.get_logs(), aps_log.get_event_types()):
+        if event_type != LogEvents.SESSION_LOGON and event_type != LogEvents.SESSION_STOP:
+            continue
+        # Same rule as ApsLog.get_sessions: session 0 is real, blank users are not
+        if not log['User'] or log['Session'] is None:
+            continue
+        yield log['Date'], log['Time'], event_type, log['Session'], log['User'], aps_log.file_name
+
+
+def frame_session_events(frame):
+    """Per-file ``session_events`` streams from a log DataFrame with an ``EventType`` column."""
+    import LogEvents
+
+    kinds = (LogEvents.SESSION_LOGON, LogEvents.SESSION_STOP)
+    events = frame[frame['EventType'].isin(kinds) & frame['Session'].notna()]
+    events = events[events['User'].astype(str) != '']
+    streams = []
+    for file_name, rows in events.groupby('File', observed=True, sort=False):
+        streams.append(zip(rows['Date'], rows['Time'], rows['EventType'].astype(str), rows['Session'].astype(int),
+                           rows['User'].astype(str), [str(file_name)] * len(rows)))
+    return streams
+
+
+def stitch_sessions(aps_logs):
+    """Rebuild sessions across all the APS logs of a bundle.
+
+    ``aps_logs`` is a list of ApsLog, or the analyzer's log DataFrame.  Each
+    log's logon/stop events are already in time order, so the streams are
+    k-way merged with ``heapq.merge`` and paired in one pass; a session that
+    starts in ``aps_1`` and stops in ``aps_2`` comes out as one row.  A
+    logon for a session id that is still open closes the old one with no
+    end, as its stop was never logged.  Returns a DataFrame with
+    ``SESSION_COLUMNS``: ``Start``/``End`` are datetimes (NaT when the log
+    does not have them) and ``Duration`` is a timedelta.
+    """
+    import heapq
+    import LogEvents
+
+    if isinstance(aps_logs, pd.DataFrame):
+        streams = frame_session_events(aps_logs) if 'EventType' in aps_logs.columns else []
+    else:
+        streams = [session_events(aps_log) for aps_log in aps_logs]
+    # Dates and times are ISO text, so they sort as strings
+    events = heapq.merge(*streams, key=lambda event: (event[0], event[1]))
+
+    rows = []
+    open_sessions = {}  # session id -> its row
+    for date, time, kind, session, user, file_name in events:
+        when = f"{date} {time}"
+        if kind == LogEvents.SESSION_LOGON:
+            if session in open_sessions:
+                rows.append(open_sessions.pop(session))
+            open_sessions[session] = [session, user, when, None, file_name, None]
+        elif session in open_sessions:
+            row = open_sessions.pop(session)
+            row[3], row[5] = when, file_name
+            rows.append(row)
+        else:
+            # Started before the oldest log in the bundle
+            rows.append([session, user, None, when, None, file_name])
+    rows.extend(open_sessions.values())
+
+    table = pd.DataFrame(rows, columns=['Session', 'User', 'Start', 'End', 'StartFile', 'EndFile'])
+    for name in ('Start', 'End'):
+        table[name] = pd.to_datetime(table[name], format='ISO8601', errors='coerce')
+    table['Duration'] = table['End'] - table['Start']
+    for name in ('User', 'StartFile', 'EndFile'):
+        table[name] = table[name].astype('category')
+    return table.sort_values('Start', kind='stable', na_position='first', ignore_index=True)[list(SESSION_COLUMNS)]
+
+
+def session_items(table):
+    """Turn a ``stitch_sessions`` table into ``(session, {'user', 'start', 'end'})`` items, as ``get_sessions`` gives."""
+    def text(value):
+        return None if pd.isna(value) else str(value)
+
+    return [(session, {'user': user, 'start': text(start), 'end': text(end)})
+            for session, user, start, end in zip(table['Session'], table['User'], table['Start'], table['End'])]
+
+
+def concurrency(table):
+    """Return the number of open sessions over time from a ``stitch_sessions`` table.
+
+    A sweep line over the start (+1) and end (-1) events: one sort and a
+    cumulative sum, so millions of events take well under a second.  At
+    the same instant ends count before starts.  Sessions already open when
+    the logs begin count from the first logged event and sessions never
+    stopped stay open to the end.  The Series has one value per instant, the
+    count after every event at that time.
+    """
+    starts = table['Start'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+    ends = table['End'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+    has_start = ~pd.isna(table['Start']).to_numpy()
+    has_end = ~pd.isna(table['End']).to_numpy()
+    if not has_start.any() and not has_end.any():
+        return pd.Series([], index=pd.DatetimeIndex([], name='Time'), name='Sessions', dtype=np.int64)
+
+    first = min(starts[has_start].min() if has_start.any() else _OPEN_END,
+                ends[has_end].min() if has_end.any() else _OPEN_END)
+    starts = np.where(has_start, starts, first)
+    ends = ends[has_end]
+
+    # Each event is one sortable int64: the time shifted left with the low
+    # bit set for a start, so ends sort first at the same instant.  A plain
+    # sort of these is several times quicker than an argsort of the times.
+    keys = np.sort(np.concatenate([ends << 1, (starts << 1) | 1]))
+    times = keys >> 1
+    counts = np.cumsum((keys & 1) * 2 - 1)
+
+    last = np.append(times[1:] != times[:-1], True)
+    return pd.Series(counts[last], index=pd.DatetimeIndex(times[last].view('datetime64[ns]'), name='Time'),
+                     name='Sessions')
+
+
+def peak_concurrency(series):
+    """Return ``(peak, first time it was reached)`` for a ``concurrency`` Series, ``(0, None)`` if empty."""
+    if series.empty:
+        return 0, None
+    return int(series.max()), series.idxmax()
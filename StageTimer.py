@@ -0,0 +1,120 @@
+from contextlib import contextmanager
+import json
+import logging
+import os
+import time
+
+import myUtils
+
+logger = logging.getLogger("SRWAnalyzer")
+
+# Stage timing settings (config.json):
+#   stage_timing     - time each stage of an analysis; false = off
+#   stage_timing_log - JSON lines file one record per analysis is appended to;
+#                      unset = LOG_FILE_NAME in the analyzer's data folder,
+#                      "" = don't write one
+DEFAULT_ENABLED = True
+DEFAULT_LOG_PATH = None
+LOG_FILE_NAME = "stage_timings.jsonl"
+
+
+class StageTimer:
+    """Times the stages of one analysis with a monotonic clock.
+
+    Use ``stage`` as a context manager around each step; the dict it yields
+    can be given ``bytes`` and ``rows`` counts for the work the stage did.
+    ``finish`` appends the whole analysis to the JSON lines log.  A disabled
+    timer still runs the stages but records nothing.
+    """
+
+    def __init__(self, label, enabled=None, log_path=None):
+        if enabled is None:
+            enabled = myUtils.get_config_value("stage_timing", DEFAULT_ENABLED)
+        if log_path is None:
+            log_path = myUtils.get_config_value("stage_timing_log", DEFAULT_LOG_PATH)
+        if log_path is None:
+            # Kept with the caches, never in whatever folder the app started in
+            log_path = myUtils.app_data_dir(LOG_FILE_NAME)
+        self.label = label
+        self.enabled = bool(enabled)
+        self.log_path = log_path
+        self.stages = []
+        self._start = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name):
+        record = {'stage': name, 'seconds': 0.0, 'bytes': None, 'rows': None}
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            if self.enabled:
+                record['seconds'] = time.perf_counter() - start
+                self.stages.append(record)
+
+    def total_seconds(self):
+        return time.perf_counter() - self._start
+
+    def finish(self, **extra):
+        """Return the analysis record, writing it to the log if enabled."""
+        if not self.enabled:
+            return None
+
+        record = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'source': self.label,
+            'total_seconds': round(self.total_seconds(), 4),
+            'stages': [dict(stage, seconds=round(stage['seconds'], 4)) for stage in self.stages],
+            **extra,
+        }
+        if self.log_path:
+            try:
+                if os.path.dirname(self.log_path):
+                    os.makedirs(os.path.dirname(self.log_path), exist_ok=True)
+                with open(self.log_path, 'a', encoding='utf-8') as log_file:
+                    log_file.write(json.dumps(record, default=str) + "\n")
+            except OSError as e:
+                logger.warning(f"Could not write stage timings to {self.log_path}: {e}")
+        return record
+
+    def summary(self):
+        """Return one ``(stage, seconds, detail)`` row per stage, for display."""
+        rows = []
+        for stage in self.stages:
+            detail = []
+            if stage['rows'] is not None:
+                detail.append(f"{stage['rows']:,} rows")
+            if stage['bytes'] is not None:
+                detail.append(format_bytes(stage['bytes']))
+                if stage['seconds'] > 0:
+                    detail.append(f"{format_bytes(stage['bytes'] / stage['seconds'])}/s")
+            rows.append((stage['stage'], f"{stage['seconds']:.3f}", ", ".join(detail)))
+        return rows
+
+
+def format_bytes(size):
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def source_bytes(sources):
+    """Total uncompressed size of paths or ``BundleReader.Member`` objects."""
+    from BundleReader import source_size
+
+    total = 0
+    for source in sources:
+        try:
+            total += source_size(source)
+        except OSError:
+            pass
+    return total
+
+
+def zip_size(path):
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return None
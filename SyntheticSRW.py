@@ -0,0 +1,255 @@
+"""Generate synthetic SRW bundles for benchmarks and parser checks.
+
+The bundles look like the ones GO-Global support receives: UTF-16 APS HTML
+logs with product, EnvOp and LogEntries tables, ``aps_*.log`` files with
+SituationID comments, ``.lic`` files, a registry export, ``ipconfig.txt``,
+``SystemInformation.txt`` and ``ErrorCodes.txt``.  Sizes are configurable
+and the same seed always produces the same bundle.
+
+    python SyntheticSRW.py out.zip --mb 100
+"""
+import argparse
+from datetime import datetime, timedelta
+import html
+import os
+import random
+import zipfile
+
+import GOGlobal
+
+# Rows are encoded and written to the zip this many at a time
+_WRITE_BATCH = 2000
+
+USERS = ['alice', 'bob', 'carol', 'dave', 'erin', 'frank', 'grace', 'heidi', 'ivan', 'judy']
+SERVERS = ['HOST1', 'HOST2', 'FARM-1', 'FARM-2']
+APPS = ['winword.exe', 'excel.exe', 'outlook.exe', 'notepad.exe', 'chrome.exe', 'acrord32.exe']
+CLIENTS = ['Windows', 'Mac', 'Linux', 'iOS', 'Android', 'Web']
+ERRORS = {
+    10054: "An existing connection was forcibly closed by the remote host.",
+    10060: "A connection attempt failed because the connected party did not properly respond.",
+    1326: "The user name or password is incorrect.",
+    5: "Access is denied.",
+    1219: "Multiple connections to a server or shared resource by the same user are not allowed.",
+}
+SITUATION_IDS = [3, 12, 45, 89, 101, 190, 244]
+
+
+class _Simulation:
+    """A running GO-Global host whose sessions produce log descriptions."""
+
+    def __init__(self, rng, start):
+        self.rng = rng
+        self.now = start
+        self.next_session = 1
+        self.next_pid = 1000
+        self.sessions = {}  # session id -> (user, server, aps pid)
+
+    def _pid(self):
+        self.next_pid += self.rng.randint(1, 40)
+        return self.next_pid
+
+    def _prefix(self, session):
+        user, server, aps_pid = self.sessions[session]
+        return f"{user} on {server} ({self.rng.randint(1, 4)}), aps.exe ({aps_pid}) Session ID {session}: "
+
+    def event(self):
+        """Advance the clock and return ``(datetime, description)``."""
+        rng = self.rng
+        self.now += timedelta(milliseconds=rng.randint(1, 4000))
+        roll = rng.random()
+
+        if roll < 0.08 or not self.sessions:
+            session = self.next_session
+            self.next_session += 1
+            user = rng.choice(USERS)
+            self.sessions[session] = (user, rng.choice(SERVERS), self._pid())
+            return self.now, self._prefix(session) + f"User {user} logged on to session {session}."
+        if roll < 0.14:
+            ip = f"10.{rng.randint(0, 255)}.{rng.randint(0, 255)}.{rng.randint(1, 254)}"
+            return self.now, f"ggsvc.exe ({self._pid()}) A client at IP address {ip} connected."
+        if roll < 0.20:
+            client = rng.choice(CLIENTS)
+            return self.now, f"aps.exe ({self._pid()}) The version of the {client} client is 6.3.{rng.randint(1, 3)}.{rng.randint(30000, 35000)}."
+        if roll < 0.27 and len(self.sessions) > 3:
+            session = rng.choice(list(self.sessions))
+            user = self.sessions[session][0]
+            description = self._prefix(session) + f"Session '{user}' stopped."
+            del self.sessions[session]
+            return self.now, description
+        if roll < 0.32:
+            code, message = rng.choice(list(ERRORS.items()))
+            session = rng.choice(list(self.sessions))
+            return self.now, self._prefix(session) + f"Error {code}: {message}"
+
+        session = rng.choice(list(self.sessions))
+        user, server, _ = self.sessions[session]
+        app = rng.choice(APPS)
+        if roll < 0.7:
+            return self.now, f"{user} on {server} ({rng.randint(1, 4)}), {app} ({self._pid()}) Session ID {session}: Process {app} started."
+        return self.now, f"{user} on {server} ({rng.randint(1, 4)}), {app} ({self._pid()}) Session ID {session}: Process {app} exited with code {rng.choice([0, 0, 0, 1, 259])}."
+
+
+def _html_header(host_version, platform_build, cloud_license=False):
+    # Cloud-licensed hosts report their license in the log instead of a .lic file
+    license_row = (
+        "<tr><td>GO-Global license information<br>Expiration date: 2030-01-01<br>"
+        "Seats: 25<br>License master: 4242</td></tr>"
+    ) if cloud_license else ""
+    return (
+        "<html><head><title>GO-Global Application Publishing Service log</title></head><body>\r\n"
+        "<table><tr><td>GO-Global Application Publishing Service</td></tr></table>\r\n"
+        f"<table><tr><td>Product Version</td><td>{host_version}</td></tr>"
+        "<tr><td>Product Name</td><td>GO-Global Host</td></tr></table>\r\n"
+        "<a name=\"EnvOp\"></a><table>"
+        f"<tr><td>Platform Build Number</td><td>{platform_build}</td></tr>"
+        f"<tr><td>Processors</td><td>8</td></tr>{license_row}</table>\r\n"
+        "<a name=\"LogEntries\"></a>\r\n<table border=1>\r\n"
+        "<tr><th>#</th><th>Date</th><th>Time</th><th>Description</th></tr>\r\n"
+    )
+
+
+def _html_row(line, when, description):
+    return (
+        f"<tr><td><a name=\"line_{line}\">{line}</a></td><td>{when:%Y-%m-%d}</td>"
+        f"<td>{when:%H:%M:%S}.{when.microsecond // 1000:03d}</td><td>{html.escape(description)}</td></tr>\r\n"
+    )
+
+
+def _text_row(rng, when, description):
+    return (
+        f"<!-- SituationID={rng.choice(SITUATION_IDS)} --> {when:%Y-%m-%d} "
+        f"{when:%H:%M:%S}.{when.microsecond // 1000:03d} {description}\r\n"
+    )
+
+
+def _write_log(archive, name, target_bytes, simulation, encoding, header, footer, row):
+    """Write rows until the encoded member reaches ``target_bytes``.
+
+    Returns ``(rows, bytes)`` actually written.
+    """
+    written = 0
+    rows = 0
+    with archive.open(name, 'w', force_zip64=True) as member:
+        data = header.encode(encoding)
+        member.write(data)
+        written += len(data)
+        # Later batches must not repeat the byte order mark
+        body_encoding = 'utf-16-le' if encoding == 'utf-16' else encoding
+
+        row_bytes = 0
+        while written < target_bytes:
+            # Shrink the last batches so the file stops close to its target
+            count = _WRITE_BATCH if not row_bytes else max(1, min(_WRITE_BATCH, (target_bytes - written) // row_bytes + 1))
+            batch = []
+            for _ in range(count):
+                rows += 1
+                batch.append(row(rows, *simulation.event()))
+            data = ''.join(batch).encode(body_encoding)
+            member.write(data)
+            written += len(data)
+            row_bytes = max(1, len(data) // count)
+
+        data = footer.encode(body_encoding)
+        member.write(data)
+        written += len(data)
+    return rows, written
+
+
+def generate_srw(path, log_mb=10, file_mb=32, text_share=0.25, licenses=2, host_version="6.3.2.34154",
+                 platform_build="20348.1", server_role=1, seed=0, compresslevel=1):
+    """Write a synthetic SRW zip to ``path`` and return a summary dict.
+
+    ``log_mb`` is the total uncompressed size of the APS logs, split into
+    files of at most ``file_mb``; ``text_share`` of it goes to ``aps_*.log``
+    files and the rest to HTML.  ``licenses`` ``.lic`` files are added; with
+    none the HTML logs carry cloud license information instead.
+    """
+    rng = random.Random(seed)
+    simulation = _Simulation(rng, datetime(2024, 5, 1, 8, 0, 0))
+    total_bytes = int(log_mb * 1024 * 1024)
+    file_bytes = max(1, int(file_mb * 1024 * 1024))
+    text_bytes = int(total_bytes * text_share)
+    html_bytes = total_bytes - text_bytes
+
+    summary = {'path': path, 'log_bytes': 0, 'rows': 0, 'files': []}
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as archive:
+        # aps_*.html, newest last, the way GO-Global numbers them
+        index = 0
+        while html_bytes > 0:
+            index += 1
+            size = min(file_bytes, html_bytes)
+            html_bytes -= size
+            name = f"aps_{index}.html"
+            rows, written = _write_log(archive, name, size, simulation, 'utf-16',
+                                       _html_header(host_version, platform_build, cloud_license=not licenses),
+                                       "</table>\r\n</body></html>\r\n", _html_row)
+            summary['rows'] += rows
+            summary['log_bytes'] += written
+            summary['files'].append(name)
+
+        index = 0
+        while text_bytes > 0:
+            index += 1
+            size = min(file_bytes, text_bytes)
+            text_bytes -= size
+            name = f"aps_{index}.log"
+            rows, written = _write_log(archive, name, size, simulation, 'utf-16', "GO-Global log header\r\n", "",
+                                       lambda line, when, description: _text_row(rng, when, description))
+            summary['rows'] += rows
+            summary['log_bytes'] += written
+            summary['files'].append(name)
+
+        for number in range(1, licenses + 1):
+            archive.writestr(f"GO-Global_{number}.lic", (
+                "# GO-Global license file\r\n"
+                f"# Product code: GG{rng.randint(100000, 999999)}\r\n"
+                f"# License ID: TL-{rng.randint(10000000, 99999999)}\r\n"
+                f"# Seats: {rng.choice([5, 10, 25, 50])}\r\n"
+                f"FEATURE GO-Global graphon 6.3 permanent uncounted HOSTID=ANY SIGN={rng.getrandbits(64):016X}\r\n"
+            ))
+
+        archive.writestr("HKLM.Software.GraphOn.reg64.txt", (
+            "Windows Registry Editor Version 5.00\r\n\r\n"
+            "[HKEY_LOCAL_MACHINE\\SOFTWARE\\GraphOn\\GO-Global\\AppServer]\r\n"
+            f"\"ServerRole\"=dword:{server_role:08x}\r\n"
+            "\"LogLevel\"=dword:00000003\r\n"
+        ).encode('utf-16'))
+
+        archive.writestr("ipconfig.txt", (
+            "\r\nWindows IP Configuration\r\n\r\n\r\nEthernet adapter Ethernet:\r\n\r\n"
+            "   Connection-specific DNS Suffix  . : example.local\r\n"
+            f"   IPv4 Address. . . . . . . . . . . : 192.168.{rng.randint(0, 255)}.{rng.randint(1, 254)}\r\n"
+            "   Subnet Mask . . . . . . . . . . . : 255.255.255.0\r\n"
+        ))
+
+        build = platform_build.split('.')[0]
+        archive.writestr("SystemInformation.txt", (
+            "\r\nHost Name:                 HOST1\r\n"
+            f"OS Name:                   Microsoft {GOGlobal.supported_platforms.get(build, 'Windows')}\r\n"
+            f"OS Version:                10.0.{build} N/A Build {build}\r\n"
+        ))
+
+        archive.writestr("ErrorCodes.txt", "".join(f"{code} = {message}\r\n" for code, message in sorted(ERRORS.items())))
+
+    summary['zip_bytes'] = os.path.getsize(path)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write a synthetic SRW bundle.")
+    parser.add_argument("path", help="zip file to create")
+    parser.add_argument("--mb", type=float, default=10, help="total uncompressed size of the APS logs")
+    parser.add_argument("--file-mb", type=float, default=32, help="largest single log file")
+    parser.add_argument("--text-share", type=float, default=0.25, help="share of log bytes in aps_*.log files")
+    parser.add_argument("--licenses", type=int, default=2, help=".lic files to add (0 = cloud licensed)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    summary = generate_srw(args.path, args.mb, args.file_mb, args.text_share, args.licenses, seed=args.seed)
+    print(f"Wrote {summary['path']}: {summary['rows']:,} rows in {len(summary['files'])} logs, "
+          f"{summary['log_bytes'] / 2**20:.0f} MB of logs, {summary['zip_bytes'] / 2**20:.1f} MB zipped")
+
+
+if __name__ == "__main__":
+    main()
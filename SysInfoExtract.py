@@ -1,5 +1,5 @@
-import re
 import myUtils
+import TextDecoding
 
 def get_key_mapping(language='en'):
     """
@@ -247,20 +247,20 @@ def extract_sysinfo(text):
     
     return sysinfo
 
+def load_sysinfo(file_path):
+    """Read and parse a SystemInformation.txt file.
+
+    The report is UTF-16 when produced by systeminfo.exe but is sometimes
+    re-saved as UTF-8, so the encoding is sniffed by ``TextDecoding`` instead
+    of trying each codec in turn.
+    """
+    return extract_sysinfo(TextDecoding.read_text(file_path))
+
 if __name__ == "__main__":
     # Example usage
     file_path = myUtils.select_file("Select the System Information file to analyze")
     try:
-        with open(file_path, "r", encoding="utf-16", errors="ignore") as f:
-            content = f.read()
-        sys_info = extract_sysinfo(content)
+        sys_info = load_sysinfo(file_path)
         myUtils.print_nested_dict(sys_info)
     except Exception as e:
-        print(f"Error extracting sysinfo with encoding utf-16: {e}")
-        try:
-            with open(file_path, "r", encoding="utf-8", errors="ignore") as f:
-                content = f.read()
-            sys_info = extract_sysinfo(content)
-            myUtils.print_nested_dict(sys_info)
-        except Exception as e:
-            print(f"Error extracting sysinfo with encoding utf-8: {e}")
+        print(f"Error extracting sysinfo: {e}")
@@ -0,0 +1,153 @@
+import codecs
+from contextlib import contextmanager
+import logging
+import mmap
+import os
+
+import chardet
+
+logger = logging.getLogger("SRWAnalyzer")
+
+# Only this many bytes are handed to chardet.  Running detection over a whole
+# log was one of the slowest steps of loading a bundle, and the first block of
+# a GO-Global log or report is representative of the rest of it.
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+# Size of each read while streaming a file.
+READ_CHUNK_SIZE = 1024 * 1024
+
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+def sniff_encoding(sample: bytes):
+    """Guess the encoding of a file from the first block of its bytes.
+
+    A byte order mark settles the question without running chardet at all.
+    UTF-16 text without a BOM is recognised by its zero bytes, which chardet
+    handles poorly.  Anything else goes to chardet, and an ``ascii`` guess is
+    widened to UTF-8 because later parts of the file may contain characters
+    the sample did not.
+    """
+    for bom, encoding in _BOMS:
+        if sample.startswith(bom):
+            return encoding
+
+    if len(sample) >= 2:
+        half = len(sample) // 2
+        if sample[1::2].count(0) > half // 2:
+            return 'utf-16-le'
+        if sample[0::2].count(0) > half // 2:
+            return 'utf-16-be'
+
+    detected = chardet.detect(sample) if sample else {}
+    encoding = detected.get('encoding') if isinstance(detected, dict) else None
+    if not encoding or encoding.lower() == 'ascii':
+        return 'utf-8'
+    return encoding
+
+
+@contextmanager
+def open_binary(source):
+    """Open ``source`` for binary reading.
+
+    ``source`` may be a path, an already open binary file object, or an
+    object with an ``open()`` method such as ``BundleReader.Member``.  File
+    objects are left open for the caller to close.
+    """
+    if hasattr(source, 'read'):
+        yield source
+    elif hasattr(source, 'open'):
+        with source.open() as file:
+            yield file
+    else:
+        with open(source, 'rb') as file:
+            yield file
+
+
+def _source_name(source):
+    return getattr(source, 'name', source)
+
+
+def iter_text_chunks(source, chunk_size=READ_CHUNK_SIZE, encoding=None):
+    """Read a file once and yield its decoded text in fixed size pieces.
+
+    The encoding is sniffed from the first read, so the bytes used for
+    detection are the same bytes that get decoded.  Decoding is incremental:
+    a multi-byte character split across two reads is completed on the next
+    one, and undecodable bytes are replaced rather than aborting the read.
+    """
+    with open_binary(source) as file:
+        data = file.read(max(chunk_size, ENCODING_SAMPLE_SIZE))
+        if encoding is None:
+            encoding = sniff_encoding(data[:ENCODING_SAMPLE_SIZE])
+            logger.info(f"Detected encoding for {_source_name(source)}: {encoding}")
+
+        decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+        while data:
+            text = decoder.decode(data)
+            if text:
+                yield text
+            data = file.read(chunk_size)
+
+        text = decoder.decode(b'', final=True)
+        if text:
+            yield text
+
+
+def iter_lines(source, chunk_size=READ_CHUNK_SIZE, encoding=None):
+    """Yield the lines of a text file, decoded, one at a time.
+
+    Lines end in ``\\n`` and ``\\r\\n``/``\\r`` are translated the way text
+    mode ``open()`` does, so line numbers match ``readlines()``.
+    """
+    remainder = ''
+    for text in iter_text_chunks(source, chunk_size, encoding):
+        text = remainder + text
+        # A trailing \r may be the first half of a \r\n in the next chunk
+        held_cr = text.endswith('\r')
+        if held_cr:
+            text = text[:-1]
+
+        lines = text.replace('\r\n', '\n').replace('\r', '\n').split('\n')
+        remainder = lines.pop() + ('\r' if held_cr else '')
+        for line in lines:
+            yield line + '\n'
+
+    if remainder:
+        yield remainder.replace('\r', '\n')
+
+
+def read_text(source, encoding=None):
+    """Read and decode a whole file, touching the disk only once.
+
+    Files on disk are memory-mapped and decoded straight from the mapping;
+    file objects and zip members are read into memory once.
+    If the sniffed encoding turns out to be wrong the same bytes are decoded
+    again as UTF-8 with replacement characters instead of reopening the file.
+    """
+    if hasattr(source, 'read') or hasattr(source, 'open'):
+        with open_binary(source) as file:
+            return decode_bytes(file.read(), _source_name(source), encoding)
+
+    with open(source, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return ''
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return decode_bytes(data, source, encoding)
+
+
+def decode_bytes(data, name='', encoding=None):
+    """Decode an in-memory buffer using the same rules as ``read_text``."""
+    if encoding is None:
+        encoding = sniff_encoding(bytes(data[:ENCODING_SAMPLE_SIZE]))
+        logger.info(f"Detected encoding for {name}: {encoding}")
+
+    try:
+        return str(data, encoding)
+    except (UnicodeDecodeError, LookupError):
+        logger.warning(f"Failed to decode {name} with detected encoding ({encoding}). Falling back to utf-8.")
+        return str(data, 'utf-8', 'replace')
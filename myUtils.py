@@ -1,3 +1,5 @@
+from concurrent.futures import ThreadPoolExecutor
+import fnmatch
 from functools import wraps
 import tkinter as tk
 from tkinter import filedialog
@@ -50,6 +52,75 @@ def https_get_txt(url: str):
         print(f"\tException: {e}")
         return None
     
+def get_config_value(key: str, default=None, config_path="config.json"):
+    """Read a single setting from ``config.json``.
+
+    Missing files, unreadable JSON and absent keys all return ``default`` so
+    optional tuning settings never stop the analyzer from starting.
+    """
+    try:
+        with open(config_path, 'r') as config_file:
+            config = json.load(config_file)
+    except (OSError, ValueError):
+        return default
+
+    return config.get(key, default)
+
+def app_data_dir(name):
+    """Return ``name`` inside the analyzer's per-user data folder.
+
+    The folder is ``%LOCALAPPDATA%\\SRWAnalyzer`` on Windows and
+    ``~/.cache/SRWAnalyzer`` elsewhere; the caches and logs the analyzer
+    writes for itself live there rather than in the working directory.
+    """
+    base = os.getenv("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "SRWAnalyzer", name)
+
+def dir_size(path):
+    """Return the total size in bytes of the files under ``path``, skipping any that vanish meanwhile."""
+    total = 0
+    for root, _, files in os.walk(path):
+        for file in files:
+            try:
+                total += os.path.getsize(os.path.join(root, file))
+            except OSError:
+                pass
+    return total
+
+def get_available_memory():
+    """Return the physical memory currently available, in bytes.
+
+    Uses ``GlobalMemoryStatusEx`` on Windows and ``sysconf`` elsewhere.
+    Returns ``None`` when the platform does not expose the figure, so callers
+    must be ready to fall back to a fixed limit.
+    """
+    try:
+        if os.name == 'nt':
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return status.ullAvailPhys
+            return None
+
+        return os.sysconf('SC_AVPHYS_PAGES') * os.sysconf('SC_PAGE_SIZE')
+    except (AttributeError, OSError, ValueError):
+        return None
+
 def print_nested_dict(dictionary, indent=0):
     if isinstance(dictionary, dict):
         for key, value in dictionary.items():
@@ -126,15 +197,82 @@ def select_zip_file():
     root.destroy()
     return file_path
 
-def extract_zip(path: str, toPath = "C:\\temp_zip_reader"):
-    # Extract all files to a temp folder so we can directly see the license file
+# The members of an SRW the analyzer actually reads.  Everything else (crash
+# dumps, installers, screenshots) stays in the zip when extracting with it.
+ANALYZER_MANIFEST = (
+    'aps_*',
+    '*.lic',
+    'HKLM.Software.*.reg64.txt',
+    'ipconfig.txt',
+    'SystemInformation.txt',
+    'ErrorCodes.txt',
+)
+
+def in_manifest(name, manifest):
+    """Return True if the file name of ``name`` matches a ``manifest`` pattern, ignoring case."""
+    name = os.path.basename(name).lower()
+    return any(fnmatch.fnmatchcase(name, pattern.lower()) for pattern in manifest)
+
+def zip_members(zip_ref, manifest):
+    """Return the ``ZipInfo`` of every file whose name matches ``manifest``.
+
+    Patterns are matched case-insensitively against the file name only, so a
+    log in a subfolder is found the same as one at the root.  Only the central
+    directory is read.
+    """
+    return [info for info in zip_ref.infolist() if not info.is_dir() and in_manifest(info.filename, manifest)]
+
+def member_path(info, toPath):
+    """Return where ``ZipFile.extract`` puts ``info`` under ``toPath``.
+
+    Same cleanup as ``ZipFile._extract_member``: drive letters and empty,
+    ``.`` and ``..`` parts are dropped, and on Windows characters that are
+    illegal in file names are replaced.
+    """
+    arcname = info.filename.replace('/', os.path.sep)
+    if os.path.altsep:
+        arcname = arcname.replace(os.path.altsep, os.path.sep)
+    arcname = os.path.splitdrive(arcname)[1]
+    arcname = os.path.sep.join(part for part in arcname.split(os.path.sep)
+                               if part not in ('', os.path.curdir, os.path.pardir))
+    if os.path.sep == '\\':
+        arcname = zipfile.ZipFile._sanitize_windows_name(arcname, os.path.sep)
+    return os.path.normpath(os.path.join(toPath, arcname))
+
+def extract_zip(path: str, toPath = "C:\\temp_zip_reader", manifest=None, workers=None):
+    """Extract a zip to ``toPath`` and return ``toPath`` ("" on failure).
+
+    With no ``manifest`` everything is extracted.  Otherwise only members
+    matching one of its patterns are (see ``zip_members``), decompressed on
+    ``workers`` threads; zlib releases the GIL, so large logs inflate in
+    parallel while multi-GB dumps are never touched.
+    """
     if not os.path.exists(toPath):
         os.mkdir(toPath)
         if not os.path.exists(toPath):
             return ""
 
     with zipfile.ZipFile(path, 'r') as zip_ref:
-        zip_ref.extractall(toPath)
+        if manifest is None:
+            zip_ref.extractall(toPath)
+            return toPath
+
+        members = zip_members(zip_ref, manifest)
+        if workers is None:
+            workers = get_config_value("extract_workers", min(8, os.cpu_count() or 1))
+        workers = max(1, min(int(workers), len(members) or 1))
+
+        if workers == 1:
+            for info in members:
+                zip_ref.extract(info, toPath)
+        else:
+            # ZipFile.extract creates missing folders without exist_ok, so two
+            # members of one new folder would race; create them all up front
+            for folder in {os.path.dirname(member_path(info, toPath)) for info in members}:
+                os.makedirs(folder, exist_ok=True)
+            # ZipFile serializes reads of the underlying file itself
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(lambda info: zip_ref.extract(info, toPath), members))
 
     return toPath
 
@@ -1,65 +1,49 @@
 import os
 from ApsLog import ApsLog
 import myUtils
-import datetime
+from Sessions import SessionIndex, stitch_sessions
 
 def user_active_at_time(sessions, username, dt_str):
     """
     Returns True if the user had an active session at the given datetime string (format: 'YYYY-MM-DD HH:MM:SS[.fff]').
+    ``sessions`` is a SessionIndex, or sessions to build one from (items or a stitch_sessions table); build the index once when asking repeatedly.
     """
-    dt = datetime.datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
-    for sess in sessions:
-        if sess[1]['user'].lower() != username.lower():
-            continue
-        # Parse start and end times
-        try:
-            # Try parsing with milliseconds, then without
-            try:
-                start = datetime.datetime.strptime(sess[1]['start'], "%Y-%m-%d %H:%M:%S.%f")
-            except ValueError:
-                start = datetime.datetime.strptime(sess[1]['start'], "%Y-%m-%d %H:%M:%S")
-        except Exception:
-            continue  # skip if start is missing or invalid
-        if sess[1]['end']:
-            try:
-                end = datetime.datetime.strptime(sess[1]['end'], "%Y-%m-%d %H:%M:%S.%f")
-            except Exception:
-                end = datetime.datetime.strptime(sess[1]['end'], "%Y-%m-%d %H:%M:%S")
-        else:
-            end = None
-        # Check if dt is within session
-        if start <= dt and (end is None or dt <= end):
-            # we should change this to include if there is no start time, in case the session started in another APS log
-            return True
-    return False
+    if not isinstance(sessions, SessionIndex):
+        sessions = SessionIndex(sessions)
+    return sessions.is_active(username, dt_str)
 
 # Example usage:
 if __name__ == "__main__":
     path = myUtils.select_dir("APS Log", "*.html *.log")
 
     users = []
-    sessions = []
+    aps_logs = []
     for file in os.listdir(path):
         if file.startswith("aps_") and (file.endswith(".html") or file.endswith(".log")):
             file_path = os.path.join(path, file)
             print(f"Found APS Log file: {file_path}")
             aps_log = ApsLog(file_path)
+            aps_logs.append(aps_log)
 
             print("Getting users...")
             users_this_log = aps_log.get_users()
             print(f"User count = {len(users_this_log)}")
             users.extend(u for u in users_this_log if u not in users)
 
-            print("Getting sessions...")
-            sessions_this_log = aps_log.get_sessions()
-            print(f"Session count = {len(sessions_this_log)}")
-            if len(sessions_this_log.items()) > 0:
-                sessions.extend(sessions_this_log.items())  # don't care about unique session IDs
+    # Sessions that span rotated logs are joined up rather than counted twice
+    print("Getting sessions...")
+    sessions = stitch_sessions(aps_logs)
+    print(f"Session count = {len(sessions)}")
+    print(sessions.groupby('User', observed=True)['Duration'].describe())
 
-    username = input("Enter username to check: ").strip()
-    dt_str = input("Enter datetime to check (YYYY-MM-DD HH:MM:SS): ").strip()
-    active = user_active_at_time(sessions, username, dt_str)
-    print(f"Was user '{username}' active at {dt_str}? {'Yes' if active else 'No'}")
+    session_index = SessionIndex(sessions)
+    while True:
+        username = input("Enter username to check (blank to stop): ").strip()
+        if not username:
+            break
+        dt_str = input("Enter datetime to check (YYYY-MM-DD HH:MM:SS): ").strip()
+        active = user_active_at_time(session_index, username, dt_str)
+        print(f"Was user '{username}' active at {dt_str}? {'Yes' if active else 'No'}")
 '''
 path = myUtils.select_dir("APS Log", "*.html *.log")
 
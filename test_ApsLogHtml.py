@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+
+import ApsLogHtml
+
+HEADER = '<tr><th>Line</th><th>Date</th><th>Time</th><th>Description</th></tr>'
+ROWS = (
+    '<tr><td>1</td><td>05/01/2024</td><td>10:00:00</td>'
+    '<td>bob on s1, aps.exe (1234) Session ID 2: Logged on</td></tr>',
+    # Entities
+    '<tr><td>2</td><td>05/01/2024</td><td>10:00:01</td><td>a &lt;b&gt; &amp; &quot;c&quot; &#233;&nbsp;d</td></tr>',
+    # '>' inside attribute values
+    '<tr><td title="a>b">3</td><td>05/01/2024</td><td>10:00:02</td><td class=\'x>y\'>Quoted</td></tr>',
+    # Cells that are never closed
+    '<tr><td>4<td>05/01/2024<td>10:00:03<td>Unclosed</tr>',
+)
+
+
+def make_log(rows):
+    return ('<html><body><a name="Product"></a><table><tr><td>GO-Global</td></tr></table>'
+            f'<a name="LogEntries"></a><table border="1">{HEADER}{"".join(rows)}</table></body></html>')
+
+
+class EngineParityTest(unittest.TestCase):
+    def setUp(self):
+        folder = tempfile.TemporaryDirectory()
+        self.addCleanup(folder.cleanup)
+        self.path = os.path.join(folder.name, 'aps.html')
+
+    def write_log(self, rows, encoding):
+        with open(self.path, 'w', encoding=encoding) as file:
+            file.write(make_log(rows))
+
+    def test_engines_agree(self):
+        for encoding in ('utf-8', 'utf-16'):
+            for row in ROWS:
+                with self.subTest(encoding=encoding, row=row):
+                    self.write_log([row], encoding)
+                    result = ApsLogHtml.compare_with_bs4(self.path)
+                    self.assertEqual(result['mismatches'], [])
+                    self.assertEqual(result['stream_rows'], 1)
+
+    def test_cells_are_read_like_a_browser(self):
+        self.write_log(ROWS, 'utf-16')
+        rows = [(row['Line'], row['Time'], row['User'], row['PID'], row['Session'], row['Description'])
+                for row in ApsLogHtml.iter_log_entries(self.path, 'aps.html')]
+        self.assertEqual(rows, [('1', '10:00:00', 'bob', '1234', '2', 'Logged on'),
+                                ('2', '10:00:01', '', '', '', 'a <b> & "c" \xe9\xa0d'),
+                                ('3', '10:00:02', '', '', '', 'Quoted'),
+                                ('4', '10:00:03', '', '', '', 'Unclosed')])
+
+
+if __name__ == '__main__':
+    unittest.main()
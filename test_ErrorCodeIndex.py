@@ -0,0 +1,28 @@
+import unittest
+
+import pandas as pd
+
+import ErrorCodeIndex
+
+
+def make_table():
+    return ErrorCodeIndex.parse_error_codes("5 = Access is denied.\n6 = The handle is invalid.\n-1 = Unknown.\n")
+
+
+class ErrorMeaningsTest(unittest.TestCase):
+    def test_codes_are_looked_up(self):
+        meanings = ErrorCodeIndex.error_meanings(['Error 5: failed', 'error code 0x6', 'no code here', None], make_table())
+        self.assertEqual(meanings.tolist(), ['5: Access is denied.', '6: The handle is invalid.', '', ''])
+
+    def test_codes_wider_than_int64_are_skipped(self):
+        meanings = ErrorCodeIndex.error_meanings(
+            ['error 5 x', 'error 0xFFFFFFFFFFFFFFFFFF', 'error 99999999999999999999999 then error 6'], make_table())
+        self.assertEqual(meanings.tolist(), ['5: Access is denied.', '', '6: The handle is invalid.'])
+
+    def test_index_is_kept(self):
+        descriptions = pd.Series(['error 6'], index=[42])
+        self.assertEqual(ErrorCodeIndex.error_meanings(descriptions, make_table()).index.tolist(), [42])
+
+
+if __name__ == '__main__':
+    unittest.main()
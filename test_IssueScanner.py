@@ -0,0 +1,30 @@
+import unittest
+
+from IssueScanner import IssueScanner
+
+
+def rule(name, pattern, regex=True):
+    return {'name': name, 'issue_type': 'Test', 'pattern': pattern, 'regex': regex}
+
+
+class IssueScannerTest(unittest.TestCase):
+    def test_rules_with_global_flags_or_backreferences(self):
+        rules = [rule('multiline', r'(?m)^lost|^dropped'), rule('repeat', r'(\d)\1{3}'),
+                 rule('either', r'^foo|bar$'), rule('plain', 'access denied', regex=False)]
+        scanner = IssueScanner(rules)
+        matches = {text: [rules[i]['name'] for i in scanner.match(text)]
+                   for text in ('Dropped link', 'code 7777', 'ends bar', 'Access Denied', 'code 7778')}
+        self.assertEqual(matches, {'Dropped link': ['multiline'], 'code 7777': ['repeat'], 'ends bar': ['either'],
+                                   'Access Denied': ['plain'], 'code 7778': []})
+
+    def test_named_groups_repeated_across_rules(self):
+        rules = [rule('q', r'(?P<x>q+)z'), rule('w', r'(?P<x>w+)y')]
+        codes, matched = IssueScanner(rules).match_codes(['qqz', 'wwy', 'none'])
+        self.assertEqual(matched, {0: [0], 1: [1]})
+
+    def test_built_in_rules_compile(self):
+        IssueScanner()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+
+import pandas as pd
+
+import LogQuery
+from SearchIndex import SearchIndex
+
+
+def make_index():
+    frame = pd.DataFrame({
+        'User': pd.Categorical(['bob', 'alice', 'bob', '']),
+        'PID': pd.array([1234, 1234, 99, None], dtype='Int64'),
+        'Description': ['Connection timeout', 'Logged on', 'Connection refused', 'Stopped'],
+        'DateTime': pd.to_datetime(['2024-05-01 10:00:30', '2024-05-01 10:07:00',
+                                    '2024-05-02 23:45:00', '2024-05-03 00:15:00']),
+    })
+    return SearchIndex(frame, ['User', 'PID', 'Description'])
+
+
+class QueryMaskTest(unittest.TestCase):
+    def setUp(self):
+        self.index = make_index()
+
+    def rows(self, text):
+        return LogQuery.query_mask(text, self.index).nonzero()[0].tolist()
+
+    def test_terms_are_anded(self):
+        self.assertEqual(self.rows('user:bob pid:1234 time:[10:00..10:05] desc:/timeout|refused/'), [0])
+
+    def test_time_of_day_range_wraps_past_midnight(self):
+        self.assertEqual(self.rows('time:[23:30..00:30]'), [2, 3])
+
+    def test_date_range_with_one_bound(self):
+        self.assertEqual(self.rows('date:[2024-05-02..]'), [2, 3])
+
+    def test_exact_and_negated_terms(self):
+        self.assertEqual(self.rows('-user:=bob'), [1, 3])
+
+    def test_range_without_bounds_is_a_query_error(self):
+        for text in ('time:[..]', 'date:[ .. ]', 'pid:[..]'):
+            with self.subTest(text=text):
+                with self.assertRaises(LogQuery.QueryError):
+                    LogQuery.query_mask(text, self.index)
+
+    def test_malformed_queries_are_query_errors(self):
+        for text in ('foo:bar', 'desc:/abc', 'time:[10:00', 'pid:abc', 'time:25:00', 'desc:/(/'):
+            with self.subTest(text=text):
+                with self.assertRaises(LogQuery.QueryError):
+                    LogQuery.query_mask(text, self.index)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,22 @@
+import tempfile
+import unittest
+
+import ParserEquivalence
+
+
+class ParserEquivalenceTest(unittest.TestCase):
+    def test_normalize_keeps_types(self):
+        record = {'Line': 12, 'PID': 4, 'Session': None, 'Description': 'x'}
+        self.assertNotEqual(ParserEquivalence.normalize(record),
+                            ParserEquivalence.normalize({**record, 'Line': '12'}))
+        self.assertNotEqual(ParserEquivalence.normalize(record),
+                            ParserEquivalence.normalize({**record, 'Session': ''}))
+
+    def test_parsers_agree_on_a_small_corpus(self):
+        with tempfile.TemporaryDirectory() as data_dir:
+            failures = ParserEquivalence.check([0.2], list(ParserEquivalence.PARSERS), data_dir)
+        self.assertEqual(failures, [])
+
+
+if __name__ == '__main__':
+    unittest.main()